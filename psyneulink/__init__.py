@@ -20,9 +20,18 @@ please contact psyneulinkhelp@princeton.edu.
 """
 
 import logging as _logging
+import os as _os
 
 import numpy as _numpy
 import pint as _pint
+import typecheck as _tc
+
+# runtime checks (see psyneulink.core.globals.utilities.set_runtime_checks) are disabled if the PNL_RUNTIME_CHECKS
+# environment variable is set to 0 (or false or off).  This has to come before imports, as the typecheck decorators
+# of psyneulink's methods are then no-ops only if checking is disabled when they are applied
+_runtime_checks = _os.environ.get('PNL_RUNTIME_CHECKS', '1').lower() not in {'0', 'false', 'off'}
+if not _runtime_checks:
+    _tc.disable()
 
 # pint requires a package-specific unit registry, and to use it as
 # needed in psyneulink, it has to come before imports. This is the
@@ -50,6 +59,14 @@ __all__ = list(_pnl_global_names)
 __all__.extend(core.__all__)
 __all__.extend(library.__all__)
 
+
+def __getattr__(name):
+    # attributes of psyneulink.core that are imported when first accessed (see psyneulink.core.rpc)
+    if name in core.rpc._lazy_attributes:
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # set __version__ based on versioneer
 __version__ = get_versions()['version']
 del get_versions
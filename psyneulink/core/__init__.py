@@ -18,3 +18,10 @@ __all__.extend(compositions.__all__)
 __all__.extend(globals.__all__)
 __all__.extend(scheduling.__all__)
 __all__.extend(rpc.__all__)
+
+
+def __getattr__(name):
+    # attributes of subpackages that are imported when first accessed
+    if name in rpc._lazy_attributes:
+        return getattr(rpc, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
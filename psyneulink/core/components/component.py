@@ -534,7 +534,8 @@ from psyneulink.core.globals.sampleiterator import SampleIterator
 from psyneulink.core.globals.utilities import \
     ContentAddressableList, convert_all_elements_to_np_array, convert_to_np_array, get_deepcopy_with_shared, \
     is_instance_or_subclass, is_matrix, iscompatible, kwCompatibilityLength, prune_unused_args, \
-    get_all_explicit_arguments, call_with_pruned_args, safe_equals, safe_len, parse_valid_identifier
+    get_all_explicit_arguments, call_with_pruned_args, runtime_checks_enabled, safe_equals, safe_len, \
+    parse_valid_identifier, _picklable_function, _unpickled_function
 from psyneulink.core.scheduling.condition import Never
 from psyneulink.core.scheduling.time import Time, TimeScale
 
@@ -1311,6 +1312,17 @@ class Component(MDFSerializable, metaclass=ComponentsMeta):
 
         return newone
 
+    # attributes that are only used during construction, that cache the structures of compiled code, or that hold
+    # other process-specific objects, and so are not pickled
+    _unpickled_attrs = frozenset({'_prev_constructor', '_prev_kwargs', '_param_ids', '_state_ids'})
+
+    def __getstate__(self):
+        # functions specified by the user, which may be lambdas, are held directly or in the arguments of constructors
+        return {k: _picklable_function(v) for k, v in self.__dict__.items() if k not in self._unpickled_attrs}
+
+    def __setstate__(self, state):
+        self.__dict__.update({k: _unpickled_function(v) for k, v in state.items()})
+
     # ------------------------------------------------------------------------------------------------------------------
     # Compilation support
     # ------------------------------------------------------------------------------------------------------------------
@@ -1837,8 +1849,9 @@ class Component(MDFSerializable, metaclass=ComponentsMeta):
         if callable(variable):
             variable = variable()
 
-        # Validate variable if parameter_validation is set and the function was called with a variable
-        if self.prefs.paramValidationPref and variable is not None:
+        # Validate variable if runtime checks are enabled, parameter_validation is set and the function was called
+        #     with a variable
+        if variable is not None and runtime_checks_enabled() and self.prefs.paramValidationPref:
             variable = self._validate_variable(variable, context=context)
 
         # PARAMS ------------------------------------------------------------
@@ -78,6 +78,24 @@ def _num_estimates_getter(owning_component, context):
         return owning_component.parameters.search_space._get(context)[owning_component.randomization_dimension].num
 
 
+# default functions of OptimizationFunction (defined at module level, rather than as lambdas, so that they can be
+# pickled)
+def _objective_function(x):
+    return 0.0
+
+
+def _aggregation_function(x):
+    return np.mean(x, axis=1)
+
+
+def _search_function(x):
+    return x
+
+
+def _search_termination_function(x, y, z):
+    return True
+
+
 class OptimizationFunction(Function_Base):
     """
     OptimizationFunction(                            \
@@ -385,10 +403,10 @@ class OptimizationFunction(Function_Base):
         """
         variable = Parameter(np.array([0.0, 0.0, 0.0]), read_only=True, pnl_internal=True, constructor_argument='default_variable')
 
-        objective_function = Parameter(lambda x: 0.0, stateful=False, loggable=False)
-        aggregation_function = Parameter(lambda x: np.mean(x, axis=1), stateful=False, loggable=False)
-        search_function = Parameter(lambda x: x, stateful=False, loggable=False)
-        search_termination_function = Parameter(lambda x, y, z: True, stateful=False, loggable=False)
+        objective_function = Parameter(_objective_function, stateful=False, loggable=False)
+        aggregation_function = Parameter(_aggregation_function, stateful=False, loggable=False)
+        search_function = Parameter(_search_function, stateful=False, loggable=False)
+        search_termination_function = Parameter(_search_termination_function, stateful=False, loggable=False)
         search_space = Parameter([SampleIterator([0])], stateful=False, loggable=False)
         randomization_dimension = Parameter(None, stateful=False, loggable=False)
         num_estimates = Parameter(None, stateful=True, loggable=True, read_only=True,
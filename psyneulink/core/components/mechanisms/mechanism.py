@@ -1114,7 +1114,7 @@ from psyneulink.core.globals.preferences.preferenceset import PreferenceLevel
 from psyneulink.core.globals.registry import register_category, remove_instance_from_registry
 from psyneulink.core.globals.utilities import \
     ContentAddressableList, append_type_to_name, convert_all_elements_to_np_array, convert_to_np_array, \
-    iscompatible, kwCompatibilityNumeric, convert_to_list, parse_valid_identifier
+    iscompatible, kwCompatibilityNumeric, convert_to_list, parse_valid_identifier, runtime_checks_enabled
 from psyneulink.core.scheduling.condition import Condition
 from psyneulink.core.scheduling.time import TimeScale
 
@@ -2711,7 +2711,7 @@ class Mechanism_Base(Mechanism):
             value used to initialize the first item of the Mechanism's `value <Mechanism_Base.value>` attribute.
 
         """
-        if self.paramValidationPref:
+        if runtime_checks_enabled() and self.paramValidationPref:
             if not iscompatible(value, self.defaults.value):
                 raise MechanismError("Initialization value ({}) is not compatiable with value of {}".
                                      format(value, append_type_to_name(self)))
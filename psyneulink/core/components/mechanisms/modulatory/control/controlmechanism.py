@@ -727,6 +727,10 @@ def _net_outcome_getter(owning_component=None, context=None):
         return [0]
 
 
+def _compute_net_outcome(outcome, cost):
+    return outcome - cost
+
+
 class ControlMechanism(ModulatoryMechanism_Base):
     """
     ControlMechanism(                        \
@@ -985,6 +989,9 @@ class ControlMechanism(ModulatoryMechanism_Base):
     portListAttr = Mechanism_Base.portListAttr.copy()
     portListAttr.update({ControlSignal:CONTROL_SIGNALS})
 
+    # the lock for simulation counts is created again when needed
+    _unpickled_attrs = ModulatoryMechanism_Base._unpickled_attrs | {'_ControlMechanism__sim_count_lock'}
+
     classPreferenceLevel = PreferenceLevel.TYPE
     # Any preferences specified below will override those specified in TYPE_DEFAULT_PREFERENCES
     # Note: only need to specify setting;  level will be assigned to TYPE automatically
@@ -1125,7 +1132,7 @@ class ControlMechanism(ModulatoryMechanism_Base):
         compute_reconfiguration_cost = Parameter(None, stateful=False, loggable=False)
         reconfiguration_cost = Parameter(None, read_only=True)
         outcome = Parameter(None, read_only=True, getter=_outcome_getter, pnl_internal=True)
-        compute_net_outcome = Parameter(lambda outcome, cost: outcome - cost, stateful=False, loggable=False)
+        compute_net_outcome = Parameter(_compute_net_outcome, stateful=False, loggable=False)
         net_outcome = Parameter(
             None,
             read_only=True,
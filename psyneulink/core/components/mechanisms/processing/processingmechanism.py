@@ -113,6 +113,31 @@ class ProcessingMechanismError(Exception):
         self.error_value = error_value
 
 
+# functions of standard_output_ports (defined at module level, rather than as lambdas, so that they can be pickled)
+def _mean(x):
+    return np.mean(x)
+
+
+def _median(x):
+    return np.median(x)
+
+
+def _standard_deviation(x):
+    return np.std(x)
+
+
+def _variance(x):
+    return np.var(x)
+
+
+def _max_val(x):
+    return np.max(x)
+
+
+def _max_abs_val(x):
+    return np.max(np.absolute(x))
+
+
 # # These are defined here because STANDARD_DEVIATION AND VARIANCE
 # #    are already defined in Keywords in lower case (used as arg for Functions).
 # STD_DEV_OUTPUT_PORT_NAME = 'STANDARD_DEVIATION'
@@ -146,17 +171,17 @@ class ProcessingMechanism_Base(Mechanism_Base):
 
     standard_output_ports = Mechanism_Base.standard_output_ports.copy()
     standard_output_ports.extend([{NAME:MEAN,
-                                   FUNCTION:lambda x: np.mean(x)},
+                                   FUNCTION:_mean},
                                   {NAME: MEDIAN,
-                                   FUNCTION:lambda x: np.median(x)},
+                                   FUNCTION:_median},
                                   {NAME: STANDARD_DEVIATION,
-                                   FUNCTION:lambda x: np.std(x)},
+                                   FUNCTION:_standard_deviation},
                                   {NAME: VARIANCE,
-                                   FUNCTION:lambda x: np.var(x)},
+                                   FUNCTION:_variance},
                                   {NAME: MAX_VAL,
-                                   FUNCTION:lambda x: np.max(x)},
+                                   FUNCTION:_max_val},
                                   {NAME: MAX_ABS_VAL,
-                                   FUNCTION:lambda x: np.max(np.absolute(x))},
+                                   FUNCTION:_max_abs_val},
                                   {NAME: MAX_ONE_HOT,
                                    FUNCTION: OneHot(mode=MAX_VAL)},
                                   {NAME: MAX_ABS_ONE_HOT,
@@ -489,6 +489,7 @@ class ParameterPortList(ContentAddressableList):
             del self.parameter_mapping[m]
 
         del self.data[self.data.index(main_port)]
+        self._key_indices = None
 
     def _get_possible_port_names(self, param_name):
         """
@@ -728,6 +729,9 @@ class ParameterPort(Port_Base):
 
         self.reference_value = reference_value
 
+        # value of source Parameter, for each execution_id, when the ParameterPort was last updated (see _update)
+        self._source_values = {}
+
         # Validate sender (as variable) and params
         # Note: pass name of Mechanism (to override assignment of componentName in super.__init__)
         super(ParameterPort, self).__init__(owner,
@@ -972,6 +976,38 @@ class ParameterPort(Port_Base):
         # FIX 3/6/19: source does not yet seem to have been assigned to owner.function
         return self.source._get(context)
 
+    def _update(self, params=None, context=None):
+        """Update the ParameterPort, unless doing so would not change its value
+
+        If the ParameterPort has no `mod_afferents <ParameterPort.mod_afferents>`, and its `function
+        <ParameterPort.function>` is the identity, its `value <ParameterPort.value>` is just that of its source
+        Parameter;  so, unless the ParameterPort's value is being logged or delivered, the update can be skipped
+        if the source Parameter has not been assigned a new value since the last update in the same context.
+        """
+        execution_id = context.execution_id
+        source_value = self.source._get(context)
+
+        if (
+            not params
+            and len(self.mod_afferents) == 0
+            and execution_id in self._source_values
+            and self._source_values[execution_id] is source_value
+            and not self.parameters.value.log_condition
+            and not self.parameters.value.delivery_condition
+            and self.function._is_identity(context)
+        ):
+            self.most_recent_context = context
+            self.function.most_recent_context = context
+            return
+
+        super()._update(params=params, context=context)
+        self._source_values[execution_id] = source_value
+
+    def _delete_contexts(self, *contexts, check_simulation_storage=False, visited=None):
+        super()._delete_contexts(*contexts, check_simulation_storage=check_simulation_storage, visited=visited)
+        for context in contexts:
+            self._source_values.pop(getattr(context, 'execution_id', context), None)
+
     def get_label(self, context=None):
         raise ParameterPortError(f"{ParameterPort.__name__}s do not have labels.")
 
@@ -804,7 +804,7 @@ from psyneulink.core.globals.registry import register_category
 from psyneulink.core.globals.socket import ConnectionInfo
 from psyneulink.core.globals.utilities import \
     ContentAddressableList, convert_to_np_array, get_args, is_value_spec, iscompatible, \
-    MODULATION_OVERRIDE, type_match
+    MODULATION_OVERRIDE, runtime_checks_enabled, type_match
 
 __all__ = [
     'Port_Base', 'port_keywords', 'port_type_keywords', 'PortError', 'PortRegistry', 'PORT_SPEC'
@@ -2076,9 +2076,9 @@ class Port_Base(Port):
                 if mod_spec == DISABLE:
                     continue
                 if mod_spec == OVERRIDE:
-                    # If paramValidationPref is set, allow all projections to be processed
-                    #    to be sure there are no other conflicting OVERRIDES assigned
-                    if self.owner.paramValidationPref:
+                    # If runtime checks are enabled and paramValidationPref is set, allow all projections to be
+                    #    processed to be sure there are no other conflicting OVERRIDES assigned
+                    if runtime_checks_enabled() and self.owner.paramValidationPref:
                         if modulatory_override:
                             raise PortError(f"Illegal assignment of {MODULATION_OVERRIDE} to more than one "
                                              f"{MODULATORY_SIGNAL} ({projection.name} and {modulatory_override[2]}).")
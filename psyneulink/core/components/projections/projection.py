@@ -1270,6 +1270,12 @@ def _is_projection_subclass(spec, keyword):
             return True
     return False
 
+def _no_projection_spec():
+    # default of the specification dictionaries returned by _parse_projection_spec, which are held by the Components
+    #   they specify, and so must be picklable
+    return None
+
+
 def _parse_projection_spec(projection_spec,
                            owner = None,       # Used only for error message
                            port_type = None,  # Used only for default assignment
@@ -1287,7 +1293,7 @@ def _parse_projection_spec(projection_spec,
     if bad_arg:
         raise ProjectionError("Illegal argument in call to _parse_port_spec: {}".format(bad_arg))
 
-    proj_spec_dict = defaultdict(lambda :None)
+    proj_spec_dict = defaultdict(_no_projection_spec)
     proj_spec_dict.update(kwargs)
 
     # Projection object
@@ -10,6 +10,7 @@ from .compositionfunctionapproximator import *
 from .parameterestimationcomposition import *
 from .showgraph import *
 from .report import *
+from .results import *
 
 __all__ = list(composition.__all__)
 __all__.extend(pathway.__all__)
@@ -17,3 +18,4 @@ __all__.extend(compositionfunctionapproximator.__all__)
 __all__.extend(parameterestimationcomposition.__all__)
 __all__.extend(showgraph.__all__)
 __all__.extend(report.__all__)
+__all__.extend(results.__all__)
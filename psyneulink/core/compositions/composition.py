@@ -54,7 +54,11 @@ Contents
         • `Composition_Execution_Context`
         • `Composition_Timing`
         • `Composition_Reset`
+        • `Composition_Saving_State`
         • `Composition_Compilation`
+        • `Composition_Parallel_Execution`
+        • `Composition_Parallel_Contexts`
+        • `Composition_Cloning`
      - `Results, Reporting and Logging <Composition_Execution_Results_and_Reporting>`
   * `Composition_Visualization`
   * `Composition_Examples`
@@ -234,6 +238,21 @@ These methods can be used to add `Pathways <Composition_Pathways>` to an existin
 
 A `Node <Composition_Nodes>` can be removed from a Composition using the `remove_node <Composition.remove_node>` method.
 
+.. _Composition_Batch_Construction:
+
+Each time a `Pathway <Composition_Pathways>` is added to a Composition or a Node is removed from it, the Composition's
+`graph <Composition_Graph>` is analyzed to assign `NodeRoles <NodeRole>` and construct the Ports and Projections of
+its `CompositionInterfaceMechanisms <Composition_CIMs>`.  When a large Composition is constructed programmatically,
+this can be deferred by adding its Pathways within the `batch_construction <Composition.batch_construction>` context
+manager, in which case the analysis is carried out once, on leaving that block::
+
+    with comp.batch_construction():
+        for pathway in pathways:
+            comp.add_linear_processing_pathway(pathway)
+
+This is done automatically for the Pathways specified in the **pathways** argument of the Composition's constructor
+or of its `add_pathways <Composition.add_pathways>` method.
+
 
 .. _Composition_Add_Nested:
 
@@ -1025,7 +1044,11 @@ Executing a Composition
         • `Composition_Execution_Context`
         • `Composition_Timing`
         • `Composition_Reset`
+        • `Composition_Saving_State`
         • `Composition_Compilation`
+        • `Composition_Parallel_Execution`
+        • `Composition_Parallel_Contexts`
+        • `Composition_Cloning`
     - `Results, Reporting and Logging <Composition_Execution_Results_and_Reporting>`
 
 
@@ -1306,6 +1329,20 @@ However, such labels are specific to a given Mechanism;  use of strings as input
 `input_labels_dict <Mechanism_Base.input_labels_dict>` specified, or use of a string that is not listed in the
 dictionary for that Mechanism generates and error.
 
+.. _Composition_Input_Datasets:
+
+*Datasets*. The value of a `Node entry <Composition_Input_Dictionary_Node_Entries>` can also be a *dataset*:  an
+np.memmap (for example, one returned by ``np.load(path, mmap_mode='r')``), or any other object that has a length
+(the number of `TRIAL <TimeScale.TRIAL>`\s of input it contains) and returns the input to the Node for a single `TRIAL
+<TimeScale.TRIAL>` when it is indexed by the number of that trial (as, for example, a PyTorch ``Dataset``).  The input
+for each `TRIAL <TimeScale.TRIAL>` is retrieved from the dataset (and validated) only when that trial is executed, so
+that a set of stimuli too large to be held in memory can be used as input to the `run <Composition.run>` and `learn
+<Composition.learn>` methods, without being loaded into memory in its entirety.  The input for each trial must be
+numeric, with the same format as the items of the outermost dimension of an array specifying the input for every
+trial (see `above <Composition_Input_Dictionary_Input_Values>`).  Datasets can only be used for the `INPUT
+<NodeRole.INPUT>` Nodes of the Composition itself (including `TARGET_MECHANISM <Composition_Learning_Components>`\s),
+and not for InputPorts or Nodes of nested Compositions.
+
 .. _Composition_Target_Inputs:
 
 *Target Inputs for learning*. Inputs must also be specified for the `TARGET_MECHANISM <Composition_Learning_Components>`
@@ -1434,6 +1471,17 @@ Complete input specification:
 
 ..
 
+.. _Composition_Prefetch_Inputs:
+
+If producing each trial's input is costly (for example, if the generator reads stimuli from disk or preprocesses
+them), the **prefetch_inputs** argument of the Composition's `run <Composition.run>` method can be used to produce
+them on a background thread, so that this overlaps with the execution of the Composition.  It specifies how many
+trials' inputs are retrieved from the generator (and parsed) ahead of the trial being executed.  The generator is
+therefore advanced beyond the last trial executed if the run ends before the generator is exhausted (e.g., because
+**num_trials** has been reached);  the inputs retrieved in advance are discarded.  An exception raised by the generator
+is raised by `run <Composition.run>` when the Composition reaches the trial for which it was retrieving the input.
+
+
 COMMENT:
 The script below, for example, uses a function to specify inputs in order to interact with the Gym Forarger
 Environment.
@@ -1477,7 +1525,11 @@ COMMENT
   • `Composition_Execution_Context`
   • `Composition_Timing`
   • `Composition_Reset`
+  • `Composition_Saving_State`
   • `Composition_Compilation`
+  • `Composition_Parallel_Execution`
+  • `Composition_Parallel_Contexts`
+  • `Composition_Cloning`
 
 .. _Composition_Runtime_Params:
 
@@ -1843,6 +1895,31 @@ or in arguments to its `run <Composition.run>` and `learn <Composition.learn>` m
      parameter will be used.
 
 
+.. _Composition_Saving_State:
+
+*Saving and Restoring State*
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+The state of a Composition in a given `execution context <Composition_Execution_Context>` can be saved to disk using
+its `save_state <Composition.save_state>` method, and restored using its `load_state <Composition.load_state>` method,
+for example to checkpoint a long run and resume it later or in another process.  The state saved includes the current
+`values <Parameter.values>` and `history <Parameter.history>` of the `stateful parameters
+<Component_Stateful_Parameters>` of all of the Composition's Components (including the `previous_value
+<StatefulFunction.previous_value>` of `StatefulFunctions <StatefulFunction>` and the random number generators used by
+stochastic Functions), and the `Clock <Scheduler_Clock>` and execution counts of its `scheduler
+<Composition.scheduler>` and those of any nested Compositions.  It does not include the structure of the Composition:
+the state is restored into the existing Components of a Composition with the same structure (identified by the names
+of its Nodes, Projections and Ports), which need not be re-instantiated.  If **path** ends with ``.npz``, the state is
+stored in a single uncompressed numpy archive;  otherwise, it is stored as a directory of ``.npy`` files that are
+memory-mapped when loaded, so that large states are read only as needed.  For example::
+
+    comp.run(inputs=inputs, num_trials=100)
+    comp.save_state('checkpoint.npz')
+    ...
+    comp.load_state('checkpoint.npz')
+    comp.run(inputs=inputs, num_trials=100)  # continues as if uninterrupted
+
+
 .. _Composition_Compilation:
 
 *Compilation*
@@ -1916,6 +1993,71 @@ GPU thread, and therefore does not produce any performance benefits over running
 `this <https://github.com/PrincetonUniversity/PsyNeuLink/projects/1>`_ for progress extending support of parallization
 in compiled modes).
 
+.. _Composition_Parallel_Execution:
+
+*Parallel execution of Nodes*
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Each `TIME_STEP` of a Composition's execution executes a set of Nodes (an *execution set*) specified by its
+`scheduler <Composition.scheduler>`, that is, by default, executed one at a time.  If the Composition's
+`max_node_workers <Composition.max_node_workers>` attribute is specified, then the Nodes of an execution set that do
+not project to one another are instead executed concurrently, on a pool of (at most) that number of threads.  This
+can reduce the time taken to execute a Composition in which Nodes that execute in the same `TIME_STEP` spend most of
+their time in operations that release Python's global interpreter lock (for example, the matrix operations of large
+`MappingProjections <MappingProjection>`, or `nested Compositions <Composition_Nested>` that include these).  Each
+Node is executed with its own copy of the `execution context <Composition_Execution_Context>`, and the Nodes are
+completed in the same order as they would have been executed otherwise, so the results are the same as for serial
+execution.  The Nodes of an execution set are executed one at a time, irrespective of `max_node_workers
+<Composition.max_node_workers>`, if any of them projects to another one in the set (or itself), if the Composition is
+executed in a `compiled mode <Composition_Compilation>`, if `reporting <Composition_Execution_Reporting>` or
+**animate** is specified for the execution, if values are being delivered to an external client (see
+`set_delivery_conditions <Component.set_delivery_conditions>`), or if two or more of them (or their functions) share
+the same `random_state`.
+
+.. _Composition_Parallel_Contexts:
+
+*Parallel execution of contexts*
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+A Composition can be run in several `execution contexts <Composition_Execution_Context>` at once -- for example, for
+different subjects or seeds -- using its `run_parallel <Composition.run_parallel>` method, which is passed a dictionary
+of the inputs for each context.  Each context is run (using `run <Composition.run>`) in one of a pool of worker
+processes, each of which receives a copy of the Composition once, when it is started.  When the run for a context
+is complete, its `results <Composition.results>`, the values (and `history <Parameter.history>`) of all of the
+Composition's stateful `Parameters`, its `logs <Log>` and the state of its `scheduler <Composition.scheduler>` in that
+context are assigned to the Composition in the calling process, so that these are the same as if the contexts had been
+run there one after the other.  As for `run <Composition.run>`, the contexts can be run in a `compiled mode
+<Composition_Compilation>`, in which case each worker compiles the Composition the first time it is run there;  the
+values of Parameters that are updated only by compiled code (other than those modified by `learning
+<Composition_Learning>`) are not returned, as they are not when the Composition is run in a compiled mode in the
+calling process.  Worker processes are created by forking the calling process where this is supported;  otherwise (or
+if another **start_method** is specified), the Composition is pickled and sent to each worker, in which case any
+functions used by it that are defined in a script must also be defined when that script is imported by the worker.
+
+A Composition (or any of its `Components <Component>`) can also be pickled directly -- for example, to send it to the
+workers of a ``concurrent.futures.ProcessPoolExecutor``.  The copy holds the values of all of its `Parameters` in
+every context, and so continues from the state of the original;  compiled code is not pickled, and is compiled again
+the first time the copy is run in a `compiled mode <Composition_Compilation>`.
+
+.. _Composition_Cloning:
+
+*Cloning*
+^^^^^^^^^
+
+A copy of a Composition that can be run independently of it -- for example, one for each worker of a pool or each
+setting of a parameter sweep -- can be made using its `clone <Composition.clone>` method.  By default, this returns a
+`CompositionClone`, which shares all of the structure of the Composition (its `Nodes <Composition_Nodes>`, `Projections
+<Projection>`, `Functions <Function>` and any compiled code), and holds only its own copy of the values of their
+stateful `Parameters`, in a new `execution context <Composition_Execution_Context>` that is initialized from the
+Composition's `most_recent_context <Component.most_recent_context>` (or the one specified in the call to `clone
+<Composition.clone>`).  Its `run <CompositionClone.run>`, `learn <CompositionClone.learn>`, `execute
+<CompositionClone.execute>` and `reset <CompositionClone.reset>` methods are those of the Composition executed in that
+context, and the value of a Parameter for the CompositionClone can be assigned using the Parameter's `set
+<Parameter.set>` method with the CompositionClone's `context <CompositionClone.context>`.  Making a CompositionClone
+is much faster than copying the Composition, but changes to the structure of the Composition (such as adding a Node)
+also apply to its CompositionClones.  If **share_structure** is False, `clone <Composition.clone>` instead returns
+a full, independent copy of the Composition, made by pickling it (see above).
+
 
 .. _Composition_Execution_Results_and_Reporting:
 
@@ -2712,13 +2854,20 @@ Class Reference
 """
 
 import collections
+import concurrent.futures
+import contextlib
 import enum
 import functools
 import inspect
 import itertools
+import json
 import logging
+import multiprocessing
+import os
+import pickle
 import sys
 import typing
+import uuid
 import warnings
 from copy import deepcopy, copy
 from inspect import isgenerator, isgeneratorfunction
@@ -2733,7 +2882,6 @@ from PIL import Image
 
 from psyneulink.core import llvm as pnlvm
 from psyneulink.core.components.component import Component, ComponentsMeta
-from psyneulink.core.components.functions.fitfunctions import make_likelihood_function
 from psyneulink.core.components.functions.function import is_function_type
 from psyneulink.core.components.functions.nonstateful.combinationfunctions import LinearCombination, \
     PredictionErrorDeltaFunction
@@ -2767,6 +2915,8 @@ from psyneulink.core.components.shellclasses import Mechanism, Projection
 from psyneulink.core.compositions.report import Report, \
     ReportOutput, ReportParams, ReportProgress, ReportSimulations, ReportDevices, \
     EXECUTE_REPORT, CONTROLLER_REPORT, RUN_REPORT, PROGRESS_REPORT
+from psyneulink.core.compositions import parallel
+from psyneulink.core.compositions.results import ResultsStore
 from psyneulink.core.compositions.showgraph import ShowGraph, INITIAL_FRAME, SHOW_CIM, EXECUTION_SET, SHOW_CONTROLLER
 from psyneulink.core.globals.context import Context, ContextFlags, handle_external_context
 from psyneulink.core.globals.keywords import \
@@ -2782,15 +2932,18 @@ from psyneulink.core.globals.keywords import \
     SAMPLE, SENDER, SHADOW_INPUTS, SOFT_CLAMP, SSE, \
     TARGET, TARGET_MECHANISM, TEXT, VARIABLE, WEIGHT, OWNER_MECH
 from psyneulink.core.globals.log import CompositionLog, LogCondition
-from psyneulink.core.globals.parameters import Parameter, ParametersBase, check_user_specified
+from psyneulink.core.globals.parameters import \
+    Parameter, ParameterAlias, ParametersBase, SharedParameter, check_user_specified
 from psyneulink.core.globals.preferences.basepreferenceset import BasePreferenceSet
 from psyneulink.core.globals.preferences.preferenceset import PreferenceLevel, _assign_prefs
 from psyneulink.core.globals.registry import register_category
 from psyneulink.core.globals.utilities import ContentAddressableList, call_with_pruned_args, convert_to_list, \
-    nesting_depth, convert_to_np_array, is_numeric, is_matrix, parse_valid_identifier
+    nesting_depth, convert_to_np_array, is_numeric, is_matrix, parse_valid_identifier, PrefetchIterator, \
+    SeededRandomState, _SeededPhilox
+from psyneulink.core.rpc.delivery import BatchedDeliveryPipeline
 from psyneulink.core.scheduling.condition import All, AllHaveRun, Always, Any, Condition, Never
 from psyneulink.core.scheduling.scheduler import Scheduler, SchedulingMode
-from psyneulink.core.scheduling.time import Time, TimeScale
+from psyneulink.core.scheduling.time import Clock, Time, TimeScale
 from psyneulink.library.components.mechanisms.modulatory.learning.autoassociativelearningmechanism import \
     AutoAssociativeLearningMechanism
 from psyneulink.library.components.mechanisms.processing.objective.comparatormechanism import ComparatorMechanism, MSE
@@ -2801,7 +2954,8 @@ from psyneulink.library.components.mechanisms.processing.transfer.recurrenttrans
 from psyneulink.library.components.projections.pathway.autoassociativeprojection import AutoAssociativeProjection
 
 __all__ = [
-    'Composition', 'CompositionError', 'CompositionRegistry', 'EdgeType', 'get_compositions', 'NodeRole'
+    'Composition', 'CompositionClone', 'CompositionError', 'CompositionRegistry', 'EdgeType', 'get_compositions',
+    'NodeRole'
     ]
 
 logger = logging.getLogger(__name__)
@@ -2828,6 +2982,286 @@ class RunError(Exception):
         return repr(self.error_value)
 
 
+# State checkpointing (see Composition.save_state and Composition.load_state) ------------------------------------------
+
+_STATE_FORMAT_VERSION = 1
+_STATE_MANIFEST = '__manifest__'
+_STATE_MANIFEST_FILE = 'manifest.json'
+_STATE_SEQUENCE_TYPES = {list: 'list', tuple: 'tuple', collections.deque: 'deque'}
+_STATE_PYTHON_SCALAR_TYPES = {'bool': bool, 'int': int, 'float': float, 'complex': complex}
+
+
+def _get_state_signature(value):
+    """Return a JSON-serializable description of the structure of **value**, or None if it cannot be stored as
+    numeric arrays.  Values with identical signatures can be stacked into the same set of contiguous arrays.
+    """
+    if value is None:
+        return ['none']
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind in 'biufc':
+            return ['ndarray', list(value.shape), value.dtype.str]
+        if value.dtype == object:
+            items = _get_state_signature(list(value.flat))
+            return None if items is None else ['objarray', list(value.shape), items]
+        return None
+    if isinstance(value, np.generic):
+        return ['npscalar', value.dtype.str] if value.dtype.kind in 'biufc' else None
+    if type(value) in _STATE_PYTHON_SCALAR_TYPES.values():
+        return ['scalar', type(value).__name__]
+    if isinstance(value, Time):
+        return ['time']
+    if isinstance(value, ResultsStore):
+        items = _get_state_signature(list(value))
+        return None if items is None else ['results', value.limit, items]
+    if type(value) in _STATE_SEQUENCE_TYPES:
+        seq_type = _STATE_SEQUENCE_TYPES[type(value)]
+        item_signatures = []
+        for item in value:
+            item_signature = _get_state_signature(item)
+            if item_signature is None:
+                return None
+            item_signatures.append(item_signature)
+        if len(item_signatures) == 0 or all(s == item_signatures[0] for s in item_signatures):
+            # uniform sequence: items are stacked along a new leading axis
+            return [seq_type, len(item_signatures), item_signatures[0] if item_signatures else None]
+        # heterogeneous sequence: each position is stored separately
+        return [seq_type, None, item_signatures]
+    return None
+
+
+def _store_state_values(values, signature, store):
+    """Store a batch of **values** that share **signature**, using **store** to save each array; returns a
+    JSON-serializable spec from which `_load_state_values` can reconstruct them
+    """
+    kind = signature[0]
+    if kind == 'none':
+        return None
+    if kind in {'ndarray', 'npscalar', 'scalar'}:
+        return store(np.asarray(values))
+    if kind == 'time':
+        return store(np.asarray([[v._get_by_time_scale(ts) for ts in TimeScale] for v in values], dtype=int))
+    if kind == 'objarray':
+        return _store_state_values([list(v.flat) for v in values], signature[2], store)
+    if kind == 'results':
+        return _store_state_values([list(v) for v in values], signature[2], store)
+    length, items = signature[1], signature[2]
+    if length is not None:
+        if items is None:
+            return None
+        return _store_state_values([item for v in values for item in v], items, store)
+    return [_store_state_values([v[i] for v in values], s, store) for i, s in enumerate(items)]
+
+
+def _load_state_values(spec, signature, num_values, load):
+    """Reconstruct a list of **num_values** values stored by `_store_state_values`"""
+    kind = signature[0]
+    if kind == 'none':
+        return [None] * num_values
+    if kind == 'ndarray':
+        # copy so that restored values do not refer to (possibly memory-mapped) storage
+        arr = np.array(load(spec), dtype=signature[2])
+        return [arr[i] for i in range(num_values)]
+    if kind == 'npscalar':
+        arr = np.array(load(spec), dtype=signature[1])
+        return [arr[i] for i in range(num_values)]
+    if kind == 'scalar':
+        scalar_type = _STATE_PYTHON_SCALAR_TYPES[signature[1]]
+        return [scalar_type(v) for v in np.array(load(spec)).tolist()]
+    if kind == 'time':
+        values = []
+        for counts in np.array(load(spec)).tolist():
+            t = Time()
+            for ts, count in zip(TimeScale, counts):
+                t._set_by_time_scale(ts, count)
+            values.append(t)
+        return values
+    if kind == 'objarray':
+        shape = signature[1]
+        values = []
+        for items in _load_state_values(spec, signature[2], num_values, load):
+            arr = np.empty(len(items), dtype=object)
+            for i, item in enumerate(items):
+                arr[i] = item
+            values.append(arr.reshape(shape))
+        return values
+    if kind == 'results':
+        return [
+            ResultsStore(items, limit=signature[1])
+            for items in _load_state_values(spec, signature[2], num_values, load)
+        ]
+
+    seq_type = {name: t for t, name in _STATE_SEQUENCE_TYPES.items()}[kind]
+    length, items = signature[1], signature[2]
+    if length is not None:
+        if length == 0 or items is None:
+            return [seq_type() for _ in range(num_values)]
+        flat = _load_state_values(spec, items, num_values * length, load)
+        return [seq_type(flat[i * length:(i + 1) * length]) for i in range(num_values)]
+    columns = [_load_state_values(s, item, num_values, load) for s, item in zip(spec, items)]
+    return [seq_type(row) for row in zip(*columns)] if columns else [seq_type() for _ in range(num_values)]
+
+
+def _store_random_state(random_state, store):
+    """Return a spec for a `SeededRandomState` or `_SeededPhilox`, or None if **random_state** is neither"""
+    if isinstance(random_state, SeededRandomState):
+        _, key, pos, has_gauss, cached_gaussian = random_state.get_state()
+        return {'type': 'MT19937',
+                'seed': [int(s) for s in random_state.used_seed],
+                'key': store(key),
+                'ints': [int(pos), int(has_gauss)],
+                'cached_gaussian': float(cached_gaussian)}
+    if isinstance(random_state, _SeededPhilox):
+        state = random_state.bit_generator.state
+        return {'type': 'Philox',
+                'seed': [int(s) for s in random_state.used_seed],
+                'counter': store(state['state']['counter']),
+                'key': store(state['state']['key']),
+                'buffer': store(state['buffer']),
+                'ints': [int(state['buffer_pos']), int(state['has_uint32']), int(state['uinteger'])]}
+    return None
+
+
+def _load_random_state(spec, load):
+    if spec['type'] == 'MT19937':
+        random_state = SeededRandomState(spec['seed'])
+        pos, has_gauss = spec['ints']
+        random_state.set_state(('MT19937', np.array(load(spec['key'])), pos, has_gauss, spec['cached_gaussian']))
+    else:
+        random_state = _SeededPhilox(spec['seed'])
+        buffer_pos, has_uint32, uinteger = spec['ints']
+        random_state.bit_generator.state = {
+            'bit_generator': 'Philox',
+            'state': {'counter': np.array(load(spec['counter'])), 'key': np.array(load(spec['key']))},
+            'buffer': np.array(load(spec['buffer'])),
+            'buffer_pos': buffer_pos,
+            'has_uint32': has_uint32,
+            'uinteger': uinteger,
+        }
+    return random_state
+
+
+def _get_receiving_node(projection):
+    """Return the Node (or other Component) that executes **projection**"""
+    owner = projection.receiver.owner
+    # ModulatoryProjections to the ParameterPorts of a Projection (e.g., LearningProjections)
+    #   are used when that Projection is executed by its receiver
+    while isinstance(owner, Projection):
+        owner = owner.receiver.owner
+    if isinstance(owner, CompositionInterfaceMechanism):
+        owner = owner.composition
+    return owner
+
+
+class _NodeExecutionPlan:
+    """Information about a Node used in each TIME_STEP of Composition.execute that changes only with the structure
+    of the Composition (see `Composition._get_execution_plan`).
+    """
+    __slots__ = ('is_mechanism', 'is_composition', 'is_input', 'learned_matrix_ports', 'receivers')
+
+    def __init__(self, node, composition, projections, input_nodes):
+        self.is_mechanism = isinstance(node, Mechanism)
+        self.is_composition = not self.is_mechanism and isinstance(node, Composition)
+        self.is_input = node in input_nodes
+
+        # MATRIX ParameterPorts of PathwayProjections to the Node that may be learned;
+        #   RecurrentTransferMechanisms are excluded since learning is handled by their AutoAssociativeMechanism
+        self.learned_matrix_ports = []
+        if self.is_mechanism and not isinstance(node, RecurrentTransferMechanism):
+            for projection in node.path_afferents:
+                if projection in projections:
+                    try:
+                        self.learned_matrix_ports.append(projection.parameter_ports[MATRIX])
+                    except (AttributeError, KeyError, TypeError):
+                        pass
+
+        # Nodes (or other Components) that use the value of any of the Node's OutputPorts when they execute
+        self.receivers = set()
+        for port in node.output_ports or []:
+            for projection in port.efferents:
+                self.receivers.add(_get_receiving_node(projection))
+
+    def is_learning(self):
+        """Return True if any PathwayProjection to the Node is being learned online"""
+        return any(
+            hasattr(a, 'learning_enabled') and a.learning_enabled in {True, ONLINE}
+            for port in self.learned_matrix_ports
+            for a in port.mod_afferents
+        )
+
+
+class _ExecutionPlan:
+    """Information used by Composition.execute that changes only with the structure of the Composition."""
+    __slots__ = ('composition', 'nodes', 'learning_nodes', 'learned_after_matrix_ports', '_projections', '_input_nodes',
+                 '_frozen_execution_sets')
+
+    def __init__(self, composition):
+        self.composition = composition
+        self._projections = set(composition.projections)
+        self._input_nodes = set(composition.get_nodes_by_role(NodeRole.INPUT))
+        self.nodes = {}
+        for node in composition.nodes:
+            self.nodes[node] = _NodeExecutionPlan(node, composition, self._projections, self._input_nodes)
+        self.learning_nodes = frozenset(composition.get_nodes_by_role(NodeRole.LEARNING))
+
+        # MATRIX ParameterPorts of projections that may be learned with learning_enabled == AFTER
+        self.learned_after_matrix_ports = [
+            p.parameter_ports[MATRIX] for p in composition.projections
+            if hasattr(p, 'has_learning_projection') and p.has_learning_projection
+        ]
+
+        self._frozen_execution_sets = {}
+
+    def __getitem__(self, node):
+        try:
+            return self.nodes[node]
+        except KeyError:
+            # e.g., the controller, if it is not one of the Composition's nodes
+            node_plan = _NodeExecutionPlan(node, self.composition, self._projections, self._input_nodes)
+            self.nodes[node] = node_plan
+            return node_plan
+
+    def uses_frozen_values(self, execution_set):
+        """Return True if any Node in **execution_set** receives a Projection from a Node in the set (including
+        itself), in which case the values of the Nodes must be frozen for the TIME_STEP in which the set executes
+        """
+        execution_set = frozenset(execution_set)
+        try:
+            return self._frozen_execution_sets[execution_set]
+        except KeyError:
+            uses_frozen_values = any(self[node].receivers & execution_set for node in execution_set)
+            self._frozen_execution_sets[execution_set] = uses_frozen_values
+            return uses_frozen_values
+
+
+def _is_dataset_input(value):
+    """Return True if **value** is a dataset (an np.memmap, or other object with a length that returns the input
+    for a trial when indexed) that can be specified as the input to a Node (see `Composition_Input_Datasets`)
+    """
+    if isinstance(value, np.memmap):
+        return True
+    return (hasattr(value, '__len__')
+            and hasattr(value, '__getitem__')
+            and not hasattr(value, '__array__')
+            and not isinstance(value, (list, tuple, collections.deque, str, collections.abc.Mapping)))
+
+
+class _DatasetInput(collections.abc.Sequence):
+    """Parsed input for a Node specified as a dataset, the input for each trial of which is retrieved from the
+    dataset (and parsed) only when the trial is indexed.
+    """
+    def __init__(self, dataset, parse):
+        self.dataset = dataset
+        self._parse = parse
+
+    def __len__(self):
+        return len(self.dataset)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self._parse(self.dataset[index])
+
+
 class EdgeType(enum.Enum):
     """
         Attributes:
@@ -3319,6 +3753,8 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         controller_time_scale=TRIAL        \
         controller_condition=Always(),     \
         retain_old_simulation_data=None,   \
+        results_limit=None,                \
+        max_node_workers=None,             \
         show_graph_attributes=None,        \
         name=None,                         \
         prefs=Composition.classPreference  \
@@ -3403,6 +3839,15 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         <OptimizationControlMechanism_Execution>` of the Composition (see `retain_old_simulation_data
         <Composition.retain_old_simulation_data>` for additional details).
 
+    results_limit : int : default None
+        specifies the maximum number of trials for which `results <Composition.results>` and `simulation_results
+        <Composition.simulation_results>` are retained (see `results_limit <Composition.results_limit>` for
+        additional details).
+
+    max_node_workers : int : default None
+        specifies the maximum number of threads used to execute the Nodes of an execution set concurrently (see
+        `max_node_workers <Composition.max_node_workers>` for additional details).
+
     show_graph_attributes : dict : None
         specifies features of how the Composition is displayed when its `show_graph <ShowGraph.show_graph>`
         method is called or **animate** is specified in a call to its `run <Composition.run>` method
@@ -3654,7 +4099,9 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         a list of the `output_values <Mechanism_Base.output_values>` of the `OUTPUT` `Nodes <Composition_Nodes>`
         in the Composition for every `TRIAL <TimeScale.TRIAL>` executed in a call to `run <Composition.run>`.
         Each item in the outermos list is a list of values for a given trial; each item within a trial corresponds
-        to the `output_values <Mechanism_Base.output_values>` of an `OUTPUT` Mechanism for that trial.
+        to the `output_values <Mechanism_Base.output_values>` of an `OUTPUT` Mechanism for that trial.  The results
+        are held in a `ResultsStore`, which stores them in a single np.ndarray if they all have the same shape, and
+        retains only those of the most recent `results_limit <Composition.results_limit>` trials.
 
     output_values : list[list]
         a list of the `output_values <Mechanism_Base.output_values>` of the `OUTPUT` `Nodes <Composition_Nodes>`
@@ -3673,6 +4120,16 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         <OptimizationControlMechanism_Execution>` are saved;
         if False, simulation values are deleted unless otherwise specified by individual Parameters.
 
+    results_limit : int or None
+        maximum number of trials for which `results <Composition.results>` and `simulation_results
+        <Composition.simulation_results>` are retained;  once it is reached, the result of each new trial replaces
+        that of the oldest one (see `ResultsStore`).  If None, the results of all trials are retained.
+
+    max_node_workers : int or None
+        maximum number of threads used to execute the Nodes in each `execution set <Composition_Parallel_Execution>`
+        of the Composition concurrently when it is executed using the Python interpreter.  If None, the Nodes are
+        always executed one at a time.
+
     recorded_reports : str
         contains output and/or progress reports from execution(s) of Composition if *RECORD* is specified in the
         **report_to_devices** argument of a `Composition execution method <Composition_Execution_Methods>`.
@@ -3704,6 +4161,12 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
     _model_spec_generic_type_name = 'graph'
 
+    _unpickled_attrs = Composition_Base._unpickled_attrs | {'_node_executor', '_node_executor_workers',
+                                                           '_nested_nodes_by_roles'}
+
+    # incremented whenever the NodeRoles of any Node in any Composition change, which invalidates the lookups cached
+    #   by _get_nested_nodes_with_same_roles_at_all_levels
+    _node_roles_version = 0
 
     class Parameters(ParametersBase):
         """
@@ -3722,6 +4185,18 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                     :default value: []
                     :type: ``list``
 
+                max_node_workers
+                    see `max_node_workers <Composition.max_node_workers>`
+
+                    :default value: None
+                    :type:
+
+                results_limit
+                    see `results_limit <Composition.results_limit>`
+
+                    :default value: None
+                    :type:
+
                 retain_old_simulation_data
                     see `retain_old_simulation_data <Composition.retain_old_simulation_data>`
 
@@ -3736,6 +4211,8 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         """
         results = Parameter([], loggable=False, pnl_internal=True)
         simulation_results = Parameter([], loggable=False, pnl_internal=True)
+        results_limit = Parameter(None, stateful=False, loggable=False, pnl_internal=True)
+        max_node_workers = Parameter(None, stateful=False, loggable=False, pnl_internal=True)
         retain_old_simulation_data = Parameter(False, stateful=False, loggable=False, pnl_internal=True)
         input_specification = Parameter(None, stateful=False, loggable=False, pnl_internal=True)
 
@@ -3758,6 +4235,8 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
             controller_time_scale=TimeScale.TRIAL,
             controller_condition:Condition=Always(),
             retain_old_simulation_data=None,
+            results_limit=None,
+            max_node_workers=None,
             show_graph_attributes=None,
             name=None,
             prefs=None,
@@ -3775,6 +4254,9 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         # core attributes
         self.graph = Graph()  # Graph of the Composition
         self._graph_processing = None
+        self._execution_plan = None
+        self._node_executor = None
+        self._node_executor_workers = None
         self.nodes = ContentAddressableList(component_type=Component)
         self.node_ordering = []
         self.allow_probes = allow_probes
@@ -3821,8 +4303,15 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         self.needs_update_controller = True # Tracks if controller needs to update its state_input_ports
         self.needs_determine_node_roles = False # Set in add_node and add_projection to insure update of NodeRoles
         self._need_check_for_unused_projections = True
+        self._batch_construction_depth = 0  # Number of batch_construction() blocks currently entered
 
         self.nodes_to_roles = collections.OrderedDict()
+        # index of nodes_to_roles by NodeRole:  {NodeRole: {Node: None}}, and the lists of Nodes returned for each
+        #   NodeRole by get_nodes_by_role (in the order of nodes_to_roles), which are built when needed
+        self._nodes_by_role = collections.defaultdict(dict)
+        self._nodes_by_role_lists = {}
+        self._node_positions = None
+        self._nested_nodes_by_roles = {}
         self.cycle_vertices = set()
 
         context = Context(source=ContextFlags.CONSTRUCTOR, execution_id=None)
@@ -3830,6 +4319,8 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         self._initialize_parameters(
             **param_defaults,
             retain_old_simulation_data=retain_old_simulation_data,
+            results_limit=results_limit,
+            max_node_workers=max_node_workers,
             context=context
         )
 
@@ -3891,6 +4382,13 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         show_graph_attributes = show_graph_attributes or {}
         self._show_graph = ShowGraph(self, **show_graph_attributes)
 
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        # the threads used to execute Nodes are not pickled, and are created again when needed
+        self._node_executor = None
+        self._node_executor_workers = None
+        self._nested_nodes_by_roles = {}
+
     @property
     def graph_processing(self):
         """
@@ -3989,6 +4487,21 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         self._update_shadow_projections(context=context)
         self._check_for_projection_assignments(context=context)
         self.needs_update_graph = False
+        self._execution_plan = None
+
+    def _get_execution_plan(self):
+        """Return the `_ExecutionPlan` for the current structure of the Composition
+
+        The plan is cached until the graph is next analyzed (see `_analyze_graph`);  if the structure of the
+        Composition has changed since then, a new plan is returned but not cached.
+        """
+        if self._execution_plan is not None and not self.needs_update_graph:
+            return self._execution_plan
+
+        plan = _ExecutionPlan(self)
+        if not self.needs_update_graph:
+            self._execution_plan = plan
+        return plan
 
     def _update_processing_graph(self):
         """
@@ -4015,6 +4528,40 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         self._graph_processing.prune_feedback_edges()
         self.needs_update_graph_processing = False
 
+    @contextlib.contextmanager
+    def batch_construction(self):
+        """
+        Context manager that defers analysis of the Composition's `graph <Composition_Graph>` until the end of a
+        block in which it is constructed (see `Composition_Batch_Construction`)::
+
+            with comp.batch_construction():
+                for pathway in pathways:
+                    comp.add_linear_processing_pathway(pathway)
+
+        The analysis that is otherwise carried out each time a `Pathway <Composition_Pathways>` is added or a `Node
+        <Composition_Nodes>` is removed (assigning `NodeRoles <NodeRole>`, and constructing the Ports and Projections
+        of the Composition's `CompositionInterfaceMechanisms <Composition_CIMs>`) is carried out once, on leaving the
+        outermost such block;  it is not carried out if the block is left because of an exception.  Methods that
+        require an up-to-date analysis (such as `run <Composition.run>`, `learn <Composition.learn>`, and those that
+        add `learning Pathways <Composition_Learning_Pathway>`) carry it out when they are called within the block.
+        """
+        self._batch_construction_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_construction_depth -= 1
+        if not self._batch_construction_depth and self.needs_update_graph:
+            self._analyze_graph()
+
+    def _update_graph(self, context=None):
+        """Analyze the graph after a change to the structure of the Composition, unless that is deferred by
+        `batch_construction <Composition.batch_construction>`, in which case it is analyzed on leaving that
+        """
+        if self._batch_construction_depth:
+            self.needs_update_graph = True
+        else:
+            self._analyze_graph(context=context)
+
     # endregion GRAPH
 
     # ******************************************************************************************************************
@@ -4062,13 +4609,12 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         node._check_for_composition(context=context)
 
         # Add node to Composition's graph
-        if node not in [vertex.component for vertex in
-                        self.graph.vertices]:  # Only add if it doesn't already exist in graph
+        if node not in self.graph.comp_to_vertex:  # Only add if it doesn't already exist in graph
             node.is_processing = True
             self.graph.add_component(node)  # Set incoming edge list of node to empty
             self.nodes.append(node)
             self.node_ordering.append(node)
-            self.nodes_to_roles[node] = set()
+            self._set_node_roles(node, ())
 
             self.needs_update_graph = True
             self.needs_update_graph_processing = True
@@ -4170,7 +4716,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                             pass
 
         self.graph.remove_component(node)
-        del self.nodes_to_roles[node]
+        self._delete_node_roles(node)
 
         # Remove any entries for node in required_node_roles or excluded_node_roles
         node_role_pairs = [item for item in self.required_node_roles if item[0] is node]
@@ -4193,7 +4739,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         self.needs_update_scheduler = True
 
         if analyze_graph:
-            self._analyze_graph()
+            self._update_graph()
 
     def remove_nodes(self, nodes):
         if not isinstance(nodes, (list, Mechanism, Composition)):
@@ -4202,7 +4748,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         for node in nodes:
             self._remove_node(node, analyze_graph=False)
 
-        self._analyze_graph()
+        self._update_graph()
 
     @handle_external_context()
     def _add_required_node_role(self, node, role, context=None):
@@ -4359,10 +4905,16 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
             raise CompositionError('Invalid NodeRole: {0}'.format(role))
 
         try:
-            return [node for node in self.nodes_to_roles if role in self.nodes_to_roles[node]]
+            nodes = self._nodes_by_role_lists[role]
+        except KeyError:
+            # Nodes are returned in the order in which they appear in nodes_to_roles
+            if self._node_positions is None:
+                self._node_positions = {node: i for i, node in enumerate(self.nodes_to_roles)}
+            nodes = sorted(self._nodes_by_role[role], key=self._node_positions.__getitem__)
+            self._nodes_by_role_lists[role] = nodes
 
-        except KeyError as e:
-            raise CompositionError('Node missing from {0}.nodes_to_roles: {1}'.format(self, e))
+        # copied, since callers may modify the list returned
+        return list(nodes)
 
     def _get_nested_nodes_with_same_roles_at_all_levels(self, comp, include_roles, exclude_roles=None):
         """Return all Nodes from nested Compositions that have *include_roles* but not *exclude_roles at all levels*.
@@ -4378,18 +4930,30 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         else:
             exclude_roles = []
         if isinstance(comp, Composition):
+            # the result is cached until the NodeRoles of any Node change
+            key = (tuple(include_roles), tuple(exclude_roles))
+            try:
+                version, nested_nodes = comp._nested_nodes_by_roles[key]
+                if version == Composition._node_roles_version:
+                    return list(nested_nodes) or None
+            except KeyError:
+                pass
+
+            nested_nodes = []
             # Get all nested nodes in comp that have include_roles and not exclude_roles:
-            for node in [n for n in comp.nodes
-                         if (any(n in comp.get_nodes_by_role(include)
-                                 for include in include_roles)
-                               and not any(n in comp.get_nodes_by_role(exclude)
-                                           for exclude in exclude_roles))]:
+            for node in comp.nodes:
+                roles = comp.nodes_to_roles.get(node, ())
+                if (not any(include in roles for include in include_roles)
+                        or any(exclude in roles for exclude in exclude_roles)):
+                    continue
                 if isinstance(node, Composition):
                     nested_nodes.extend(node._get_nested_nodes_with_same_roles_at_all_levels(node, include_roles,
-                                                                                             exclude_roles))
+                                                                                             exclude_roles) or [])
                 else:
                     nested_nodes.append(node)
-        return nested_nodes or None
+            comp._nested_nodes_by_roles[key] = (Composition._node_roles_version, nested_nodes)
+        # copied, since callers may modify the list returned
+        return list(nested_nodes) or None
 
     def _get_input_nodes_by_CIM_input_order(self):
         """Return a list with the `INPUT` `Nodes <Composition_Nodes>` of the Composition in the same order as their
@@ -4875,7 +5439,8 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
        """
 
         # Clear old roles
-        self.nodes_to_roles.update({k: set() for k in self.nodes_to_roles})
+        for node in self.nodes_to_roles:
+            self._clear_node_roles(node)
 
         # Assign required_node_roles
         for node_role_pair in self.required_node_roles:
@@ -5007,32 +5572,59 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         # Manual override to avoid INPUT/OUTPUT setting, which would cause
         # CIMs to be created, which is not correct for controllers
         if self.controller is not None:
-            self.nodes_to_roles[self.controller] = {NodeRole.CONTROLLER}
+            self._set_node_roles(self.controller, [NodeRole.CONTROLLER])
 
         self.needs_determine_node_roles = False
 
     def _set_node_roles(self, node, roles):
-        self._clear_node_roles(node)
+        """Assign **roles** as the NodeRoles of **node**, adding it to nodes_to_roles if it is not already there"""
+        if node in self.nodes_to_roles:
+            self._clear_node_roles(node)
+        else:
+            self.nodes_to_roles[node] = set()
+            self._node_positions = None
         for role in roles:
-            self._add_node_role(role)
+            self._add_node_role(node, role)
 
     def _clear_node_roles(self, node):
         if node in self.nodes_to_roles:
+            for role in self.nodes_to_roles[node]:
+                self._unindex_node_role(node, role)
             self.nodes_to_roles[node] = set()
 
+    def _delete_node_roles(self, node):
+        """Remove **node** from nodes_to_roles"""
+        self._clear_node_roles(node)
+        del self.nodes_to_roles[node]
+        self._node_positions = None
+
+    def _index_node_role(self, node, role):
+        self._nodes_by_role[role][node] = None
+        self._nodes_by_role_lists.pop(role, None)
+        Composition._node_roles_version += 1
+
+    def _unindex_node_role(self, node, role):
+        del self._nodes_by_role[role][node]
+        self._nodes_by_role_lists.pop(role, None)
+        Composition._node_roles_version += 1
+
     def _add_node_role(self, node, role):
         if role not in NodeRole:
             raise CompositionError('Invalid NodeRole: {0}'.format(role))
         try:
-            self.nodes_to_roles[node].add(role)
+            roles = self.nodes_to_roles[node]
         except KeyError:
             raise CompositionError(f"Attempt to assign {role} to '{node.name}' that is not a Node in {self.name}.")
+        if role not in roles:
+            roles.add(role)
+            self._index_node_role(node, role)
 
     def _remove_node_role(self, node, role):
         if role not in NodeRole:
             raise CompositionError('Invalid NodeRole: {0}'.format(role))
         try:
             self.nodes_to_roles[node].remove(role)
+            self._unindex_node_role(node, role)
         except KeyError as e:
             pass
             # if e.args[0] is node:
@@ -5138,6 +5730,10 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         # INPUT CIM
         current_input_node_input_ports = set()
 
+        # InputPorts of INPUT Nodes for which ports are added to the input CIM, and the InputPorts added for them;
+        #   these are added to the CIM together, since the CIM is updated each time that Ports are added to it
+        new_input_node_input_ports = []
+
         # we're going to set up ports on the input CIM for all input nodes in the Composition
         input_nodes = self.get_nodes_by_role(NodeRole.INPUT)
         for node in input_nodes:
@@ -5149,7 +5745,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                 current_input_node_input_ports.add(input_port)
 
                 # if there is not a corresponding CIM InputPort/OutputPort pair, add them
-                if input_port not in set(self.input_CIM_ports.keys()):
+                if input_port not in self.input_CIM_ports:
                     # instantiate the InputPort on the input CIM to correspond to the Node's InputPort
                     interface_input_port = InputPort(owner=self.input_CIM,
                                                      variable=np.atleast_2d(input_port.defaults.variable)[0],
@@ -5160,38 +5756,48 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                     if NodeRole.TARGET in self.get_roles_by_node(node):
                         interface_input_port.parameters.require_projection_in_composition.set(False, override=True)
 
-                    # add Port to the input CIM
-                    self.input_CIM.add_ports([interface_input_port],
-                                             context=context)
-
-                    # instantiate the OutputPort on the input CIM to correspond to the Node's InputPort
-                    interface_output_port = OutputPort(owner=self.input_CIM,
-                                                       variable=(OWNER_VALUE, functools.partial(self.input_CIM.get_input_port_position, interface_input_port)),
-                                                       function=Identity,
-                                                       name=INPUT_CIM_NAME + "_" + node.name + "_" + input_port.name,
-                                                       context=context)
-
-                    # add Port to the input CIM
-                    self.input_CIM.add_ports([interface_output_port],
-                                             context=context)
-
-                    # add entry to input_CIM_ports dict, so that the CIM ports that correspond to a given
-                    # input node's InputPort can be retrieved
-                    self.input_CIM_ports[input_port] = (interface_input_port, interface_output_port)
-
-                    # create Projection from the output port on the input CIM to the input port on the input node
-                    projection = MappingProjection(sender=interface_output_port,
-                                                   receiver=input_port,
-                                                   matrix=IDENTITY_MATRIX,
-                                                   name="(" + interface_output_port.name + ") to ("
-                                                        + input_port.owner.name + "-" + input_port.name + ")")
-
-                    # activate the Projection
-                    projection._activate_for_compositions(self)
+                    new_input_node_input_ports.append((node, input_port, interface_input_port))
+
+        if new_input_node_input_ports:
+            # add Ports to the input CIM
+            self.input_CIM.add_ports([interface_input_port
+                                      for _, _, interface_input_port in new_input_node_input_ports],
+                                     context=context)
+
+            # instantiate the OutputPorts on the input CIM to correspond to the Nodes' InputPorts
+            interface_output_ports = [
+                OutputPort(owner=self.input_CIM,
+                           variable=(OWNER_VALUE, functools.partial(self.input_CIM.get_input_port_position,
+                                                                    interface_input_port)),
+                           function=Identity,
+                           name=INPUT_CIM_NAME + "_" + node.name + "_" + input_port.name,
+                           context=context)
+                for node, input_port, interface_input_port in new_input_node_input_ports
+            ]
+
+            # add Ports to the input CIM
+            self.input_CIM.add_ports(interface_output_ports,
+                                     context=context)
+
+            for (node, input_port, interface_input_port), interface_output_port in zip(new_input_node_input_ports,
+                                                                                        interface_output_ports):
+                # add entry to input_CIM_ports dict, so that the CIM ports that correspond to a given
+                # input node's InputPort can be retrieved
+                self.input_CIM_ports[input_port] = (interface_input_port, interface_output_port)
+
+                # create Projection from the output port on the input CIM to the input port on the input node
+                projection = MappingProjection(sender=interface_output_port,
+                                               receiver=input_port,
+                                               matrix=IDENTITY_MATRIX,
+                                               name="(" + interface_output_port.name + ") to ("
+                                                    + input_port.owner.name + "-" + input_port.name + ")")
+
+                # activate the Projection
+                projection._activate_for_compositions(self)
 
-                    # if the node is a nested Composition, activate the Projection for the nested Composition as well
-                    if isinstance(node, Composition):
-                        projection._activate_for_compositions(node)
+                # if the node is a nested Composition, activate the Projection for the nested Composition as well
+                if isinstance(node, Composition):
+                    projection._activate_for_compositions(node)
 
         # compare the set of ports in input_CIM_ports to the set of input ports of input nodes that currently exist in
         # the composition, so that we can remove ports on the input CIM that correspond to nodes that no longer should
@@ -5213,13 +5819,17 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         # Set up ports on the output CIM for all output nodes in the Composition
         current_output_node_output_ports = set()
 
+        # OutputPorts of OUTPUT and PROBE Nodes for which ports are added to the output CIM, and the InputPorts added
+        #   for them (added to the CIM together, as for the input CIM)
+        new_output_node_output_ports = []
+
         # loop through all output ports on OUTPUT and PROBE nodes
         for node in self.get_nodes_by_role(NodeRole.OUTPUT) + self.get_nodes_by_role(NodeRole.PROBE):
             for output_port in node.output_ports:
                 current_output_node_output_ports.add(output_port)
 
                 # if there is not a corresponding CIM InputPort/OutputPort pair, add them
-                if output_port not in set(self.output_CIM_ports.keys()):
+                if output_port not in self.output_CIM_ports:
 
                     # instantiate the input port on the output CIM to correspond to the node's output port
                     interface_input_port = InputPort(owner=self.output_CIM,
@@ -5228,46 +5838,55 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                                                      name=OUTPUT_CIM_NAME + "_" + node.name + "_" + output_port.name,
                                                      context=context)
 
-                    # add port to the output CIM
-                    self.output_CIM.add_ports([interface_input_port],
-                                              context=context)
-
-                    # instantiate the OutputPort on the output CIM to correspond to the node's OutputPort
-                    interface_output_port = OutputPort(
-                            owner=self.output_CIM,
-                            variable=(OWNER_VALUE, functools.partial(self.output_CIM.get_input_port_position,
-                                                                     interface_input_port)),
-                            function=Identity,
-                            reference_value=output_port.defaults.value,
-                            name=OUTPUT_CIM_NAME + "_" + node.name + "_" + output_port.name,
-                            context=context)
-
-                    # add port to the output CIM
-                    self.output_CIM.add_ports([interface_output_port],
-                                              context=context)
-
-                    # add entry to output_CIM_ports dict, so that CIM ports that correspond to a given
-                    # output node's OutputPort can be retrieved
-                    self.output_CIM_ports[output_port] = (interface_input_port, interface_output_port)
-
-                    proj_name = "(" + output_port.name + ") to (" + interface_input_port.name + ")"
-
-                    # create Projection from the OutputPort of the output Node to InputPort on the output CIM
-                    proj = MappingProjection(
-                        sender=output_port,
-                        receiver=interface_input_port,
-                        # FIX:  This fails if OutputPorts don't all have the same dimensionality (number of axes);
-                        #       see example in test_output_ports/TestOutputPorts
-                        matrix=IDENTITY_MATRIX,
-                        name=proj_name
-                    )
+                    new_output_node_output_ports.append((node, output_port, interface_input_port))
+
+        if new_output_node_output_ports:
+            # add ports to the output CIM
+            self.output_CIM.add_ports([interface_input_port
+                                       for _, _, interface_input_port in new_output_node_output_ports],
+                                      context=context)
+
+            # instantiate the OutputPorts on the output CIM to correspond to the nodes' OutputPorts
+            interface_output_ports = [
+                OutputPort(
+                    owner=self.output_CIM,
+                    variable=(OWNER_VALUE, functools.partial(self.output_CIM.get_input_port_position,
+                                                             interface_input_port)),
+                    function=Identity,
+                    reference_value=output_port.defaults.value,
+                    name=OUTPUT_CIM_NAME + "_" + node.name + "_" + output_port.name,
+                    context=context)
+                for node, output_port, interface_input_port in new_output_node_output_ports
+            ]
+
+            # add ports to the output CIM
+            self.output_CIM.add_ports(interface_output_ports,
+                                      context=context)
 
-                    # activate the projection
-                    proj._activate_for_compositions(self)
+            for (node, output_port, interface_input_port), interface_output_port in zip(new_output_node_output_ports,
+                                                                                         interface_output_ports):
+                # add entry to output_CIM_ports dict, so that CIM ports that correspond to a given
+                # output node's OutputPort can be retrieved
+                self.output_CIM_ports[output_port] = (interface_input_port, interface_output_port)
 
-                    # if the Node is a nested Composition, activate the Projection for the nested Composition as well
-                    if isinstance(node, Composition):
-                        proj._activate_for_compositions(node)
+                proj_name = "(" + output_port.name + ") to (" + interface_input_port.name + ")"
+
+                # create Projection from the OutputPort of the output Node to InputPort on the output CIM
+                proj = MappingProjection(
+                    sender=output_port,
+                    receiver=interface_input_port,
+                    # FIX:  This fails if OutputPorts don't all have the same dimensionality (number of axes);
+                    #       see example in test_output_ports/TestOutputPorts
+                    matrix=IDENTITY_MATRIX,
+                    name=proj_name
+                )
+
+                # activate the projection
+                proj._activate_for_compositions(self)
+
+                # if the Node is a nested Composition, activate the Projection for the nested Composition as well
+                if isinstance(node, Composition):
+                    proj._activate_for_compositions(node)
 
         # compare the set of ports in output_CIM_ports to the set of output ports of output nodes that currently exist
         # in the composition, so that we can remove ports on the output CIM that correspond to nodes that no longer
@@ -6446,7 +7065,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         for p in projections:
             self.add_projection(p, p.sender.owner, p.receiver.owner)
 
-        self._analyze_graph()
+        self._update_graph()
 
     @handle_external_context()
     def add_pathways(self, pathways, context=None):
@@ -6578,49 +7197,51 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         # Validate items in pathways list and add to Composition using relevant add_linear_<> method.
         bad_entry_error_msg = f"Every item in the {pathways_arg_str} must be a " \
                               f"Node, list, set, tuple or dict; the following are not: "
-        for pathway in pathways:
-            pathway = pathway[0] if isinstance(pathway, list) and len(pathway) == 1 else pathway
-            pway_name = None
-            if isinstance(pathway, Pathway):
-                pway_name = pathway.name
-                pathway = pathway.pathway
-            if _is_node_spec(pathway) or isinstance(pathway, (list, set, tuple)):
-                if isinstance(pathway, set):
-                    bad_entries = [repr(entry) for entry in pathway if not _is_node_spec(entry)]
-                    if bad_entries:
-                        raise CompositionError(f"{bad_entry_error_msg}{','.join(bad_entries)}")
-                pway_type, pway, pway_learning_fct = identify_pway_type_and_parse_tuple_prn(pathway, f"a tuple")
-            elif isinstance(pathway, dict):
-                if len(pathway)!=1:
-                    raise CompositionError(f"A dict specified in the {pathways_arg_str} "
-                                           f"contains more than one entry: {pathway}.")
-                pway_name, pway = list(pathway.items())[0]
-                if not isinstance(pway_name, str):
-                    raise CompositionError(f"The key in a dict specified in the {pathways_arg_str} must be a str "
-                                           f"(to be used as its name): {pway_name}.")
-                if _is_node_spec(pway) or isinstance(pway, (list, tuple, Pathway)):
-                    pway_type, pway, pway_learning_fct = identify_pway_type_and_parse_tuple_prn(pway,
-                                                                                                f"the value of a dict")
+        # the graph is analyzed once, after all of the pathways have been added
+        with self.batch_construction():
+            for pathway in pathways:
+                pathway = pathway[0] if isinstance(pathway, list) and len(pathway) == 1 else pathway
+                pway_name = None
+                if isinstance(pathway, Pathway):
+                    pway_name = pathway.name
+                    pathway = pathway.pathway
+                if _is_node_spec(pathway) or isinstance(pathway, (list, set, tuple)):
+                    if isinstance(pathway, set):
+                        bad_entries = [repr(entry) for entry in pathway if not _is_node_spec(entry)]
+                        if bad_entries:
+                            raise CompositionError(f"{bad_entry_error_msg}{','.join(bad_entries)}")
+                    pway_type, pway, pway_learning_fct = identify_pway_type_and_parse_tuple_prn(pathway, f"a tuple")
+                elif isinstance(pathway, dict):
+                    if len(pathway)!=1:
+                        raise CompositionError(f"A dict specified in the {pathways_arg_str} "
+                                               f"contains more than one entry: {pathway}.")
+                    pway_name, pway = list(pathway.items())[0]
+                    if not isinstance(pway_name, str):
+                        raise CompositionError(f"The key in a dict specified in the {pathways_arg_str} must be a str "
+                                               f"(to be used as its name): {pway_name}.")
+                    if _is_node_spec(pway) or isinstance(pway, (list, tuple, Pathway)):
+                        pway_type, pway, pway_learning_fct = identify_pway_type_and_parse_tuple_prn(
+                            pway, f"the value of a dict")
+                    else:
+                        raise CompositionError(f"The value in a dict specified in the {pathways_arg_str} must be "
+                                               f"a pathway specification (Node, list or tuple): {pway}.")
                 else:
-                    raise CompositionError(f"The value in a dict specified in the {pathways_arg_str} must be "
-                                           f"a pathway specification (Node, list or tuple): {pway}.")
-            else:
-                raise CompositionError(f"{bad_entry_error_msg}{repr(pathway)}")
-
-            context.source = ContextFlags.METHOD
-            if pway_type == PROCESSING_PATHWAY:
-                new_pathway = self.add_linear_processing_pathway(pathway=pway,
-                                                                 name=pway_name,
-                                                                 context=context)
-            elif pway_type == LEARNING_PATHWAY:
-                new_pathway = self.add_linear_learning_pathway(pathway=pway,
-                                                               learning_function=pway_learning_fct,
-                                                               name=pway_name,
-                                                               context=context)
-            else:
-                assert False, f"PROGRAM ERROR: failure to determine pathway_type in add_pathways for {self.name}."
+                    raise CompositionError(f"{bad_entry_error_msg}{repr(pathway)}")
+
+                context.source = ContextFlags.METHOD
+                if pway_type == PROCESSING_PATHWAY:
+                    new_pathway = self.add_linear_processing_pathway(pathway=pway,
+                                                                     name=pway_name,
+                                                                     context=context)
+                elif pway_type == LEARNING_PATHWAY:
+                    new_pathway = self.add_linear_learning_pathway(pathway=pway,
+                                                                   learning_function=pway_learning_fct,
+                                                                   name=pway_name,
+                                                                   context=context)
+                else:
+                    assert False, f"PROGRAM ERROR: failure to determine pathway_type in add_pathways for {self.name}."
 
-            added_pathways.append(new_pathway)
+                added_pathways.append(new_pathway)
 
         return added_pathways
 
@@ -7044,7 +7665,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                           context=context)
         self.pathways.append(pathway)
 
-        self._analyze_graph(context)
+        self._update_graph(context)
 
         return pathway
 
@@ -7165,6 +7786,10 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                                    f"{LearningFunction.__name__} ({pathway[1].__name__}) than the one specified in "
                                    f"its 'learning_function' arg ({learning_function.__name__}).")
 
+        # NodeRoles are used below, so analyze the graph if that has been deferred by batch_construction()
+        if self._batch_construction_depth and self.needs_update_graph:
+            self._analyze_graph(context)
+
         # Preserve existing NodeRole.OUTPUT status for any non-learning-related nodes
         for node in self.get_nodes_by_role(NodeRole.OUTPUT):
             if not any(node for node in [pathway for pathway in self.pathways
@@ -8676,10 +9301,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
         # Store simulation results on "base" composition
         if self.initialization_status != ContextFlags.INITIALIZING:
-            try:
-                self.parameters.simulation_results._get(base_context).append(result)
-            except AttributeError:
-                self.parameters.simulation_results._set([result], base_context)
+            self._get_results_store(self.parameters.simulation_results, base_context).append(result)
 
         # COMPUTE net_outcome and aggregate in net_outcomes
 
@@ -8940,6 +9562,12 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         # parse a user-provided input dict to format it properly for execution.
         # compute number of input sets and return that as well
         _inputs = self._parse_names_in_inputs(inputs)
+        array_inputs = self._parse_array_inputs(_inputs)
+        if array_inputs is not None:
+            return array_inputs
+        dataset_inputs = self._parse_dataset_inputs(_inputs)
+        if dataset_inputs is not None:
+            return dataset_inputs
         _inputs = self._parse_labels(_inputs)
         self._validate_input_dict_keys(_inputs)
         _inputs = self._instantiate_input_dict(_inputs)
@@ -8948,6 +9576,131 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         num_inputs_sets = len(next(iter(_inputs.values()),[]))
         return _inputs, num_inputs_sets
 
+    def _get_array_input_shape(self, node):
+        """Return the shape of an input to **node** for a single trial as an np.ndarray (number of external
+        InputPorts x length of their input), or None if the inputs to its InputPorts differ in length or are not 1d
+        """
+        if isinstance(node, Composition):
+            input_shape = node.input_CIM.external_input_shape
+        elif isinstance(node, Mechanism):
+            input_shape = node.external_input_shape
+        else:
+            return None
+        port_shapes = {np.shape(port_shape) for port_shape in input_shape}
+        if len(port_shapes) != 1:
+            return None
+        port_shape = port_shapes.pop()
+        if len(port_shape) != 1:
+            return None
+        return (len(input_shape),) + port_shape
+
+    def _parse_array_inputs(self, inputs):
+        """Fast path of `_parse_input_dict` for inputs that are all numeric np.ndarrays of shape (number of trials x
+        number of external InputPorts x length of their input), with an entry for every INPUT Node
+
+        The shape of each array is validated once, rather than for each trial, and the arrays are used as is (or,
+        if they specify a single trial, broadcast to the number of trials) so that the input for each trial is a view.
+
+        Returns
+        -------
+        `dict`, `int` :
+            Parsed input dict and number of input sets, as for `_parse_input_dict`, or None if the inputs do not all
+            meet these conditions (and must be parsed by `_parse_input_dict`)
+        """
+        input_nodes = self.get_nodes_by_role(NodeRole.INPUT)
+        if (not input_nodes
+                or len(inputs) != len(input_nodes)
+                or not all(isinstance(v, np.ndarray) for v in inputs.values())):
+            return None
+
+        _inputs = {}
+        for node in input_nodes:
+            try:
+                stimulus = inputs[node]
+            except KeyError:
+                return None
+            if (stimulus.dtype.kind not in 'biuf'
+                    # converting an np.memmap would load all of it;  it is parsed as a dataset instead
+                    or isinstance(stimulus, np.memmap) and stimulus.dtype != np.float64
+                    or stimulus.ndim != 3
+                    or not len(stimulus)
+                    or stimulus.shape[1:] != self._get_array_input_shape(node)):
+                return None
+            _inputs[node] = np.asarray(stimulus, dtype=np.float64)
+
+        num_inputs_sets = max(len(stimulus) for stimulus in _inputs.values())
+        for node, stimulus in _inputs.items():
+            if len(stimulus) == 1:
+                _inputs[node] = np.broadcast_to(stimulus, (num_inputs_sets,) + stimulus.shape[1:])
+            elif len(stimulus) != num_inputs_sets:
+                raise CompositionError(f"The input dictionary for {self.name} contains input specifications of "
+                                       f"different lengths ({len(stimulus)} for {node.name}, and {num_inputs_sets}). "
+                                       f"The same number of inputs must be provided for each receiver in a "
+                                       f"Composition.")
+        return _inputs, num_inputs_sets
+
+    def _parse_dataset_inputs(self, inputs):
+        """Parse an input dict in which the inputs to one or more INPUT Nodes are datasets (see
+        `Composition_Input_Datasets`).  The other inputs are parsed by `_parse_input_dict`, and each dataset is
+        replaced by a `_DatasetInput`, so that the input for each trial is retrieved from it (and validated) only
+        when that trial is executed.
+
+        Returns
+        -------
+        `dict`, `int` :
+            Parsed input dict and number of input sets, as for `_parse_input_dict`, or None if none of the inputs
+            are datasets
+        """
+        datasets = {receiver: stimulus for receiver, stimulus in inputs.items() if _is_dataset_input(stimulus)}
+        if not datasets:
+            return None
+
+        input_nodes = self.get_nodes_by_role(NodeRole.INPUT)
+        for receiver in datasets:
+            if receiver not in input_nodes:
+                raise CompositionError(f"A dataset was specified as the input to {getattr(receiver, 'name', receiver)} "
+                                       f"in the inputs to {self.name};  datasets can only be specified for its INPUT "
+                                       f"Nodes.")
+
+        _inputs, num_inputs_sets = self._parse_input_dict(
+            {receiver: stimulus for receiver, stimulus in inputs.items() if receiver not in datasets}
+        )
+        other_inputs_specified = len(datasets) < len(inputs)
+        input_lengths = {len(dataset) for dataset in datasets.values()}
+        if other_inputs_specified and num_inputs_sets != 1:
+            input_lengths.add(num_inputs_sets)
+        if len(input_lengths) != 1:
+            raise CompositionError(f"The input dictionary for {self.name} contains input specifications of different "
+                                   f"lengths ({input_lengths}). The same number of inputs must be provided for each "
+                                   f"receiver in a Composition.")
+        num_inputs_sets = input_lengths.pop()
+
+        for node in _inputs:
+            if node in datasets:
+                _inputs[node] = _DatasetInput(datasets[node], functools.partial(self._parse_dataset_trial_input, node))
+            elif len(_inputs[node]) != num_inputs_sets:
+                # input (or default) for a single trial, which is used for every trial
+                stimulus = _inputs[node]
+                if isinstance(stimulus, np.ndarray):
+                    _inputs[node] = np.broadcast_to(stimulus, (num_inputs_sets,) + stimulus.shape[1:])
+                else:
+                    _inputs[node] = list(stimulus) * num_inputs_sets
+        return _inputs, num_inputs_sets
+
+    def _parse_dataset_trial_input(self, node, stimulus):
+        """Validate and return the input to **node** for a single trial retrieved from a dataset"""
+        if isinstance(stimulus, np.memmap):
+            # copy only the trial's input out of the memory-mapped file
+            stimulus = np.array(stimulus)
+        _input = self._validate_single_input(node, stimulus)
+        if _input is None:
+            input_shape = node.input_CIM.external_input_shape if isinstance(node, Composition) \
+                else node.external_input_shape
+            input_shape = np.atleast_1d(np.squeeze(np.array(input_shape, dtype=object)))
+            raise RunError(f"Input stimulus ({stimulus}) for {node.name} is incompatible with the shape of its "
+                           f"external input ({input_shape}).")
+        return _input
+
     def _parse_names_in_inputs(self, inputs):
         names = []
         # Get keys that are names rather than Components
@@ -9427,6 +10180,10 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                     raise CompositionError(f"{error_text}: requires arg for trial number")
                 else:
                     raise CompositionError(f"Problem with function provided to 'inputs' arg of {self.name}.run")
+        elif isinstance(inputs, PrefetchIterator):
+            # inputs were parsed on the PrefetchIterator's thread
+            inputs = next(inputs)
+            i = 0
         elif isgenerator(inputs):
             inputs, _ = self._parse_input_dict(inputs.__next__())
             i = 0
@@ -9451,6 +10208,11 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         # this method is intended to run DURING a call to Composition.execute
         _inputs = {}
         for node, inp in inputs.items():
+            if (isinstance(inp, np.ndarray) and inp.dtype.kind in 'biuf' and inp.ndim == 2
+                    and inp.shape == self._get_array_input_shape(node)):
+                # e.g., a trial of inputs parsed by _parse_array_inputs
+                _inputs[node] = inp
+                continue
             if isinstance(node, Composition) and type(inp) == dict:
                 inp = node._parse_input_dict(inp)
             if np.array(inp).ndim == 3:
@@ -9501,6 +10263,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
             scheduling_mode: typing.Optional[SchedulingMode] = None,
             execution_mode:pnlvm.ExecutionMode = pnlvm.ExecutionMode.Python,
             default_absolute_time_unit: typing.Optional[pint.Quantity] = None,
+            prefetch_inputs: typing.Optional[int] = None,
             context=None,
             base_context=Context(execution_id=None),
             ):
@@ -9687,6 +10450,11 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
             specifies the absolute duration of a `TIME_STEP`. See
             `Scheduler.default_absolute_time_unit`
 
+        prefetch_inputs : int : default None
+            if **inputs** is a generator or generator function, specifies the number of trials' inputs that are
+            retrieved from it on a background thread ahead of the trial being executed (see
+            `Composition_Prefetch_Inputs`);  if None, each trial's input is retrieved when the trial is executed.
+
         context : `execution_id <Context.execution_id>` : default `default_execution_id`
             context in which the `Composition` will be executed;  set to self.default_execution_id ifunspecified.
 
@@ -9789,14 +10557,11 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
             self._set_up_animation(context)
 
         # SET UP EXECUTION -----------------------------------------------
-        results = self.parameters.results._get(context)
-        if results is None:
-            results = []
-
         self.rich_diverted_reports = None
         self.recorded_reports = None
 
         self._assign_execution_ids(context)
+        results = self._get_results_store(self.parameters.results, context)
 
         scheduler._init_counts(execution_id=context.execution_id)
 
@@ -9884,14 +10649,13 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                 comp_ex_tags = frozenset({"learning"}) if self._is_learning(context) else frozenset()
                 _comp_ex = pnlvm.CompExecution.get(self, context, additional_tags=comp_ex_tags)
                 if execution_mode & pnlvm.ExecutionMode.LLVM:
-                    results += _comp_ex.run(inputs, num_trials, num_inputs_sets)
+                    run_results = _comp_ex.run(inputs, num_trials, num_inputs_sets, prefetch=prefetch_inputs)
                 elif execution_mode & pnlvm.ExecutionMode.PTX:
-                    results += _comp_ex.cuda_run(inputs, num_trials, num_inputs_sets)
+                    run_results = _comp_ex.cuda_run(inputs, num_trials, num_inputs_sets, prefetch=prefetch_inputs)
                 else:
                     assert False, "Unknown execution mode: {}".format(execution_mode)
 
-                # Update the parameter for results
-                self.parameters.results._set(results, context)
+                results.extend(run_results)
 
                 if self._is_learning(context):
                     # copies back matrix to pnl from param struct (after learning)
@@ -9900,7 +10664,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                 self._propagate_most_recent_context(context)
                 # KAM added the [-1] index after changing Composition run()
                 # behavior to return only last trial of run (11/7/18)
-                return results[-1]
+                return run_results[-1]
 
             except Exception as e:
                 if not execution_mode & pnlvm.ExecutionMode._Fallback:
@@ -9916,6 +10680,10 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
         context.execution_phase = execution_phase
 
+        if prefetch_inputs and isgenerator(inputs):
+            # retrieve and parse the inputs for upcoming trials while the current one executes
+            inputs = PrefetchIterator(inputs, prefetch_inputs, transform=lambda inp: self._parse_input_dict(inp)[0])
+
         # EXECUTE TRIALS -------------------------------------------------------------
 
         with Report(self,
@@ -9982,15 +10750,9 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                 # ---------------------------------------------------------------------------------
                 # store the result of this execution in case it will be the final result
 
-                # object.results.append(result)
-                if isinstance(trial_output, collections.abc.Iterable):
-                    result_copy = trial_output.copy()
-                else:
-                    result_copy = trial_output
-
+                # (results copies trial_output)
                 if ContextFlags.SIMULATION_MODE not in context.runmode:
-                    results.append(result_copy)
-                    self.parameters.results._set(results, context)
+                    results.append(trial_output)
 
                     if not self.parameters.retain_old_simulation_data._get():
                         if self.controller is not None:
@@ -10036,8 +10798,15 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
             # Reset input spec for next trial
             self.parameters.input_specification._set(None, context)
 
+            if isinstance(inputs, PrefetchIterator):
+                inputs.close()
+
             scheduler.get_clock(context)._increment_time(TimeScale.RUN)
 
+            # deliver values that were batched in the last time step or trial of the run
+            if isinstance(context.rpc_pipeline, BatchedDeliveryPipeline):
+                context.rpc_pipeline.flush()
+
             self.most_recent_context = context
 
             if self._animate is not False:
@@ -10064,6 +10833,131 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
             return trial_output
 
+    def run_parallel(
+            self,
+            inputs_by_context: dict,
+            n_workers: typing.Optional[int] = None,
+            start_method: typing.Optional[str] = None,
+            **kwargs
+    ):
+        """Run the Composition in each of several `execution contexts <Composition_Execution_Context>` on a pool of
+        worker processes (see `Composition_Parallel_Contexts`).
+
+        Arguments
+        ---------
+
+        inputs_by_context : dict
+            a dictionary, each key of which is a `Context` or `execution_id <Context.execution_id>` and the value of
+            which is the **inputs** specification for the run of the Composition in that context (see `inputs
+            <Composition.run>`).
+
+        n_workers : int : default None
+            maximum number of worker processes used;  if None, the number of processors on the machine is used.
+            No more workers are used than the number of contexts in **inputs_by_context**.
+
+        start_method : str : default None
+            the `multiprocessing start method
+            <https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods>`_ used to create the
+            worker processes;  if None, *fork* is used if it is supported, and otherwise the default for the platform.
+
+        kwargs :
+            any other arguments of `run <Composition.run>` (other than **context**), which are used for the run in
+            every context.
+
+        Returns
+        ---------
+
+        dict of the values returned by `run <Composition.run>` : dict
+          each key is the `execution_id <Context.execution_id>` of a context in **inputs_by_context**, and its value is
+          the list of the `output_values <Mechanism_Base.output_values>` of the Composition's `OUTPUT` `Nodes
+          <Composition_Nodes>` at the end of the last trial run in that context.
+        """
+        if 'context' in kwargs:
+            raise CompositionError(f"The contexts in which {self.name} is run by run_parallel() are specified by the "
+                                   f"keys of its inputs_by_context argument, not by a 'context' argument.")
+        if start_method is None and 'fork' in multiprocessing.get_all_start_methods():
+            start_method = 'fork'
+        elif start_method is not None and start_method not in multiprocessing.get_all_start_methods():
+            raise CompositionError(f"start_method for run_parallel() must be one of "
+                                   f"{multiprocessing.get_all_start_methods()} (got {start_method!r}).")
+        if n_workers is not None and (not isinstance(n_workers, int) or n_workers < 1):
+            raise CompositionError(f"n_workers for run_parallel() must be a positive int or None (got {n_workers}).")
+
+        contexts = [c if isinstance(c, Context) else Context(execution_id=c) for c in inputs_by_context]
+        if not contexts:
+            return {}
+
+        # done here so that it is not repeated by each worker
+        self._analyze_graph()
+        components = parallel._get_components(self)
+        run_args = [parallel._dumps(dict(kwargs, inputs=inputs), components) for inputs in inputs_by_context.values()]
+
+        results = {}
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(n_workers or os.cpu_count() or 1, len(contexts)),
+                mp_context=multiprocessing.get_context(start_method),
+                initializer=parallel._initialize_worker,
+                initargs=(self, components)
+        ) as executor:
+            futures = [executor.submit(parallel._run_context, context.execution_id, args)
+                       for context, args in zip(contexts, run_args)]
+            for context, future in zip(contexts, futures):
+                result, state = parallel._loads(future.result(), components)
+                parallel._set_context_state(components, context.execution_id, state)
+                results[context.execution_id] = result
+
+        self._propagate_most_recent_context(contexts[-1])
+        return results
+
+    @handle_external_context(fallback_most_recent=True)
+    def clone(self, share_structure: bool = True, execution_id=None, context=None):
+        """Return a copy of the Composition that can be run independently of it (see `Composition_Cloning`).
+
+        Arguments
+        ---------
+
+        share_structure : bool : default True
+            specifies whether the copy shares the structure of the Composition -- its `Nodes <Composition_Nodes>`,
+            `Projections <Projection>`, `Functions <Function>` and any compiled code -- and only holds its own values
+            of their stateful `Parameters` (in an `execution context <Composition_Execution_Context>` of its own), or
+            is a full, independent copy of the Composition.
+
+        execution_id : default None
+            the `execution_id <Context.execution_id>` of the context in which a copy that shares the structure of the
+            Composition is run;  if None, a unique execution_id is generated.  Ignored if **share_structure** is False.
+
+        context : Context : default None
+            the context from which the values of stateful Parameters are copied if **share_structure** is True;  if
+            None, the Composition's `most_recent_context <Component.most_recent_context>` is used.
+
+        Returns
+        -------
+
+        CompositionClone or Composition : CompositionClone if **share_structure** is True, otherwise Composition
+        """
+        if not share_structure:
+            return pickle.loads(pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL))
+
+        if execution_id is None:
+            execution_id = f'{self.name}-clone-{uuid.uuid4()}'
+        clone_context = Context(execution_id=execution_id)
+        if clone_context.execution_id == context.execution_id:
+            raise CompositionError(f"The execution_id of a clone of {self.name} must be different from that of the "
+                                   f"context from which it is cloned ({execution_id!r}).")
+
+        self._initialize_from_context(clone_context, context, override=True)
+
+        # the values of stateful Parameters that are updated only by compiled code are held in the compiled state
+        #   of the Composition, which is therefore also copied
+        executions = self._compilation_data.execution._get(context)
+        if executions:
+            self._compilation_data.execution._set(
+                {tags: execution._copy(execution_id) for tags, execution in executions.items()},
+                clone_context
+            )
+
+        return CompositionClone(self, clone_context)
+
     @handle_external_context()
     def learn(
             self,
@@ -10448,6 +11342,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
             context.composition = self
 
             input_nodes = self.get_nodes_by_role(NodeRole.INPUT)
+            execution_plan = self._get_execution_plan()
 
             # if execute was called from command line and no inputs were specified,
             # assign default inputs to highest level composition (i.e. not on any nested Compositions)
@@ -10805,8 +11700,9 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
                 # PURGE LEARNING IF NOT ENABLED ----------------------------------------------------------------
                 # If learning is turned off, check for learning related nodes and remove them from the execution set
-                if not self._is_learning(context):
-                    next_execution_set = next_execution_set - set(self.get_nodes_by_role(NodeRole.LEARNING))
+                is_learning = self._is_learning(context)
+                if not is_learning:
+                    next_execution_set = next_execution_set - execution_plan.learning_nodes
 
                 # Add TIME_STEP header to output report
                 nodes_to_report = any(node.reportOutputPref for node in next_execution_set)
@@ -10823,6 +11719,22 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                     context.execution_phase = ContextFlags.PROCESSING
                     self._animate_execution(next_execution_set, context)
 
+                # Values need only be frozen if a Node in the execution_set projects to another (or itself)
+                freeze_values = execution_plan.uses_frozen_values(next_execution_set)
+
+                # Nodes that do not project to one another can be executed concurrently (if requested)
+                node_executor = None
+                if (len(next_execution_set) > 1
+                        and not execution_mode
+                        and not freeze_values
+                        and self._animate is False
+                        and report._report_output is ReportOutput.OFF
+                        and report._report_progress is ReportProgress.OFF
+                        and context.rpc_pipeline is None
+                        and not self._shares_random_state(next_execution_set, context)):
+                    node_executor = self._get_node_executor()
+                node_futures = []
+
                 # EXECUTE EACH NODE IN EXECUTION SET -------------------------------------------------------------------
                 if execution_scheduler.mode is SchedulingMode.EXACT_TIME:
                     # sort flattened execution set by unflattened position
@@ -10833,6 +11745,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
                 # execute each node with EXECUTING in context
                 for (node_idx, node) in enumerate(next_execution_set):
+                    node_plan = execution_plan[node]
 
                     node.parameters.num_executions.get(context)._set_by_time_scale(TimeScale.TIME_STEP, 0)
                     if new_pass:
@@ -10841,11 +11754,12 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
                     # Store values of all nodes in this execution_set for use by other nodes in the execution set
                     #    throughout this timestep (e.g., for recurrent Projections)
-                    frozen_values[node] = node.get_output_values(context)
+                    if freeze_values:
+                        frozen_values[node] = node.get_output_values(context)
 
                     # FIX: 6/12/19 Deprecate?
                     # Handle input clamping
-                    if node in input_nodes:
+                    if node_plan.is_input:
                         if clamp_input:
                             if node in hard_clamp_inputs:
                                 # clamp = HARD_CLAMP --> "turn off" recurrent projection
@@ -10855,9 +11769,32 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                                 for input_port in node.input_ports:
                                     self.input_CIM_ports[input_port][1].parameters.value._set(0.0, context)
 
+                    # EXECUTE CONCURRENTLY ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+                    if node_executor is not None and node is not self.controller:
+                        execution_runtime_params = {}
+                        if node in runtime_params:
+                            execution_runtime_params.update(
+                                self._get_satisfied_runtime_param_values(runtime_params[node],
+                                                                         execution_scheduler,
+                                                                         context))
+                        node_futures.append(
+                            (node,
+                             node_plan,
+                             node_executor.submit(self._execute_node_concurrently,
+                                                  node,
+                                                  node_plan,
+                                                  copy(context),
+                                                  execution_runtime_params,
+                                                  is_learning,
+                                                  nested,
+                                                  report_num))
+                        )
+                        continue
+
                     # EXECUTE A MECHANISM ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-                    if isinstance(node, Mechanism):
+                    if node_plan.is_mechanism:
 
                         execution_runtime_params = {}
                         if node in runtime_params:
@@ -10873,13 +11810,8 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                         #   for which learning_enabled == True or ONLINE (i.e., not False or AFTER)
                         #   Implementation Note: RecurrentTransferMechanisms are special cased as the
                         #   AutoAssociativeMechanism should be handling learning - not the RTM itself.
-                        if self._is_learning(context) and not isinstance(node, RecurrentTransferMechanism):
-                            projections = set(self.projections).intersection(set(node.path_afferents))
-                            if any([p for p in projections if
-                                    any([a for a in p.parameter_ports[MATRIX].mod_afferents
-                                         if (hasattr(a, 'learning_enabled')
-                                             and a.learning_enabled in {True, ONLINE})])]):
-                                context.replace_flag(ContextFlags.PROCESSING, ContextFlags.LEARNING)
+                        if is_learning and node_plan.is_learning():
+                            context.replace_flag(ContextFlags.PROCESSING, ContextFlags.LEARNING)
 
                         # Execute Mechanism
                         if execution_mode:
@@ -10888,7 +11820,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                             if node is not self.controller:
                                 mech_context = copy(context)
                                 mech_context.source = ContextFlags.COMPOSITION
-                                if nested and node in self.get_nodes_by_role(NodeRole.INPUT):
+                                if nested and node_plan.is_input:
                                     for port in node.input_ports:
                                         port._update(context=context)
                                 node.execute(context=mech_context,
@@ -10897,13 +11829,13 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                                              )
 
                         # Set execution_phase for node's context back to IDLE
-                        if self._is_learning(context):
+                        if is_learning:
                             context.replace_flag(ContextFlags.LEARNING, ContextFlags.PROCESSING)
                         context.remove_flag(ContextFlags.PROCESSING)
 
                     # EXECUTE A NESTED COMPOSITION ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-                    elif isinstance(node, Composition):
+                    elif node_plan.is_composition:
 
                         if execution_mode:
                             # Invoking nested composition passes data via Python
@@ -10971,7 +11903,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
                     # FIX: 6/12/19 Deprecate?
                     # Handle input clamping
-                    if node in input_nodes:
+                    if node_plan.is_input:
                         if clamp_input:
                             if node in pulse_clamp_inputs:
                                 for input_port in node.input_ports:
@@ -10980,16 +11912,37 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
                     # Store new value generated by node,
                     #    then set back to frozen value for use by other nodes in execution_set
-                    new_values[node] = node.get_output_values(context)
-                    for i in range(len(node.output_ports)):
-                        node.output_ports[i].parameters.value._set(frozen_values[node][i], context,
-                                                                   skip_history=True, skip_log=True)
+                    if freeze_values:
+                        new_values[node] = node.get_output_values(context)
+                        for i in range(len(node.output_ports)):
+                            node.output_ports[i].parameters.value._set(frozen_values[node][i], context,
+                                                                       skip_history=True, skip_log=True)
+
+                # Complete the execution of Nodes executed concurrently, in the order of the execution_set
+                if node_futures:
+                    concurrent.futures.wait([future for _, _, future in node_futures])
+                    for node, node_plan, future in node_futures:
+                        future.result()
+                        if node_plan.is_composition:
+                            report(self,
+                                   EXECUTE_REPORT,
+                                   report_num=report_num,
+                                   scheduler=execution_scheduler,
+                                   content='nested_comp',
+                                   context=context,
+                                   node=node)
+                        if node_plan.is_input and clamp_input and node in pulse_clamp_inputs:
+                            for input_port in node.input_ports:
+                                self.input_CIM_ports[input_port][1].parameters.value._set(0, context)
+                    if any(node_plan.is_mechanism for _, node_plan, _ in node_futures):
+                        context.execution_phase = ContextFlags.IDLE
 
                 # Set all nodes to new values
-                for node in next_execution_set:
-                    for i in range(len(node.output_ports)):
-                        node.output_ports[i].parameters.value._set(new_values[node][i], context,
-                                                                   skip_history=True, skip_log=True)
+                if freeze_values:
+                    for node in next_execution_set:
+                        for i in range(len(node.output_ports)):
+                            node.output_ports[i].parameters.value._set(new_values[node][i], context,
+                                                                       skip_history=True, skip_log=True)
 
                 # Complete TIME_STEP entry for output report
                 report(self,
@@ -11019,9 +11972,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
             from psyneulink.library.compositions.autodiffcomposition import AutodiffComposition
             if self._is_learning(context) and not isinstance(self, AutodiffComposition):
                 context.execution_phase = ContextFlags.LEARNING
-                for projection in [p for p in self.projections if
-                                   hasattr(p, 'has_learning_projection') and p.has_learning_projection]:
-                    matrix_parameter_port = projection.parameter_ports[MATRIX]
+                for matrix_parameter_port in execution_plan.learned_after_matrix_ports:
                     if any([lp for lp in matrix_parameter_port.mod_afferents if lp.learning_enabled == AFTER]):
                         matrix_parameter_port._update(context=context)
                 context.remove_flag(ContextFlags.LEARNING)
@@ -11359,7 +12310,8 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
             # Get labels for corresponding values
             values = [node.labeled_output_values for node in output_nodes]
         else:
-            values = self.results[-1] or self.output_values
+            results = self.results
+            values = results[-1] if len(results) else self.output_values
 
         full_output_set = zip(output_nodes, values)
 
@@ -11389,6 +12341,77 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         else:
             return {k:np.array(v).tolist() for k,v in result_set}
 
+    def _get_node_executor(self):
+        """Return the thread pool used to execute the Nodes of an execution set concurrently (see
+        `Composition_Parallel_Execution`), or None if `max_node_workers <Composition.max_node_workers>` is None
+        """
+        max_node_workers = self.parameters.max_node_workers._get()
+        if max_node_workers is None:
+            return None
+
+        if self._node_executor is None or self._node_executor_workers != max_node_workers:
+            if self._node_executor is not None:
+                self._node_executor.shutdown(wait=False)
+            self._node_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_node_workers,
+                thread_name_prefix=f'{self.name} Nodes'
+            )
+            self._node_executor_workers = max_node_workers
+        return self._node_executor
+
+    def _shares_random_state(self, nodes, context):
+        """Return True if two or more of **nodes** (or their functions) use the same random_state"""
+        random_states = set()
+        for node in nodes:
+            for component in (node, getattr(node, 'function', None)):
+                try:
+                    random_state = component.parameters.random_state._get(context)
+                except AttributeError:
+                    continue
+                if random_state is None:
+                    continue
+                if id(random_state) in random_states:
+                    return True
+                random_states.add(id(random_state))
+        return False
+
+    def _execute_node_concurrently(self, node, node_plan, context, runtime_params, is_learning, nested, report_num):
+        """Execute **node** on a thread of the Composition's node executor (see `Composition_Parallel_Execution`).
+
+        **context** is a copy of the context in which the Composition is executing, so that changes to its flags are
+        not seen by the Nodes executed concurrently with **node**.
+        """
+        if node_plan.is_mechanism:
+            context.execution_phase = ContextFlags.PROCESSING
+            if is_learning and node_plan.is_learning():
+                context.replace_flag(ContextFlags.PROCESSING, ContextFlags.LEARNING)
+            if nested and node_plan.is_input:
+                for port in node.input_ports:
+                    port._update(context=context)
+            context.source = ContextFlags.COMPOSITION
+            node.execute(context=context,
+                         report_num=report_num,
+                         runtime_params=runtime_params)
+
+        elif node_plan.is_composition:
+            context.composition = node
+            if ContextFlags.SIMULATION_MODE in context.runmode:
+                context.remove_flag(ContextFlags.SIMULATION_MODE)
+            node.execute(context=context, execution_mode=pnlvm.ExecutionMode.Python)
+
+    def _get_results_store(self, parameter, context):
+        """Return the `ResultsStore` that is the value of **parameter** (results or simulation_results) in
+        **context**, replacing any other value with a ResultsStore initialized from it
+        """
+        results = parameter._get(context)
+        results_limit = self.parameters.results_limit._get(context)
+        if not isinstance(results, ResultsStore):
+            results = ResultsStore(results, limit=results_limit)
+            parameter._set(results, context)
+        else:
+            results.limit = results_limit
+        return results
+
     def _update_learning_parameters(self, context):
         pass
 
@@ -11462,6 +12485,291 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         """
         self._set_all_parameter_properties_recursively(history_max_length=0)
 
+    def _get_state_parameters(self):
+        """Return a dict mapping a path that identifies each `stateful <Parameter.stateful>` Parameter of the
+        Composition and its dependent Components to that Parameter.  Paths are built from the names of Nodes and
+        Projections, and of the Ports and Parameters through which other Components are reached, so that they do not
+        depend on the order in which Components are constructed.
+        """
+        component_paths = {}
+
+        def get_path(component):
+            try:
+                return component_paths[component]
+            except KeyError:
+                pass
+            owner = getattr(component, 'owner', None)
+            if (
+                isinstance(component, (Mechanism, Projection, Composition_Base))
+                or not isinstance(owner, Component)
+                or owner is component
+            ):
+                path = component.name
+            elif isinstance(component, Port):
+                path = f'{get_path(owner)}/{component.name}'
+            else:
+                # e.g., a Function: identified by the Parameter of its owner that holds it
+                holder = component.name
+                for p in sorted(owner.parameters, key=lambda p: p.name):
+                    if not isinstance(p, (ParameterAlias, SharedParameter)) and any(
+                        v is component for v in itertools.chain([p.default_value], p.values.values())
+                    ):
+                        holder = p.name
+                        break
+                path = f'{get_path(owner)}/{holder}'
+            component_paths[component] = path
+            return path
+
+        state_parameters = {}
+        for param, component in self.all_dependent_parameters().items():
+            if param.stateful and not isinstance(param, (ParameterAlias, SharedParameter)):
+                state_parameters[f'{get_path(component)}.{param.name}'] = param
+        return state_parameters
+
+    def _store_scheduler_state(self, execution_id, store):
+        scheduler = self.scheduler
+        if execution_id not in scheduler.clocks:
+            return None
+
+        nodes = list(scheduler.nodes)
+        node_indices = {node: i for i, node in enumerate(nodes)}
+        clock = scheduler.clocks[execution_id]
+
+        # TimeHistoryTree is stored in preorder as the totals of each tree and its number of children
+        history_totals = []
+        history_num_children = []
+
+        def store_history(tree):
+            history_totals.append([tree.total_times.get(ts, 0) for ts in TimeScale])
+            history_num_children.append(len(tree.children))
+            for child in tree.children:
+                store_history(child)
+
+        store_history(clock.history)
+
+        state = {
+            'nodes': [node.name for node in nodes],
+            'history_totals': store(np.asarray(history_totals, dtype=int)),
+            'history_num_children': store(np.asarray(history_num_children, dtype=int)),
+            'time': _store_state_values([clock.history.current_time], ['time'], store),
+            'previous_time': (
+                None if clock.history.previous_time is None
+                else _store_state_values([clock.history.previous_time], ['time'], store)
+            ),
+        }
+
+        if execution_id in scheduler.counts_total:
+            counts_total = scheduler.counts_total[execution_id]
+            counts_useable = scheduler.counts_useable[execution_id]
+            state['counts_total'] = store(np.asarray(
+                [[counts_total[ts].get(n, 0) for n in nodes] for ts in TimeScale], dtype=int
+            ))
+            state['counts_useable'] = store(np.asarray(
+                [[counts_useable[n].get(m, 0) for m in nodes] for n in nodes], dtype=int
+            ))
+
+        if execution_id in scheduler.execution_list:
+            execution_list = scheduler.execution_list[execution_id]
+            state['execution_list_lengths'] = store(np.asarray([len(s) for s in execution_list], dtype=int))
+            state['execution_list'] = store(np.asarray(
+                [node_indices[n] for s in execution_list for n in sorted(s, key=node_indices.__getitem__)], dtype=int
+            ))
+
+        return state
+
+    def _load_scheduler_state(self, execution_id, state, load):
+        scheduler = self.scheduler
+        nodes_by_name = {node.name: node for node in scheduler.nodes}
+        if set(state['nodes']) != set(nodes_by_name):
+            raise CompositionError(f"The saved scheduler state for '{self.name}' does not match its Nodes.")
+        nodes = [nodes_by_name[name] for name in state['nodes']]
+
+        clock = Clock()
+        history_totals = iter(np.array(load(state['history_totals'])).tolist())
+        history_num_children = iter(np.array(load(state['history_num_children'])).tolist())
+
+        def load_history(tree):
+            tree.total_times = {ts: n for ts, n in zip(TimeScale, next(history_totals)) if ts < tree.time_scale}
+            tree.children = [
+                graph_scheduler.time.TimeHistoryTree(
+                    tree.child_time_scale, max_depth=tree.max_depth, index=i, parent=tree, enable_current_time=False
+                )
+                for i in range(next(history_num_children))
+            ]
+            for child in tree.children:
+                load_history(child)
+
+        load_history(clock.history)
+
+        # update current_time in place because the Clock's SimpleTime refers to it
+        current_time = _load_state_values(state['time'], ['time'], 1, load)[0]
+        for ts in TimeScale:
+            clock.history.current_time._set_by_time_scale(ts, current_time._get_by_time_scale(ts))
+        if state['previous_time'] is not None:
+            clock.history.previous_time = _load_state_values(state['previous_time'], ['time'], 1, load)[0]
+
+        scheduler._init_counts(execution_id)
+        scheduler.clocks[execution_id] = clock
+
+        if 'counts_total' in state:
+            counts_total = np.array(load(state['counts_total'])).tolist()
+            counts_useable = np.array(load(state['counts_useable'])).tolist()
+            scheduler.counts_total[execution_id] = {
+                ts: dict(zip(nodes, counts)) for ts, counts in zip(TimeScale, counts_total)
+            }
+            scheduler.counts_useable[execution_id] = {
+                node: dict(zip(nodes, counts)) for node, counts in zip(nodes, counts_useable)
+            }
+
+        if 'execution_list' in state:
+            execution_list = iter(np.array(load(state['execution_list'])).tolist())
+            scheduler.execution_list[execution_id] = [
+                {nodes[next(execution_list)] for _ in range(length)}
+                for length in np.array(load(state['execution_list_lengths'])).tolist()
+            ]
+
+    @handle_external_context(fallback_most_recent=True)
+    def save_state(self, path, context=None):
+        """
+            Saves the execution state of the Composition under **context** to **path**, so that it can be restored
+            later (possibly in another process) using `load_state <Composition.load_state>`.  The state comprises
+            the current value and `history <Parameter.history>` of every `stateful <Parameter.stateful>` Parameter
+            of the Composition and its Components (including the random number generators of stochastic Functions),
+            and the `Clock <Scheduler_Clock>` and execution counts of the `scheduler <Composition.scheduler>` of the
+            Composition and of any nested Compositions (see `Composition_Saving_State`).
+
+            If a context is not provided, the most recent context under which the Composition has executed will be used.
+
+            Arguments
+            ---------
+            path : str or os.PathLike
+                if it ends with ``.npz``, the state is saved in a single uncompressed `numpy .npz file
+                <https://numpy.org/doc/stable/reference/generated/numpy.savez.html>`_;  otherwise, it is treated as
+                a directory in which each array is saved as a separate ``.npy`` file, together with a
+                ``manifest.json`` file describing them;  these arrays are memory-mapped when the state is loaded.
+
+            context : Context
+                the context whose state is saved.
+        """
+        arrays = {}
+
+        def store(arr):
+            key = f'a{len(arrays)}'
+            arrays[key] = np.ascontiguousarray(arr)
+            return key
+
+        execution_id = context.execution_id
+        parameters = {}
+        for key, param in self._get_state_parameters().items():
+            if execution_id not in param.values:
+                continue
+            value = param.values[execution_id]
+            random_state_spec = _store_random_state(value, store)
+            if random_state_spec is not None:
+                parameters[key] = {'random_state': random_state_spec}
+                continue
+            signature = _get_state_signature(value)
+            if signature is None:
+                # e.g., Components, which are part of the structure of the Composition rather than its state
+                continue
+            entry = {'signature': signature, 'value': _store_state_values([value], signature, store)}
+            history = param.history.get(execution_id)
+            if history:
+                history_signature = _get_state_signature(list(history))
+                if history_signature is not None:
+                    entry['history_signature'] = history_signature
+                    entry['history'] = _store_state_values([list(history)], history_signature, store)
+            parameters[key] = entry
+
+        schedulers = {}
+        for comp in [self] + self._get_nested_compositions():
+            scheduler_state = comp._store_scheduler_state(execution_id, store)
+            if scheduler_state is not None:
+                schedulers[comp.name] = scheduler_state
+
+        manifest = json.dumps({'version': _STATE_FORMAT_VERSION, 'parameters': parameters, 'schedulers': schedulers})
+
+        path = os.fspath(path)
+        if path.endswith('.npz'):
+            np.savez(path, **{_STATE_MANIFEST: np.array(manifest)}, **arrays)
+        else:
+            os.makedirs(path, exist_ok=True)
+            for key, arr in arrays.items():
+                np.save(os.path.join(path, f'{key}.npy'), arr)
+            with open(os.path.join(path, _STATE_MANIFEST_FILE), 'w') as f:
+                f.write(manifest)
+
+    @handle_external_context(fallback_most_recent=True)
+    def load_state(self, path, context=None):
+        """
+            Restores the execution state of the Composition under **context** from **path**, as saved by
+            `save_state <Composition.save_state>`.  The Composition must have the same structure (the same names of
+            Nodes, Projections and Ports) as the one whose state was saved;  its Components are not reconstructed,
+            only their stateful Parameters and the scheduling state are replaced, so that a subsequent call to
+            `run <Composition.run>` continues from where the saved one left off (see `Composition_Saving_State`).
+
+            If a context is not provided, the most recent context under which the Composition has executed will be used.
+
+            Arguments
+            ---------
+            path : str or os.PathLike
+                a ``.npz`` file or directory previously written by `save_state <Composition.save_state>`.
+
+            context : Context
+                the context into which the state is loaded;  it need not be the one from which it was saved.
+        """
+        path = os.fspath(path)
+        if path.endswith('.npz'):
+            data = np.load(path, allow_pickle=False)
+            manifest = json.loads(str(data[_STATE_MANIFEST]))
+            load = data.__getitem__
+        else:
+            with open(os.path.join(path, _STATE_MANIFEST_FILE)) as f:
+                manifest = json.load(f)
+
+            def load(key):
+                filename = os.path.join(path, f'{key}.npy')
+                try:
+                    return np.load(filename, mmap_mode='r', allow_pickle=False)
+                except ValueError:
+                    # empty arrays cannot be memory-mapped
+                    return np.load(filename, allow_pickle=False)
+
+        if manifest.get('version') != _STATE_FORMAT_VERSION:
+            raise CompositionError(f"Unsupported state format version ({manifest.get('version')}) in {path}.")
+
+        state_parameters = self._get_state_parameters()
+        unmatched = set(manifest['parameters']) - set(state_parameters)
+        if unmatched:
+            raise CompositionError(f"The state saved in {path} does not match '{self.name}': "
+                                   f"no Parameters corresponding to {sorted(unmatched)}.")
+
+        # establishes values for Parameters that have none in context (e.g., those that were not saved)
+        self._initialize_from_context(context, override=False)
+
+        execution_id = context.execution_id
+        for key, entry in manifest['parameters'].items():
+            param = state_parameters[key]
+            if 'random_state' in entry:
+                param.values[execution_id] = _load_random_state(entry['random_state'], load)
+                continue
+            param.values[execution_id] = _load_state_values(entry['value'], entry['signature'], 1, load)[0]
+            history = []
+            if 'history' in entry:
+                history = _load_state_values(entry['history'], entry['history_signature'], 1, load)[0]
+            param.history[execution_id] = collections.deque(history, maxlen=param.history_max_length)
+
+        compositions = {comp.name: comp for comp in [self] + self._get_nested_compositions()}
+        for name, scheduler_state in manifest['schedulers'].items():
+            try:
+                comp = compositions[name]
+            except KeyError:
+                raise CompositionError(f"The state saved in {path} includes a scheduler for '{name}', "
+                                       f"which is not a Composition in '{self.name}'.")
+            comp._load_scheduler_state(execution_id, scheduler_state, load)
+
+        self._propagate_most_recent_context(context)
+
     def _get_processing_condition_set(self, node):
         dep_group = []
         for group in self.scheduler.consideration_queue:
@@ -12136,9 +13444,89 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         This method invokes :func:`~psyneulink.core.components.functions.fitfunctions.make_likelihood_function`
         on the composition.
         """
+        # imported here, as fitfunctions depends on packages (such as pandas) that are slow to import
+        from psyneulink.core.components.functions.fitfunctions import make_likelihood_function
         return make_likelihood_function(composition=self, *args, **kwargs)
 
 
+class CompositionClone:
+    """
+    CompositionClone(   \
+        composition,    \
+        context)
+
+    Copy of a `Composition` that shares its structure, returned by the Composition's `clone <Composition.clone>`
+    method when **share_structure** is True (see `Composition_Cloning`).  Calls to its `run <CompositionClone.run>`,
+    `learn <CompositionClone.learn>`, `execute <CompositionClone.execute>` and `reset <CompositionClone.reset>` methods
+    are passed to the Composition with the CompositionClone's `context <CompositionClone.context>`, and other
+    attributes are those of the Composition.
+
+    Attributes
+    ----------
+
+    composition : Composition
+        the Composition from which the CompositionClone was made, the structure of which it shares.
+
+    context : Context
+        the `execution context <Composition_Execution_Context>` in which the values of `composition
+        <CompositionClone.composition>`'s stateful `Parameters` for the CompositionClone are held.
+    """
+
+    def __init__(self, composition, context):
+        self.composition = composition
+        self.context = context
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.composition.name!r}, execution_id={self.context.execution_id!r})'
+
+    def __getattr__(self, name):
+        # not found on the CompositionClone itself, so use the attribute of its Composition
+        if name in {'composition', 'context'}:
+            raise AttributeError(name)
+        return getattr(self.composition, name)
+
+    def _call(self, method_name, args, kwargs):
+        if 'context' in kwargs:
+            raise CompositionError(f"A {type(self).__name__} of {self.composition.name} is always run in its own "
+                                   f"context, so a 'context' argument cannot be specified for {method_name}().")
+        return getattr(self.composition, method_name)(*args, context=self.context, **kwargs)
+
+    def run(self, *args, **kwargs):
+        """Call `run <Composition.run>` of `composition <CompositionClone.composition>` in the CompositionClone's
+        `context <CompositionClone.context>`"""
+        return self._call('run', args, kwargs)
+
+    def learn(self, *args, **kwargs):
+        """Call `learn <Composition.learn>` of `composition <CompositionClone.composition>` in the CompositionClone's
+        `context <CompositionClone.context>`"""
+        return self._call('learn', args, kwargs)
+
+    def execute(self, *args, **kwargs):
+        """Call `execute <Composition.execute>` of `composition <CompositionClone.composition>` in the
+        CompositionClone's `context <CompositionClone.context>`"""
+        return self._call('execute', args, kwargs)
+
+    def reset(self, *args, **kwargs):
+        """Call `reset <Composition.reset>` of `composition <CompositionClone.composition>` in the CompositionClone's
+        `context <CompositionClone.context>`"""
+        return self._call('reset', args, kwargs)
+
+    def clone(self, share_structure=True, execution_id=None):
+        """Return a copy of the CompositionClone, made from its `context <CompositionClone.context>` (see
+        `Composition.clone`)"""
+        if not share_structure:
+            raise CompositionError(f"A {type(self).__name__} shares the structure of {self.composition.name}, so it "
+                                   f"can only be cloned with share_structure=True;  use {self.composition.name}.clone() "
+                                   f"to make an independent copy.")
+        return self.composition.clone(execution_id=execution_id, context=self.context)
+
+    @property
+    def results(self):
+        """`results <Composition.results>` of `composition <CompositionClone.composition>` in the
+        CompositionClone's `context <CompositionClone.context>`"""
+        return self.composition.parameters.results.get(self.context)
+
+
 def get_compositions():
     """Return list of Compositions in caller's namespace."""
     frame = inspect.currentframe()
@@ -0,0 +1,152 @@
+# Princeton University licenses this file to You under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.  You may obtain a copy of the License at:
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and limitations under the License.
+
+# ************************************************ Parallel ************************************************************
+
+"""
+Support for `Composition.run_parallel`, which runs a `Composition` in several `execution contexts
+<Composition_Execution_Context>` on a pool of worker processes (see `Composition_Parallel_Contexts`).
+
+Each worker process receives the Composition once, when it is started (either by forking the calling process or by
+pickling the Composition), and then runs it for each context it is given.  Because a worker holds its own copy of the
+Composition, the inputs sent to it and the state it returns are pickled with references to the Composition's
+`Components <Component>` replaced by their position in a list of all of the Components on which the Composition
+depends (see `_get_components`);  that list is sent to each worker along with the Composition, so these references
+are restored to the corresponding Components of the Composition on the other side.  The state returned for a context
+consists of the value, history and log entries of every stateful `Parameter` of those Components, and the counts and
+clocks of the `scheduler <Composition.scheduler>` of each Composition among them.
+"""
+
+import collections
+import io
+import pickle
+
+from psyneulink.core.globals.context import Context
+from psyneulink.core.globals.log import _new_log_entries
+from psyneulink.core.globals.parameters import ParameterAlias, SharedParameter
+
+__all__ = []
+
+_SCHEDULER_STATE = ('counts_useable', 'counts_total', 'clocks', 'execution_list', 'execution_timestamps')
+
+# assigned in each worker process by _initialize_worker
+_composition = None
+_components = None
+
+
+def _get_components(composition):
+    """Return a list of **composition** and all of the Components on which it depends, in the order in which they are
+    reached by traversing `_dependent_components`.
+    """
+    components = []
+    visited = set()
+    pending = [composition]
+    while pending:
+        component = pending.pop()
+        if id(component) in visited:
+            continue
+        visited.add(id(component))
+        components.append(component)
+        pending.extend(reversed(component._dependent_components))
+    return components
+
+
+class _ComponentPickler(pickle.Pickler):
+    def __init__(self, file, components):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._indices = {id(component): i for i, component in enumerate(components)}
+
+    def persistent_id(self, obj):
+        return self._indices.get(id(obj))
+
+
+class _ComponentUnpickler(pickle.Unpickler):
+    def __init__(self, file, components):
+        super().__init__(file)
+        self._components = components
+
+    def persistent_load(self, pid):
+        return self._components[pid]
+
+
+def _dumps(obj, components):
+    file = io.BytesIO()
+    _ComponentPickler(file, components).dump(obj)
+    return file.getvalue()
+
+
+def _loads(data, components):
+    return _ComponentUnpickler(io.BytesIO(data), components).load()
+
+
+def _get_context_state(components, execution_id):
+    """Return the state of **components** in the context with **execution_id**"""
+    from psyneulink.core.compositions.composition import Composition
+
+    parameters = {}
+    schedulers = {}
+    for i, component in enumerate(components):
+        for param in component.stateful_parameters:
+            if isinstance(param, (ParameterAlias, SharedParameter)):
+                continue
+            has_value = execution_id in param.values
+            history = param.history.get(execution_id)
+            log = param.log.get(execution_id) if param.log is not None else None
+            if not has_value and history is None and log is None:
+                continue
+            parameters[i, param.name] = (
+                has_value,
+                param.values.get(execution_id),
+                list(history) if history is not None else None,
+                list(log) if log is not None else None
+            )
+
+        if isinstance(component, Composition):
+            schedulers[i] = {
+                attr: getattr(component.scheduler, attr)[execution_id]
+                for attr in _SCHEDULER_STATE if execution_id in getattr(component.scheduler, attr)
+            }
+
+    return parameters, schedulers
+
+
+def _set_context_state(components, execution_id, state):
+    """Assign **state**, returned by `_get_context_state`, to **components** in the context with **execution_id**"""
+    parameters, schedulers = state
+    for (i, name), (has_value, value, history, log) in parameters.items():
+        param = getattr(components[i].parameters, name)
+        if has_value:
+            param.values[execution_id] = value
+        if history is not None:
+            param.history[execution_id] = collections.deque(history, maxlen=param.history_max_length)
+        if log is not None and param.log is not None:
+            entries = _new_log_entries(param.name)
+            for entry in log:
+                entries.append(entry)
+            param.log[execution_id] = entries
+
+    for i, scheduler_state in schedulers.items():
+        scheduler = components[i].scheduler
+        for attr, value in scheduler_state.items():
+            getattr(scheduler, attr)[execution_id] = value
+
+
+def _initialize_worker(composition, components):
+    # components is passed (rather than found again by _get_components) so that, if the Composition is pickled to
+    #   start the worker, it is in the same order as in the calling process
+    global _composition, _components
+    _composition = composition
+    _components = components
+
+
+def _run_context(execution_id, run_args):
+    """Run the Composition of the worker in the context with **execution_id**, and return the pickled result of the
+    run together with the state of the Composition in that context
+    """
+    run_kwargs = _loads(run_args, _components)
+    result = _composition.run(context=Context(execution_id=execution_id), **run_kwargs)
+    return _dumps((result, _get_context_state(_components, execution_id)), _components)
@@ -144,6 +144,7 @@ Reporting Options
 
 import re
 import sys
+import threading
 import types
 import warnings
 from enum import Enum, Flag, auto
@@ -680,6 +681,8 @@ class Report:
     """
 
     _instance = None
+    # serializes reference counting by Nodes executed concurrently (see Composition_Parallel_Execution)
+    _lock = threading.RLock()
 
     def __new__(cls,
                 caller,
@@ -773,6 +776,11 @@ class Report:
         create a completely new singleton instance.
         """
         cls._instance = None
+        # release the Compositions reported on, which are otherwise kept alive by the class until the next report
+        cls._outermost_comp = None
+        cls.output_reports = {}
+        cls._execution_stack = []
+        cls._trial_header_stack = []
 
     def __enter__(self):
         """
@@ -782,13 +790,14 @@ class Report:
             active context.
         """
 
-        # If this is the top level call to with Report(), start progress reporting
-        if self._ref_count == 0:
-            if self._use_rich:
-                self._rich_progress.start()
+        with self._lock:
+            # If this is the top level call to with Report(), start progress reporting
+            if self._ref_count == 0:
+                if self._use_rich:
+                    self._rich_progress.start()
 
-        # Keep track of a reference count of how many times we have given a reference.
-        self._ref_count = self._ref_count + 1
+            # Keep track of a reference count of how many times we have given a reference.
+            self._ref_count = self._ref_count + 1
 
         return self
 
@@ -803,19 +812,20 @@ class Report:
             Returns None so that exceptions generated within the context are propogated back up
         """
 
-        # We are releasing this reference
-        self._ref_count = self._ref_count - 1
+        with self._lock:
+            # We are releasing this reference
+            self._ref_count = self._ref_count - 1
 
-        # If all references are released, stop progress reporting and destroy the singleton.
-        if self._ref_count == 0:
+            # If all references are released, stop progress reporting and destroy the singleton.
+            if self._ref_count == 0:
 
-            # If the rich progress bar is not disabled, stop it.
-            if self._use_rich:
-                self._rich_progress.stop()
+                # If the rich progress bar is not disabled, stop it.
+                if self._use_rich:
+                    self._rich_progress.stop()
 
-            # Destroy the singleton, very important. If we don't do this, the rich progress
-            # bar will grow and grow and never be deallocated until the end of program.
-            Report._destroy()
+                # Destroy the singleton, very important. If we don't do this, the rich progress
+                # bar will grow and grow and never be deallocated until the end of program.
+                Report._destroy()
 
     def start_report(self, comp, num_trials, context) -> Optional[int]:
         """
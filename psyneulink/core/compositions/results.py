@@ -0,0 +1,273 @@
+# Princeton University licenses this file to You under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.  You may obtain a copy of the License at:
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and limitations under the License.
+
+# ************************************************ Results *************************************************************
+
+"""
+A `ResultsStore` holds the `results <Composition.results>` and `simulation_results <Composition.simulation_results>`
+of a `Composition`.  It behaves like the list in which these were previously stored:  each item is the list of the
+`output_values <Mechanism_Base.output_values>` of the Composition's `OUTPUT` `Nodes <Composition_Nodes>` for a
+`TRIAL <TimeScale.TRIAL>`, items can be indexed, sliced, iterated over and compared with lists, and new items are
+added using ``append`` or ``extend``.  However, as long as the output of every trial has the same shape, the values
+are stored in a single preallocated np.ndarray, the capacity of which is doubled when it is full, rather than as a
+separate list of arrays for each trial.  The items returned by indexing are views of that array, and the results of
+all trials can be retrieved as a single array using `as_array <ResultsStore.as_array>`.  If the output of a trial
+has a different shape (or is not numeric), the ResultsStore reverts to storing each trial's output as is.
+
+If **limit** is specified, only the results of the most recent **limit** trials are retained:  the ResultsStore acts
+as a ring buffer, in which the result of each new trial replaces that of the oldest one.  Since the items of a
+ResultsStore are views of its array, those of a full ring buffer are overwritten by subsequent trials;  they should
+be copied if they are needed beyond that point.  The limit for a Composition is specified by its `results_limit
+<Composition.results_limit>` attribute.
+"""
+
+import collections
+import copy
+import warnings
+
+import numpy as np
+
+from psyneulink.core.globals.utilities import convert_all_elements_to_np_array
+
+__all__ = [
+    'ResultsStore'
+]
+
+_NUMERIC_KINDS = frozenset('biuf')
+_INITIAL_CAPACITY = 8
+
+
+class ResultsStore(collections.abc.MutableSequence):
+    """
+    ResultsStore(    \
+        results=None, \
+        limit=None)
+
+    List-like storage of the results of a Composition, one item per `TRIAL <TimeScale.TRIAL>`.
+
+    Arguments
+    ---------
+
+    results : list : default None
+        results with which the ResultsStore is initialized.
+
+    limit : int : default None
+        maximum number of results retained;  if None, all results are retained.
+
+    Attributes
+    ----------
+
+    limit : int or None
+        maximum number of results retained, after which the oldest result is discarded each time a new one is added;
+        can be changed, in which case the oldest results in excess of the new limit are discarded.
+
+    is_array : bool
+        True if the results are stored in a single np.ndarray (i.e., they all have the same shape).
+    """
+
+    def __init__(self, results=None, limit=None):
+        self._validate_limit(limit)
+        self._limit = limit
+        self._clear()
+        if results is not None:
+            self.extend(results)
+
+    @staticmethod
+    def _validate_limit(limit):
+        if limit is not None and (not isinstance(limit, (int, np.integer)) or isinstance(limit, bool) or limit < 1):
+            raise ValueError(f"limit for a {ResultsStore.__name__} must be a positive int or None (got {limit!r}).")
+
+    def _clear(self):
+        # items are stored either in _array, a ring buffer of trial results that starts at _start,
+        #   or, if they do not all have the same shape, in _items
+        self._array = None
+        self._start = 0
+        self._length = 0
+        self._items = None
+
+    @property
+    def limit(self):
+        return self._limit
+
+    @limit.setter
+    def limit(self, limit):
+        if limit == self._limit:
+            return
+        self._validate_limit(limit)
+        items = list(self) if self._items is not None else None
+        array = self.as_array() if self._array is not None else None
+        self._limit = limit
+        self._clear()
+        if array is not None and len(array):
+            array = array[-limit:] if limit is not None else array
+            self._array = array.copy()
+            self._length = len(array)
+        elif items is not None:
+            self._items = collections.deque(items, maxlen=limit)
+
+    @property
+    def is_array(self):
+        return self._items is None
+
+    def _as_trial_array(self, value):
+        """Return **value** as an array that can be stored in _array, or None if it cannot"""
+        if self._array is None:
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter('error', np.VisibleDeprecationWarning)
+                    array = np.asarray(value)
+            except (ValueError, np.VisibleDeprecationWarning):
+                # ragged
+                return None
+            if array.dtype.kind not in _NUMERIC_KINDS:
+                return None
+            return array
+
+        try:
+            array = np.asarray(value, dtype=self._array.dtype)
+        except (TypeError, ValueError):
+            return None
+        if array.shape != self._array.shape[1:]:
+            return None
+        return array
+
+    def _store_items(self):
+        """Revert to storing each result as an item of a deque"""
+        items = list(self)
+        self._clear()
+        self._items = collections.deque(items, maxlen=self._limit)
+
+    def _grow(self, trial_array):
+        if self._array is None:
+            capacity = _INITIAL_CAPACITY
+            if self._limit is not None:
+                capacity = min(capacity, self._limit)
+            dtype = np.result_type(trial_array.dtype, float)
+            self._array = np.empty((capacity,) + trial_array.shape, dtype=dtype)
+            return
+
+        capacity = max(2 * len(self._array), _INITIAL_CAPACITY)
+        if self._limit is not None:
+            capacity = min(capacity, self._limit)
+        array = np.empty((capacity,) + self._array.shape[1:], dtype=self._array.dtype)
+        array[:self._length] = self.as_array()
+        self._array = array
+        self._start = 0
+
+    def append(self, value):
+        """Add **value** as the result of the most recent trial"""
+        if self._items is None:
+            trial_array = self._as_trial_array(value)
+            if trial_array is not None:
+                if self._array is None or self._length == len(self._array) and len(self._array) != self._limit:
+                    self._grow(trial_array)
+
+                capacity = len(self._array)
+                self._array[(self._start + self._length) % capacity] = trial_array
+                if self._length == capacity:
+                    # full ring buffer: the oldest result was overwritten
+                    self._start = (self._start + 1) % capacity
+                else:
+                    self._length += 1
+                return
+
+            self._store_items()
+
+        try:
+            value = value.copy()
+        except AttributeError:
+            pass
+        self._items.append(value)
+
+    def clear(self):
+        self._clear()
+
+    def as_array(self):
+        """Return the results of all trials as an np.ndarray, the first dimension of which is trials.
+
+        If `is_array <ResultsStore.is_array>` is True, this is a view of the ResultsStore's array unless the ring
+        buffer has wrapped around, in which case it is a copy.
+        """
+        if self._items is not None:
+            return convert_all_elements_to_np_array(list(self._items))
+        if self._array is None:
+            return np.empty((0,))
+
+        end = self._start + self._length
+        if end <= len(self._array):
+            return self._array[self._start:end]
+        return np.concatenate((self._array[self._start:], self._array[:end - len(self._array)]))
+
+    def __array__(self, dtype=None):
+        return np.asarray(self.as_array(), dtype=dtype)
+
+    def _get_item(self, index):
+        item = self._array[(self._start + index) % len(self._array)]
+        # as for previous results, which were lists of arrays (one for each OUTPUT Node's output_value)
+        return list(item) if item.ndim > 1 else item
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if self._items is not None:
+            return self._items[index]
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(f'{type(self).__name__} index out of range')
+        return self._get_item(index)
+
+    def __setitem__(self, index, value):
+        self._store_items()
+        if isinstance(index, slice):
+            items = list(self._items)
+            items[index] = value
+            self._items = collections.deque(items, maxlen=self._limit)
+        else:
+            self._items[index] = value
+
+    def __delitem__(self, index):
+        self._store_items()
+        if isinstance(index, slice):
+            items = list(self._items)
+            del items[index]
+            self._items = collections.deque(items, maxlen=self._limit)
+        else:
+            del self._items[index]
+
+    def insert(self, index, value):
+        self._store_items()
+        self._items.insert(index, value)
+
+    def __len__(self):
+        if self._items is not None:
+            return len(self._items)
+        return self._length
+
+    def __iter__(self):
+        if self._items is not None:
+            yield from self._items
+        else:
+            for i in range(self._length):
+                yield self._get_item(i)
+
+    def __eq__(self, other):
+        if isinstance(other, ResultsStore):
+            other = list(other)
+        if not isinstance(other, list):
+            return NotImplemented
+        return list(self) == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def copy(self):
+        return copy.deepcopy(self)
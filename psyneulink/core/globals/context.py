@@ -323,7 +323,7 @@ class Context():
 
     rpc_pipeline : Queue
       queue to populate with messages for external environment in cases where execution was triggered via RPC call
-      (e.g. through PsyNeuLinkView).
+      (e.g. through PsyNeuLinkView);  a `BatchedDeliveryPipeline` can be used to deliver the values in batches.
 
     """
 
@@ -564,6 +564,21 @@ def _get_context(context:tc.any(ContextFlags, Context, str)):
     return context_flag
 
 
+_context_string_cache = {}
+
+
+def _get_context_string(condition_flags):
+    """Return `ContextFlags._get_context_string` of **condition_flags** (with its default arguments), computed only
+    once for each combination of flags
+    """
+    try:
+        return _context_string_cache[condition_flags]
+    except KeyError:
+        context_string = ContextFlags._get_context_string(condition_flags)
+        _context_string_cache[condition_flags] = context_string
+        return context_string
+
+
 def _get_time(component, context):
     """Get time from Scheduler of Composition in which Component is being executed.
 
@@ -606,12 +621,18 @@ def _get_time(component, context):
     if composition and hasattr(composition, 'scheduler'):
         execution_flags = context.execution_phase
         try:
-            if execution_flags & (ContextFlags.PROCESSING | ContextFlags.LEARNING | ContextFlags.IDLE):
-                t = composition.scheduler.get_clock(context).time
-                t = time(t.run, t.trial, t.pass_, t.time_step)
-            elif execution_flags & ContextFlags.CONTROL:
-                t = composition.scheduler.get_clock(context).time
-                t = time(t.run, t.trial, t.pass_, t.time_step)
+            if execution_flags & (
+                ContextFlags.PROCESSING | ContextFlags.LEARNING | ContextFlags.IDLE | ContextFlags.CONTROL
+            ):
+                clock = composition.scheduler.get_clock(context)
+                # time stamp is created once, and shared until the clock's time is incremented
+                t = getattr(clock, '_time_stamp', None)
+                if t is None:
+                    from psyneulink.core.scheduling.time import Clock
+                    current_time = clock.time
+                    t = time(current_time.run, current_time.trial, current_time.pass_, current_time.time_step)
+                    if isinstance(clock, Clock):
+                        clock._time_stamp = t
             else:
                 t = None
         except KeyError:
@@ -148,6 +148,30 @@ that the `value <Mechanism_Base.value>` of ``my_mech`` be logged both during exe
    To log its `value <Component.value>` at the start of a `TRIAL <TimeScale.TRIAL>`, use its `log_values
    <Component.log_values>` method in the **call_before_trial** argument of the System's `run <System.run>` method.
 
+.. _Log_Backends:
+
+*Log Backends*
+~~~~~~~~~~~~~~
+
+By default, the entries logged for each item are stored as `LogEntry` tuples in a ``collections.deque``.  For long
+runs, or when many items are logged, the `COLUMNAR <LogBackend.COLUMNAR>` backend can be used instead;  this stores the
+time stamps and values of the entries in growable NumPy arrays (see `ColumnarLogEntries`), so that `nparray_dictionary
+<Log.nparray_dictionary>` can return views of them without assembling the entries one at a time.  The backend is
+specified using `set_log_backend`, and applies to entries logged for any item and `execution context <Context>` that
+does not already have entries in its Log::
+
+    >>> pnl.set_log_backend(pnl.LogBackend.COLUMNAR)
+    >>> pnl.set_log_backend(pnl.LogBackend.DEQUE)
+
+.. _Log_Spilling:
+
+For runs that are too long for their logged values to be held in memory, a **spill_directory** can also be specified
+in the call to `set_log_backend`.  The entries for each item and `execution context <Context>` are then written to
+``.npy`` files in a subdirectory of it each time **chunk_size** of them have been logged, so that no more than that
+number are held in memory.  The entries are read back from disk when they are accessed (e.g., by `nparray_dictionary
+<Log.nparray_dictionary>` or `csv <Log.csv>`), and the files are deleted when the entries are cleared from the Log
+(e.g., using `clear_entries <Log.clear_entries>`) or the Component to which they belong is deleted.
+
 .. _Log_Execution:
 
 Execution
@@ -380,8 +404,15 @@ Class Reference
 ---------------
 
 """
+import bisect
+import collections
+import copy
 import enum
+import os
+import shutil
+import tempfile
 import warnings
+import weakref
 
 from collections import OrderedDict, namedtuple
 from collections.abc import MutableMapping
@@ -395,7 +426,8 @@ from psyneulink.core.globals.keywords import ALL, CONTEXT, EID_SIMULATION, FUNCT
 from psyneulink.core.globals.utilities import AutoNumber, ContentAddressableList, is_component
 
 __all__ = [
-    'EntriesDict', 'Log', 'LogEntry', 'LogError', 'LogCondition'
+    'ColumnarLogEntries', 'EntriesDict', 'get_log_backend', 'Log', 'LogBackend', 'LogEntry', 'LogError',
+    'LogCondition', 'set_log_backend'
 ]
 
 
@@ -505,6 +537,333 @@ def _time_string(time):
     return time_str
 
 
+class LogBackend(enum.Enum):
+    """Specifies the data structure used to store the `entries <Log.entries>` logged for each Parameter and
+    `execution context <Context>` (see `Log_Backends`).
+    """
+    DEQUE = 'deque'
+    """Each entry is stored as a `LogEntry` tuple appended to a ``collections.deque``."""
+    COLUMNAR = 'columnar'
+    """Entries are stored in growable NumPy buffers (see `ColumnarLogEntries`)."""
+
+
+_log_backend = LogBackend.DEQUE
+_log_spill_directory = None
+_log_spill_chunk_size = None
+DEFAULT_SPILL_CHUNK_SIZE = 10000
+
+
+def set_log_backend(backend, spill_directory=None, chunk_size=DEFAULT_SPILL_CHUNK_SIZE):
+    """Set the `LogBackend` used for Parameter logs created after the call (see `Log_Backends`).
+
+    Arguments
+    ---------
+
+    backend : LogBackend or str
+        the backend to use;  can be specified by its name (e.g., ``'columnar'``).
+
+    spill_directory : str, os.PathLike or None : default None
+        if specified, entries are periodically written to files in this directory rather than kept in memory
+        (see `Log_Spilling`);  requires the `COLUMNAR <LogBackend.COLUMNAR>` backend.
+
+    chunk_size : int : default 10000
+        the number of entries for a Parameter and `execution context <Context>` that are held in memory before
+        they are written to disk;  ignored if **spill_directory** is not specified.
+    """
+    global _log_backend, _log_spill_directory, _log_spill_chunk_size
+    try:
+        backend = LogBackend(backend.lower() if isinstance(backend, str) else backend)
+    except ValueError:
+        raise LogError(f"'{backend}' is not a valid {LogBackend.__name__}; "
+                       f"must be one of {[b.value for b in LogBackend]}")
+
+    if spill_directory is not None:
+        if backend is not LogBackend.COLUMNAR:
+            raise LogError(f"spill_directory can only be used with {LogBackend.COLUMNAR}")
+        if chunk_size < 1:
+            raise LogError(f"chunk_size must be a positive integer (got {chunk_size})")
+        os.makedirs(spill_directory, exist_ok=True)
+        _log_spill_chunk_size = chunk_size
+    else:
+        _log_spill_chunk_size = None
+
+    _log_backend = backend
+    _log_spill_directory = spill_directory
+
+
+def get_log_backend():
+    """Return the `LogBackend` currently used for new Parameter logs."""
+    return _log_backend
+
+
+def _new_log_entries(name=None):
+    if _log_backend is LogBackend.COLUMNAR:
+        return ColumnarLogEntries(
+            spill_directory=_log_spill_directory,
+            chunk_size=_log_spill_chunk_size,
+            name=name
+        )
+    return collections.deque([])
+
+
+class ColumnarLogEntries:
+    """Sequence of `LogEntry` items for one Parameter and `execution context <Context>`, stored column-wise.
+
+    The `RUN`, `TRIAL <TimeScale.TRIAL>`, `PASS` and `TIME_STEP` of each entry are stored in a single int array
+    (with -1 designating a time that was not recorded), and values that share a shape and numeric dtype are stored
+    in a single dense array with the number of entries as its first axis;  both are grown geometrically as entries
+    are appended.  If a value cannot be stored in the dense array (e.g., it has a different shape than those logged
+    before it), the value array is converted to an object array holding each value.
+
+    If **spill_directory** is specified, the entries are written to a subdirectory of it as a chunk of ``.npy`` files
+    each time **chunk_size** entries have been logged, and are then removed from memory (see `Log_Spilling`).
+
+    Indexing and iteration produce `LogEntry` tuples, so that a ColumnarLogEntries can be used wherever the
+    ``deque`` of the `DEQUE <LogBackend.DEQUE>` backend is expected;  `times <ColumnarLogEntries.times>` and
+    `values <ColumnarLogEntries.values>` return views of the underlying buffers if no entries have been spilled.
+    """
+    _initial_capacity = 16
+
+    def __init__(self, spill_directory=None, chunk_size=None, name=None):
+        self._spill_directory = spill_directory
+        self._chunk_size = chunk_size or DEFAULT_SPILL_CHUNK_SIZE
+        self._name = name
+        self._path = None
+        # one (first index, length, value shape or None if not dense) item for each chunk written to disk
+        self._chunks = []
+        self._num_spilled = 0
+        self._loaded_chunk = None
+        self._reset_buffers()
+
+    def _reset_buffers(self):
+        self._length = 0
+        self._times = np.empty((self._initial_capacity, NUM_TIME_SCALES), dtype=np.int64)
+        self._contexts = []
+        self._values = None
+
+    def __len__(self):
+        return self._num_spilled + self._length
+
+    def __getitem__(self, index):
+        if not isinstance(index, (int, np.integer)):
+            raise TypeError(f'{type(self).__name__} indices must be integers')
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f'{type(self).__name__} index out of range')
+
+        if index < self._num_spilled:
+            times, contexts, values = self._load_chunk(bisect.bisect_right(self._chunks, (index, np.inf)) - 1)
+            index -= self._chunks[self._loaded_chunk[0]][0]
+        else:
+            times, contexts, values = self._times, self._contexts, self._values
+            index -= self._num_spilled
+
+        value = values[index]
+        if values.dtype != object:
+            value = np.array(value)
+        return LogEntry(
+            time_object(*(None if t < 0 else int(t) for t in times[index])),
+            contexts[index],
+            value
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        return f'{type(self).__name__}({list(self)})'
+
+    def __deepcopy__(self, memo):
+        result = type(self)(spill_directory=self._spill_directory, chunk_size=self._chunk_size, name=self._name)
+        memo[id(self)] = result
+
+        result._length = self._length
+        result._times = self._times.copy()
+        result._contexts = list(self._contexts)
+        result._values = copy.deepcopy(self._values, memo)
+        if self._path is not None:
+            result._create_spill_path()
+            for file in os.listdir(self._path):
+                shutil.copy2(os.path.join(self._path, file), result._path)
+            result._chunks = list(self._chunks)
+            result._num_spilled = self._num_spilled
+
+        return result
+
+    def append(self, entry):
+        index = self._length
+        if index == len(self._times):
+            self._grow()
+
+        self._times[index] = [-1 if t is None else t for t in (entry.time or (None,) * NUM_TIME_SCALES)]
+        self._contexts.append(entry.context)
+        self._store_value(index, entry.value)
+        self._length += 1
+
+        if self._spill_directory is not None and self._length >= self._chunk_size:
+            self._spill()
+
+    def clear(self):
+        # new buffers are allocated so that views returned before clearing are not overwritten
+        self._remove_spilled()
+        self._reset_buffers()
+
+    def _grow(self):
+        capacity = 2 * len(self._times)
+        if self._spill_directory is not None:
+            capacity = min(capacity, self._chunk_size)
+
+        times = np.empty((capacity, NUM_TIME_SCALES), dtype=self._times.dtype)
+        times[:self._length] = self._times[:self._length]
+        self._times = times
+
+        if self._values is not None:
+            values = np.empty((capacity, *self._values.shape[1:]), dtype=self._values.dtype)
+            values[:self._length] = self._values[:self._length]
+            self._values = values
+
+    def _store_value(self, index, value):
+        if self._values is None:
+            arr = None if value is None else np.asarray(value)
+            if arr is None or arr.dtype.kind not in 'biufc':
+                self._values = np.empty(len(self._times), dtype=object)
+            else:
+                self._values = np.empty((len(self._times), *arr.shape), dtype=arr.dtype)
+
+        if self._values.dtype == object:
+            self._values[index] = value
+            return
+
+        arr = None if value is None else np.asarray(value)
+        if arr is None or arr.dtype.kind not in 'biufc' or arr.shape != self._values.shape[1:]:
+            self._convert_to_object_values()
+            self._values[index] = value
+            return
+
+        if not np.can_cast(arr.dtype, self._values.dtype):
+            self._values = self._values.astype(np.result_type(arr.dtype, self._values.dtype))
+        self._values[index] = arr
+
+    def _convert_to_object_values(self):
+        values = np.empty(len(self._values), dtype=object)
+        for i in range(self._length):
+            values[i] = self._values[i]
+        self._values = values
+
+    def _chunk_file(self, chunk, field):
+        return os.path.join(self._path, f'{chunk}_{field}.npy')
+
+    def _spill(self):
+        if self._length == 0:
+            return
+
+        if self._path is None:
+            self._create_spill_path()
+
+        chunk = len(self._chunks)
+        values = self._values[:self._length]
+        np.save(self._chunk_file(chunk, 'times'), self._times[:self._length])
+        np.save(self._chunk_file(chunk, 'contexts'), np.array(self._contexts, dtype=str))
+        np.save(self._chunk_file(chunk, 'values'), values, allow_pickle=values.dtype == object)
+
+        self._chunks.append((self._num_spilled, self._length, values.shape[1:] if self.is_dense else None))
+        self._num_spilled += self._length
+        self._reset_buffers()
+
+    def _create_spill_path(self):
+        prefix = f'{self._name}-' if self._name is not None else 'log-'
+        self._path = tempfile.mkdtemp(prefix=prefix, dir=self._spill_directory)
+        # spilled entries belong to this object, so are removed along with it
+        self._remove_spilled_files = weakref.finalize(self, shutil.rmtree, self._path, ignore_errors=True)
+
+    def _load_chunk(self, chunk):
+        if self._loaded_chunk is None or self._loaded_chunk[0] != chunk:
+            dense = self._chunks[chunk][2] is not None
+            self._loaded_chunk = (
+                chunk,
+                np.load(self._chunk_file(chunk, 'times'), mmap_mode='r'),
+                np.load(self._chunk_file(chunk, 'contexts')),
+                np.load(self._chunk_file(chunk, 'values'), mmap_mode='r' if dense else None, allow_pickle=not dense)
+            )
+        return self._loaded_chunk[1:]
+
+    def _remove_spilled(self):
+        self._loaded_chunk = None
+        if self._path is not None:
+            self._remove_spilled_files()
+        self._path = None
+        self._chunks = []
+        self._num_spilled = 0
+
+    @property
+    def times(self):
+        """Times of the entries, with one row per entry and one column per time scale."""
+        if not self._chunks:
+            return self._times[:self._length]
+        return np.concatenate(
+            [self._load_chunk(i)[0] for i in range(len(self._chunks))] + [self._times[:self._length]]
+        )
+
+    @property
+    def values(self):
+        """Logged values, with the entries along the first axis."""
+        if not self._chunks:
+            if self._values is None:
+                return np.empty(0)
+            return self._values[:self._length]
+
+        values = [self._load_chunk(i)[2] for i in range(len(self._chunks))]
+        if self._length > 0:
+            values.append(self._values[:self._length])
+        if self.is_dense:
+            return np.concatenate(values)
+
+        object_values = np.empty(len(self), dtype=object)
+        i = 0
+        for chunk_values in values:
+            for value in chunk_values:
+                object_values[i] = np.array(value) if chunk_values.dtype != object else value
+                i += 1
+        return object_values
+
+    @property
+    def contexts(self):
+        """List of the context strings of the entries."""
+        return [str(c) for i in range(len(self._chunks)) for c in self._load_chunk(i)[1]] + self._contexts
+
+    @property
+    def is_dense(self):
+        """`True` if all values are stored in numeric arrays of the same shape."""
+        shapes = {shape for _, _, shape in self._chunks}
+        if self._length > 0:
+            shapes.add(self._values.shape[1:] if self._values.dtype != object else None)
+        return len(shapes) == 1 and None not in shapes
+
+    @property
+    def has_times(self):
+        """`True` if every entry was logged with a complete time stamp."""
+        return bool(np.all(self.times >= 0))
+
+    @property
+    def spilled_path(self):
+        """The directory to which entries have been written, or `None` if none have been written."""
+        return self._path
+
+    def _times_strictly_increasing(self):
+        times = self.times
+        if len(times) < 2:
+            return True
+        diffs = np.diff(times, axis=0)
+        changed = diffs != 0
+        first_changed = np.argmax(changed, axis=1)
+        return bool(
+            np.all(changed.any(axis=1))
+            and np.all(diffs[np.arange(len(diffs)), first_changed] > 0)
+        )
+
+
 #region Custom Entries Dict
 # Modified from: http://stackoverflow.com/questions/7760916/correct-useage-of-getter-setter-for-dictionary-values
 class EntriesDict(MutableMapping,dict):
@@ -1479,6 +1838,11 @@ class Log:
            For data without time stamps, the nth item in each dictionary key (i.e., data in the same "column")
            is not guaranteed to have been logged at the same time point across all keys (Components).
 
+        .. note::
+           If the entries are stored using the `COLUMNAR <LogBackend.COLUMNAR>` backend and were logged at the same
+           time points, the arrays returned are views of the Log's buffers rather than copies (see `Log_Backends`);
+           they should be copied before being modified.
+
 
         Arguments
         ---------
@@ -1509,6 +1873,11 @@ class Log:
             contexts = [eid for eid in contexts if EID_SIMULATION not in str(eid)]
 
         for eid in contexts:
+            columnar_dict = self._columnar_nparray_dictionary(entries, eid)
+            if columnar_dict is not None:
+                log_dict[eid] = columnar_dict
+                continue
+
             time_values = self._parse_entries_for_time_values(entries, execution_id=eid)
             log_dict[eid] = OrderedDict()
 
@@ -1535,6 +1904,41 @@ class Log:
 
         return log_dict
 
+    def _columnar_nparray_dictionary(self, entries, execution_id):
+        """Return the nparray_dictionary entry for **execution_id** built from views of `ColumnarLogEntries`
+
+        Returns None if any entry is not stored in a dense `ColumnarLogEntries`, or if the entries do not share
+        a single strictly increasing sequence of time stamps (or, if none are time stamped, a common length), in
+        which case the entries must be aligned by `_assemble_entry_data`.
+        """
+        logs = []
+        for entry in entries:
+            param = self._get_parameter_from_item_string(entry)
+            log = param.log.get(execution_id) if param is not None and param.log is not None else None
+            if not isinstance(log, ColumnarLogEntries) or len(log) == 0 or not log.is_dense:
+                return None
+            logs.append(log)
+
+        first = logs[0]
+        columnar_dict = OrderedDict()
+        if all(log.has_times for log in logs):
+            if (
+                not all(np.array_equal(log.times, first.times) for log in logs[1:])
+                or not first._times_strictly_increasing()
+            ):
+                return None
+            for i in range(NUM_TIME_SCALES):
+                columnar_dict[TIME_SCALE_NAMES[i].capitalize()] = first.times[:, i:i + 1]
+        elif all(np.all(log.times < 0) and len(log) == len(first) for log in logs):
+            columnar_dict["Index"] = np.arange(len(first)).reshape(len(first), 1)
+        else:
+            return None
+
+        for entry, log in zip(entries, logs):
+            columnar_dict[entry] = log.values
+
+        return columnar_dict
+
     @tc.typecheck
     def csv(self, entries=None, owner_name:bool=False, quotes:tc.optional(tc.any(bool, str))="\'", contexts=NotImplemented, exclude_sims=False):
         """
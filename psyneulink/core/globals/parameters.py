@@ -300,6 +300,7 @@ Class Reference
 
 import collections
 import copy
+import copyreg
 import functools
 import inspect
 import itertools
@@ -310,11 +311,14 @@ import weakref
 
 import toposort
 
-from psyneulink.core.globals.context import Context, ContextError, ContextFlags, _get_time, handle_external_context
+from psyneulink.core.globals.context import \
+    Context, ContextError, ContextFlags, _get_context_string, _get_time, handle_external_context
 from psyneulink.core.globals.context import time as time_object
-from psyneulink.core.globals.log import LogCondition, LogEntry, LogError
-from psyneulink.core.globals.utilities import call_with_pruned_args, copy_iterable_with_shared, \
-    get_alias_property_getter, get_alias_property_setter, get_deepcopy_with_shared, unproxy_weakproxy, create_union_set, safe_equals, get_function_sig_default_value
+from psyneulink.core.globals.log import LogCondition, LogEntry, LogError, _new_log_entries
+from psyneulink.core.globals.utilities import _picklable_function, _unpickled_function, call_with_pruned_args, \
+    copy_iterable_with_shared, get_alias_property_getter, get_alias_property_setter, get_deepcopy_with_shared, \
+    unproxy_weakproxy, create_union_set, runtime_checks_enabled, safe_equals, get_function_sig_default_value
+from psyneulink.core.rpc.delivery import BatchedDeliveryPipeline
 from psyneulink.core.rpc.graph_pb2 import Entry, ndArray
 
 __all__ = [
@@ -485,8 +489,20 @@ def check_user_specified(func):
     return check_user_specified_wrapper
 
 
+def _picklable_value(value):
+    """Return **value** in a form that can be pickled:  functions that cannot be pickled by reference (such as
+    lambdas) are pickled by value, and generators (such as the inputs of a run), which cannot be pickled, are replaced
+    by None.
+    """
+    if isinstance(value, types.GeneratorType):
+        return None
+    return _picklable_function(value)
+
+
 class ParametersTemplate:
     _deepcopy_shared_keys = ['_parent', '_params', '_owner_ref', '_children']
+    # name of the attribute of a Component class that holds its instance of this type
+    _class_attribute_name = 'parameters'
     _values_default_excluded_attrs = {'user': False}
 
     def __init__(self, owner, parent=None):
@@ -497,8 +513,9 @@ class ParametersTemplate:
             # using weakref to allow garbage collection of unused children
             self._parent._children.add(weakref.ref(self))
 
-        # create list of params currently existing
-        self._params = set()
+        # create list of params currently existing (a dict, used as an ordered set, so that the order of the
+        #   Parameters, on which the structures of compiled code depend, is kept when they are pickled)
+        self._params = {}
         try:
             parent_keys = list(self._parent._params)
         except AttributeError:
@@ -506,7 +523,7 @@ class ParametersTemplate:
         source_keys = dir(self) + parent_keys
         for k in source_keys:
             if self._is_parameter(k):
-                self._params.add(k)
+                self._params[k] = None
 
         self._children = set()
 
@@ -527,6 +544,25 @@ class ParametersTemplate:
         memo[id(self)] = newone
         return newone
 
+    def __reduce_ex__(self, protocol):
+        # the Parameters and Defaults of Component classes are pickled by reference to those of the class
+        if isinstance(self._owner, type):
+            return getattr, (self._owner, self._class_attribute_name)
+        return super().__reduce_ex__(protocol)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_owner_ref'] = self._owner
+        # weak references to children are restored as the children are unpickled
+        state['_children'] = set()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._owner = state['_owner_ref']
+        if isinstance(self._parent, ParametersTemplate):
+            self._parent._children.add(weakref.ref(self))
+
     def __del__(self):
         try:
             self._parent._children.remove(weakref.ref(self))
@@ -549,7 +585,7 @@ class ParametersTemplate:
                 return True
 
     def _register_parameter(self, param_name):
-        self._params.add(param_name)
+        self._params[param_name] = None
         to_remove = set()
 
         for child in self._children:
@@ -644,6 +680,8 @@ class Defaults(ParametersTemplate):
             owner
                 the :class:`Parameters` object associated with this object
     """
+    _class_attribute_name = 'defaults'
+
     def __init__(self, owner, **kwargs):
         super().__init__(owner)
 
@@ -694,6 +732,20 @@ class ParameterBase(types.SimpleNamespace):
     def __hash__(self):
         return object.__hash__(self)
 
+    def __reduce_ex__(self, protocol):
+        # the Parameters of Component classes are pickled by reference to those of the class
+        owner = getattr(self, '_owner', None)
+        if isinstance(owner, ParametersTemplate) and isinstance(owner._owner, type):
+            return getattr, (owner, self.name)
+        # overrides the pickling of types.SimpleNamespace, which calls the constructor
+        return copyreg.__newobj__, (type(self),), self.__getstate__()
+
+    def __getstate__(self):
+        return self.__dict__.copy()
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
 
 class Parameter(ParameterBase):
     """
@@ -1074,6 +1126,30 @@ class Parameter(ParameterBase):
 
         return result
 
+    def __getstate__(self):
+        state = {k: _picklable_value(v) for k, v in super().__getstate__().items()}
+        # cache of the Parameter from which attributes are inherited, which is found again when needed
+        state['_inherited_source'] = None
+        if 'values' in state:
+            state['values'] = {k: _picklable_value(v) for k, v in state['values'].items()}
+        if 'history' in state:
+            state['history'] = {
+                k: collections.deque((_picklable_value(v) for v in h), maxlen=h.maxlen)
+                for k, h in state['history'].items()
+            }
+        return state
+
+    def __setstate__(self, state):
+        state = {k: _unpickled_function(v) for k, v in state.items()}
+        if 'values' in state:
+            state['values'] = {k: _unpickled_function(v) for k, v in state['values'].items()}
+        if 'history' in state:
+            state['history'] = {
+                k: collections.deque((_unpickled_function(v) for v in h), maxlen=h.maxlen)
+                for k, h in state['history'].items()
+            }
+        super().__setstate__(state)
+
     def __getattr__(self, attr):
         # runs when the object doesn't have an attr attribute itself
         # attempt to get from its parent, which is also a Parameter
@@ -1429,6 +1505,10 @@ class Parameter(ParameterBase):
 
         value = self._set(self._parse(value), context, skip_history, skip_log, **kwargs)
 
+        # ensure the ParameterPort for this Parameter is updated, even if value is an object modified in place
+        if self.port is not None:
+            self.port._source_values.clear()
+
         try:
             if isinstance(value.__self__, Component):
                 value = value.__self__
@@ -1519,8 +1599,7 @@ class Parameter(ParameterBase):
                 time = time_object(None, None, None, None)
 
             # this branch only ran previously when context was ContextFlags.COMMAND_LINE
-            context_str = ContextFlags._get_context_string(ContextFlags.COMMAND_LINE)
-            log_condition_satisfied = True
+            context_str = _get_context_string(ContextFlags.COMMAND_LINE)
 
         # standard loggingd
         else:
@@ -1530,29 +1609,30 @@ class Parameter(ParameterBase):
             if context is None:
                 context = self._owner._owner.most_recent_context
 
-            time = _get_time(self._owner._owner, context)
-            context_str = ContextFlags._get_context_string(context.flags)
-            log_condition_satisfied = self.log_condition & context.flags
+            if not (
+                self.log_condition & context.flags
+                or (
+                    self.log_condition & LogCondition.INITIALIZATION
+                    and self._owner._owner.initialization_status is ContextFlags.INITIALIZING
+                )
+            ):
+                return
 
-        if (
-            not log_condition_satisfied
-            and self.log_condition & LogCondition.INITIALIZATION
-            and self._owner._owner.initialization_status is ContextFlags.INITIALIZING
-        ):
-            log_condition_satisfied = True
+            # time stamp and context string are only computed once satisfaction of log_condition is known
+            time = _get_time(self._owner._owner, context)
+            context_str = _get_context_string(context.flags)
 
-        if log_condition_satisfied:
-            if not self.stateful:
-                execution_id = None
-            else:
-                execution_id = context.execution_id
+        if not self.stateful:
+            execution_id = None
+        else:
+            execution_id = context.execution_id
 
-            if execution_id not in self.log:
-                self.log[execution_id] = collections.deque([])
+        if execution_id not in self.log:
+            self.log[execution_id] = _new_log_entries(self.name)
 
-            self.log[execution_id].append(
-                LogEntry(time, context_str, value)
-            )
+        self.log[execution_id].append(
+            LogEntry(time, context_str, value)
+        )
 
     def _deliver_value(self, value, context=None):
         # if a context is attached and a pipeline is attached to the context
@@ -1586,6 +1666,16 @@ class Parameter(ParameterBase):
                 else:
                     execution_id = context.execution_id
                 # ADD TO PIPELINE HERE
+                if isinstance(context.rpc_pipeline, BatchedDeliveryPipeline):
+                    context.rpc_pipeline.add_value(
+                        self._get_root_owner().name,
+                        self._get_root_parameter().name,
+                        time,
+                        execution_id,
+                        value
+                    )
+                    return
+
                 context.rpc_pipeline.put(
                     Entry(
                         componentName=self._get_root_owner().name,
@@ -1785,6 +1875,15 @@ class ParameterAlias(ParameterBase, metaclass=_ParameterAliasMeta):
 
         return result
 
+    def __getstate__(self):
+        state = super().__getstate__()
+        state['_source'] = self.source
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self.source = state['_source']
+
     @property
     def source(self):
         return unproxy_weakproxy(self._source)
@@ -1797,6 +1896,21 @@ class ParameterAlias(ParameterBase, metaclass=_ParameterAliasMeta):
             self._source = value
 
 
+# default getter and setter of SharedParameter, defined at module level so that they can be pickled
+def _shared_parameter_getter(self, context=None):
+    try:
+        return self.source._get(context)
+    except (AttributeError, TypeError, IndexError):
+        return None
+
+
+def _shared_parameter_setter(value, self, context=None):
+    try:
+        return self.source._set(value, context)
+    except AttributeError:
+        return None
+
+
 class SharedParameter(Parameter):
     """
         A Parameter that is not a "true" Parameter of a Component but a
@@ -1876,22 +1990,10 @@ class SharedParameter(Parameter):
         )
 
         if getter is None:
-            def getter(self, context=None):
-                try:
-                    return self.source._get(context)
-                except (AttributeError, TypeError, IndexError):
-                    return None
-
-            self.getter = getter
+            self.getter = _shared_parameter_getter
 
         if setter is None:
-            def setter(value, self, context=None):
-                try:
-                    return self.source._set(value, context)
-                except AttributeError:
-                    return None
-
-            self.setter = setter
+            self.setter = _shared_parameter_setter
 
     def __getattr__(self, attr):
         try:
@@ -2303,6 +2405,9 @@ class ParametersBase(ParametersTemplate):
         return getattr(self, '{0}{1}'.format(prefix, suffix))
 
     def _validate(self, attr, value):
+        if not runtime_checks_enabled():
+            return
+
         err_msg = None
 
         valid_types = getattr(self, attr).valid_types
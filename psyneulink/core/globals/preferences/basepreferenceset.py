@@ -123,6 +123,21 @@ def is_pref_set(pref):
     return False
 
 
+def _instantiate_class_preferences(owner_class, name):
+    """Instantiate the classPreferences of **owner_class** as a BasePreferenceSet if they are not already one"""
+    try:
+        # If classPreferences are still a dict, they need to be instantiated as a BasePreferenceSet
+        if isinstance(owner_class.classPreferences, dict):
+            raise AttributeError
+    except AttributeError:
+        owner_class.classPreferences = BasePreferenceSet(
+                                            owner=owner_class,
+                                            level=owner_class.classPreferenceLevel,
+                                            prefs=ComponentDefaultPrefDicts[owner_class.classPreferenceLevel],
+                                            name=name,
+                                            )
+
+
 class BasePreferenceSet(PreferenceSet):
     # DOCUMENT: FOR EACH pref TO BE ACCESSIBLE DIRECTLY AS AN ATTRIBUTE OF AN OBJECT,
     #           MUST IMPLEMENT IT AS PROPERTY (WITH GETTER AND SETTER METHODS) IN FUNCTION MODULE
@@ -295,22 +310,10 @@ class BasePreferenceSet(PreferenceSet):
             owner_class = owner.__class__
 
         # If classPreferences have not be instantiated for owner's class, do so here:
-        try:
-            # If classPreferences are still a dict, they need to be instantiated as a BasePreferenceSet
-            if isinstance(owner_class.classPreferences, dict):
-                raise AttributeError
-        except AttributeError:
-            if inspect.isclass(owner):
-                # If this is a call to instantiate the classPreferences, no need to keep doing it! (infinite recursion)
-                pass
-            else:
-                # Instantiate the classPreferences
-                owner_class.classPreferences = BasePreferenceSet(
-                                                    owner=owner_class,
-                                                    level=owner_class.classPreferenceLevel,
-                                                    prefs=ComponentDefaultPrefDicts[owner_class.classPreferenceLevel],
-                                                    name=name,
-                                                    )
+        # If this is a call to instantiate the classPreferences, no need to keep doing it! (infinite recursion)
+        if not inspect.isclass(owner):
+            _instantiate_class_preferences(owner_class, name)
+
         # Instantiate PreferenceSet
         super().__init__(owner=owner,
                          level=owner_class.classPreferenceLevel,
@@ -319,6 +322,19 @@ class BasePreferenceSet(PreferenceSet):
                          )
         self._level = level
 
+    def __reduce_ex__(self, protocol):
+        # the classPreferences of a class are pickled by reference to the class
+        if inspect.isclass(self.owner) and self.owner.__dict__.get('classPreferences') is self:
+            return getattr, (self.owner, 'classPreferences')
+        return super().__reduce_ex__(protocol)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # the classPreferences of the owner's class are instantiated with its first instance, which may not yet have
+        #   been created in the process in which this is unpickled
+        if not inspect.isclass(self.owner):
+            _instantiate_class_preferences(self.owner.__class__, None)
+
     @property
     def verbosePref(self):
         """Return setting of owner's verbosePref at level specified in its PreferenceEntry.level
@@ -10,6 +10,7 @@
 
 import inspect
 import re
+import weakref
 
 from collections import defaultdict, namedtuple
 
@@ -22,7 +23,8 @@ from psyneulink.core.globals.keywords import \
 __all__ = [
     'RegistryError',
     'clear_registry',
-    'process_registry_object_instances'
+    'process_registry_object_instances',
+    'set_weak_registries',
 ]
 
 # IMPLEMENTATION NOTE:
@@ -46,10 +48,13 @@ RegistryVerbosePrefs = {
     FUNCTION_COMPONENT_CATEGORY: DEFAULT_REGISTRY_VERBOSITY,
 }
 
-RegistryEntry = namedtuple('RegistryTuple', 'subclass, instanceDict, instanceCount, renamed_instance_counts, default')
+RegistryEntry = namedtuple('RegistryEntry', 'subclass, instanceDict, instanceCount, renamed_instance_counts, default')
 
 numeric_suffix_pat = re.compile(r'(.*)-\d+$')
 
+# set by set_weak_registries
+_weak_registries = False
+
 
 class RegistryError(Exception):
     def __init__(self, error_value):
@@ -59,6 +64,77 @@ class RegistryError(Exception):
         return repr(self.error_value)
 
 
+class _WeakInstanceDict(weakref.WeakValueDictionary):
+    """instanceDict of a registry category that holds its instances by weak reference (see `set_weak_registries`).
+
+    The names of instances that have been garbage collected are kept in registered_names, and are still treated as
+    assigned by `register_instance`, so that the names given to new instances do not depend on when earlier ones were
+    collected.  They are released only when removed explicitly (by `remove_instance_from_registry` or
+    `clear_registry`).
+    """
+    def __init__(self, other=()):
+        self.registered_names = set()
+        super().__init__()
+        self.update(other)
+
+    def __setitem__(self, key, value):
+        self.registered_names.add(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        # the name of an instance that has been freed can still be removed
+        self.registered_names.remove(key)
+        if key in self:
+            super().__delitem__(key)
+
+    def update(self, other=(), **kwargs):
+        other = dict(other, **kwargs)
+        self.registered_names.update(other)
+        super().update(other)
+
+
+def _new_instance_dict(instances=()):
+    if _weak_registries:
+        return _WeakInstanceDict(instances)
+    return dict(instances)
+
+
+def set_weak_registries(weak=True):
+    """Specify whether the registries of PsyNeuLink Components hold them by weak references.
+
+    By default, every `Component` that is created is kept in the registry for its type (e.g., MechanismRegistry or
+    CompositionRegistry), so that it is not garbage collected even if it is no longer referenced anywhere else, until
+    it is removed by `clear_registry`.  If **weak** is True, the registries instead hold their instances by weak
+    references, so that a Component that is no longer otherwise referenced (and anything that is kept only for it,
+    such as its compiled structures) can be freed;  this is useful for long-running processes that create and discard
+    many Components or Compositions.  The names of Components that have been freed remain reserved, so that the names
+    assigned to new Components are the same in either mode.
+
+    This applies to the categories of all of the primary registries (listed in ``psyneulink.primary_registries``),
+    including the instances already registered in them, and to any registry categories created subsequently.  If
+    **weak** is False, the names of instances that were freed while the registries were weak are released.
+
+    Arguments
+    ---------
+
+    weak : bool : default True
+        if True, registries hold their instances by weak references;  if False, they hold them by (ordinary) strong
+        references.
+    """
+    from psyneulink import primary_registries
+
+    global _weak_registries
+    _weak_registries = bool(weak)
+
+    for registry in primary_registries:
+        for category, registry_entry in registry.items():
+            if isinstance(registry_entry.instanceDict, _WeakInstanceDict) == _weak_registries:
+                continue
+            registry[category] = registry_entry._replace(
+                instanceDict=_new_instance_dict(registry_entry.instanceDict)
+            )
+
+
 def register_category(entry,
                       base_class,
                       name=None,
@@ -193,7 +269,7 @@ def register_category(entry,
                 entry.name = name
 
             # Create instance dict:
-            instanceDict = {entry.name: entry}
+            instanceDict = _new_instance_dict({entry.name: entry})
             renamed_instance_counts = defaultdict(int)
 
             # Register component type with instance count of 1:
@@ -211,7 +287,7 @@ def register_category(entry,
         # - instantiate empty instanceDict
         # - set instance count = 0
         else:
-            registry[component_type_name] = RegistryEntry(entry, {}, 0, defaultdict(int), False)
+            registry[component_type_name] = RegistryEntry(entry, _new_instance_dict(), 0, defaultdict(int), False)
 
     else:
         raise RegistryError("Requested entry {0} not of type {1}".format(entry, base_class))
@@ -229,7 +305,9 @@ def register_instance(entry, name, base_class, registry, sub_dict):
     else:
         entry.name = name
 
-    while entry.name in registry[sub_dict].instanceDict:
+    # the names of instances of a weak registry that have been freed are still assigned
+    assigned_names = getattr(registry[sub_dict].instanceDict, 'registered_names', registry[sub_dict].instanceDict)
+    while entry.name in assigned_names:
         # if the decided name (provided or determined) is already assigned to an object, get the non-suffixed name,
         # and append the proper new suffix according to the number of objects that have been assigned that name
         # NOTE: the while is to handle a scenario in which a user specifies a name that uses our convention but
@@ -356,7 +434,7 @@ def remove_instance_from_registry(registry, category, name=None, component=None)
 
     try:
         clear_registry(registry_entry.instanceDict[name]._portRegistry)
-    except (AttributeError):
+    except (AttributeError, KeyError):
         pass
 
     # Delete instance
@@ -402,9 +480,14 @@ def clear_registry(registry=None):
 
     for registry in registries:
         for category in registry:
-            instance_dict = registry[category].instanceDict.copy()
+            # dict holds the instances while they are removed, in case the registry is weak
+            instance_dict = dict(registry[category].instanceDict)
             for name in instance_dict:
                 remove_instance_from_registry(registry, category, name)
+            try:
+                registry[category].instanceDict.registered_names.clear()
+            except AttributeError:
+                pass
             registry[category].renamed_instance_counts.clear()
 
 def process_registry_object_instances(registry, func):
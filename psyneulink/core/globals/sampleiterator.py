@@ -23,6 +23,8 @@ from numbers import Number
 import numpy as np
 import typecheck as tc
 
+from psyneulink.core.globals.utilities import _picklable_function, _unpickled_function
+
 __all__ = ['SampleSpec', 'SampleIterator']
 
 
@@ -421,6 +423,17 @@ class SampleIterator(Iterator):
         self.current_step = 0
         return self
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if 'generate_current_value' in state:
+            state['generate_current_value'] = _picklable_function(self.generate_current_value)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if 'generate_current_value' in state:
+            self.generate_current_value = _unpickled_function(self.generate_current_value)
+
     def __call__(self):
         return list(self)
 
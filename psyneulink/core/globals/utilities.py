@@ -95,16 +95,25 @@ CONTENTS
 * `get_class_attributes`
 * `get_global_seed`
 * `set_global_seed`
+* `set_runtime_checks`
+* `runtime_checks_enabled`
+* `PrefetchIterator`
 
 """
 
+import builtins
 import collections
 import copy
+import importlib
 import inspect
 import logging
+import marshal
 import numbers
 import psyneulink
+import queue
 import re
+import sys
+import threading
 import time
 import warnings
 import weakref
@@ -136,8 +145,9 @@ __all__ = [
     'Modulation', 'MODULATION_ADD', 'MODULATION_MULTIPLY','MODULATION_OVERRIDE',
     'multi_getattr', 'np_array_less_than_2d', 'object_has_single_value', 'optional_parameter_spec', 'normpdf',
     'parse_valid_identifier', 'parse_string_to_psyneulink_object_string', 'parameter_spec', 'powerset',
-    'random_matrix', 'ReadOnlyOrderedDict', 'safe_equals', 'safe_len',
-    'scalar_distance', 'sinusoid',
+    'PrefetchIterator',
+    'random_matrix', 'ReadOnlyOrderedDict', 'runtime_checks_enabled', 'safe_equals', 'safe_len',
+    'scalar_distance', 'set_runtime_checks', 'sinusoid',
     'tensor_power', 'TEST_CONDTION', 'type_match',
     'underscore_to_camelCase', 'UtilitiesError', 'unproxy_weakproxy', 'create_union_set', 'merge_dictionaries',
     'contains_type'
@@ -187,10 +197,23 @@ MODULATION_OVERRIDE = 'Modulation.OVERRIDE'
 MODULATION_MULTIPLY = 'Modulation.MULTIPLY'
 MODULATION_ADD = 'Modulation.ADD'
 
+# the operations of Modulation are defined at module level (rather than as lambdas) so that they can be pickled
+def _modulate_multiply(runtime, default):
+    return runtime * default
+
+
+def _modulate_add(runtime, default):
+    return runtime + default
+
+
+def _modulate_override(runtime, default):
+    return runtime
+
+
 class Modulation(Enum):
-    MULTIPLY = lambda runtime, default : runtime * default
-    ADD = lambda runtime, default : runtime + default
-    OVERRIDE = lambda runtime, default : runtime
+    MULTIPLY = _modulate_multiply
+    ADD = _modulate_add
+    OVERRIDE = _modulate_override
     DISABLE = 0
 
 def is_modulation_operation(val):
@@ -794,6 +817,134 @@ def get_deepcopy_with_shared(shared_keys=frozenset(), shared_types=()):
     return __deepcopy__
 
 
+def _is_picklable_by_reference(func):
+    """Return True if **func** can be pickled as a reference to the module attribute by which it is named"""
+    try:
+        obj = sys.modules[func.__module__]
+        for name in func.__qualname__.split('.'):
+            obj = getattr(obj, name)
+    except (AttributeError, KeyError, TypeError):
+        return False
+    return obj is func
+
+
+class _EmptyCell:
+    """Marks a cell of a closure that has no value"""
+
+
+class _FunctionByValue:
+    """Pickles a function by its code, rather than as a reference, so that lambdas and functions defined within other
+    functions (such as the functions of `Conditions <Condition>`) can be pickled.  The values of the function's
+    closure and defaults are pickled along with the object that holds it (so a `Component` referenced by a closure
+    is unpickled as the same Component that is referenced elsewhere), and the function is unpickled in place of this
+    object.  The code is pickled using marshal, so it can only be unpickled by the same version of Python.
+    """
+
+    def __init__(self, function):
+        self.function = function
+
+    def __copy__(self):
+        # functions are not copied by the copy module
+        return self.function
+
+    def __deepcopy__(self, memo):
+        return self.function
+
+    def __reduce__(self):
+        func = self.function
+        closure_values = []
+        for cell in func.__closure__ or ():
+            try:
+                closure_values.append(cell.cell_contents)
+            except ValueError:
+                closure_values.append(_EmptyCell)
+
+        return (
+            _make_function,
+            (marshal.dumps(func.__code__), func.__module__, func.__name__, func.__qualname__, len(closure_values)),
+            (func.__defaults__, func.__kwdefaults__, closure_values, func.__dict__),
+            None,
+            None,
+            _set_function_state
+        )
+
+
+def _make_function(code, module_name, name, qualname, num_cells):
+    try:
+        func_globals = importlib.import_module(module_name).__dict__
+    except (ImportError, TypeError):
+        func_globals = {'__builtins__': builtins}
+    closure = tuple(types.CellType() for _ in range(num_cells)) or None
+    func = types.FunctionType(marshal.loads(code), func_globals, name, None, closure)
+    func.__qualname__ = qualname
+    return func
+
+
+def _set_function_state(func, state):
+    defaults, kwdefaults, closure_values, func_dict = state
+    func.__defaults__ = defaults
+    func.__kwdefaults__ = kwdefaults
+    for cell, value in zip(func.__closure__ or (), closure_values):
+        if value is not _EmptyCell:
+            cell.cell_contents = value
+    func.__dict__.update(func_dict)
+    return func
+
+
+def _replace_in_containers(obj, replace, _active=None):
+    """Return the result of **replace** for **obj** or, if **obj** is a dict, list or tuple, a copy of it in which
+    **replace** has been applied to each of its items (recursively);  **obj** itself is returned if none of its
+    items are replaced, so that containers shared with other objects remain so where possible.
+    """
+    if type(obj) not in {dict, list, tuple}:
+        return replace(obj)
+
+    if _active is None:
+        _active = set()
+    if id(obj) in _active:
+        return obj
+
+    _active.add(id(obj))
+    try:
+        if type(obj) is dict:
+            new_obj = {k: _replace_in_containers(v, replace, _active) for k, v in obj.items()}
+            replaced = any(new_obj[k] is not v for k, v in obj.items())
+        else:
+            new_obj = type(obj)(_replace_in_containers(v, replace, _active) for v in obj)
+            replaced = any(new_v is not v for new_v, v in zip(new_obj, obj))
+    finally:
+        _active.discard(id(obj))
+
+    return new_obj if replaced else obj
+
+
+def _function_by_value(obj):
+    if isinstance(obj, types.FunctionType) and not _is_picklable_by_reference(obj):
+        return _FunctionByValue(obj)
+    return obj
+
+
+def _function_from_value(obj):
+    if isinstance(obj, _FunctionByValue):
+        return obj.function
+    return obj
+
+
+def _picklable_function(obj):
+    """Return **obj**, in which any lambda or other function that cannot be pickled by reference (including any in a
+    dict, list or tuple) is replaced by an object that pickles it by value and is unpickled as a copy of the function
+    (see `_FunctionByValue`).
+    """
+    return _replace_in_containers(obj, _function_by_value)
+
+
+def _unpickled_function(obj):
+    """Return **obj**, in which any function replaced by `_picklable_function` but not pickled (as when the object by
+    which it is held is copied using copy.copy) is restored.
+    """
+    return _replace_in_containers(obj, _function_from_value)
+
+
 def copy_iterable_with_shared(obj, shared_types=None, memo=None):
     try:
         shared_types = tuple(shared_types)
@@ -1147,6 +1298,11 @@ class ContentAddressableList(UserList):
                 accessing by key/name less critical;
             - the number of ports in a collection for a given Mechanism is likely to be small so that, even when
                 accessed by key/name, the inefficiencies of searching a list are likely to be inconsequential.
+        However, since some (e.g., the `nodes <Composition.nodes>` of a Composition) can be large, and some are
+        accessed by name during execution, a dict that maps the name of each item to its index is maintained for
+        access by name;  it is invalidated when items are added to, removed from or reordered in the list, and
+        an entry is checked when it is used, so that it remains consistent if an item is renamed (or ``data`` is
+        modified directly).
 
     Arguments
     ---------
@@ -1214,6 +1370,8 @@ class ContentAddressableList(UserList):
                 raise UtilitiesError("All of the items in the list arg for {} "
                                      "must be of the type specified in the component_type arg ({})"
                                      .format(self.name, self.component_type.__name__))
+        # {name: index} for the first item in the list with each name, built when needed by _get_key_indices()
+        self._key_indices = None
         UserList.__init__(self, list, **kwargs)
 
     # def __repr__(self):
@@ -1226,6 +1384,7 @@ class ContentAddressableList(UserList):
         result = cls.__new__(cls)
         result.__dict__.update(self.__dict__)
         result.data = self.data.copy()
+        result._key_indices = None
         return result
 
     def __getitem__(self, key):
@@ -1268,8 +1427,12 @@ class ContentAddressableList(UserList):
                 self.data[key_num] = value
             else:
                 self.data.append(value)
+        self._key_indices = None
 
     def __contains__(self, item):
+        # names are looked up first, since that does not require searching the list
+        if isinstance(item, str) and self._get_key_for_item(item) is not None:
+            return True
         if super().__contains__(item):
             return True
         else:
@@ -1279,13 +1442,25 @@ class ContentAddressableList(UserList):
             except (KeyError, TypeError, UtilitiesError, ValueError):
                 return False
 
+    def _get_key_indices(self):
+        """Return a dict that maps the name of each item in the list to its index (that of the first item with the
+        name if there are several)
+        """
+        if self._key_indices is None:
+            key_indices = {}
+            for i, obj in enumerate(self.data):
+                key_indices.setdefault(obj.name, i)
+            self._key_indices = key_indices
+        return self._key_indices
+
     def _get_key_for_item(self, key):
         if isinstance(key, str):
-            obj = next((obj for obj in self.data if obj.name == key), None)
-            if obj is None:
-                return None
-            else:
-                return self.data.index(obj)
+            index = self._get_key_indices().get(key)
+            # rebuild the dict if an item has been renamed (or data modified directly) since it was built
+            if index is None or index >= len(self.data) or self.data[index].name != key:
+                self._key_indices = None
+                index = self._get_key_indices().get(key)
+            return index
         elif isinstance(key, self.component_type):
             return self.data.index(key)
         else:
@@ -1305,12 +1480,47 @@ class ContentAddressableList(UserList):
         except TypeError:
             key_num = self._get_key_for_item(key)
             del self.data[key_num]
+        self._key_indices = None
+
+    def append(self, item):
+        super().append(item)
+        if self._key_indices is not None:
+            self._key_indices.setdefault(item.name, len(self.data) - 1)
+
+    def insert(self, i, item):
+        super().insert(i, item)
+        self._key_indices = None
+
+    def extend(self, other):
+        super().extend(other)
+        self._key_indices = None
+
+    def __iadd__(self, other):
+        self._key_indices = None
+        return super().__iadd__(other)
+
+    def pop(self, i=-1):
+        self._key_indices = None
+        return super().pop(i)
+
+    def remove(self, item):
+        super().remove(item)
+        self._key_indices = None
+
+    def sort(self, *args, **kwds):
+        super().sort(*args, **kwds)
+        self._key_indices = None
+
+    def reverse(self):
+        super().reverse()
+        self._key_indices = None
 
     def __call__(self):
         return self.data
 
     def clear(self):
         super().clear()
+        self._key_indices = None
 
     # def pop(self, key, *args):
     #     raise UtilitiesError("{} is read-only".format(self.name))
@@ -1323,6 +1533,7 @@ class ContentAddressableList(UserList):
             self.data.append(value)
         else:
             self.data[key] = value
+        self._key_indices = None
 
     def __add__(self, item):
         try:
@@ -1572,6 +1783,9 @@ class SeededRandomState(np.random.RandomState):
         dup.set_state(self.get_state())
         return dup
 
+    def __reduce__(self):
+        return type(self), (self.used_seed,), self.get_state()
+
     def seed(self, seed):
         assert False, "Use 'seed' parameter instead of seeding the random state directly"
 
@@ -1590,6 +1804,9 @@ class _SeededPhilox(np.random.Generator):
         dup.bit_generator.state = self.bit_generator.state
         return dup
 
+    def __reduce__(self):
+        return type(self), (self.used_seed,), self.bit_generator.state
+
     def seed(self, seed):
         assert False, "Use 'seed' parameter instead of seeding the random state directly"
 
@@ -1607,6 +1824,36 @@ def set_global_seed(new_seed):
     _seed = new_seed
 
 
+def set_runtime_checks(enabled=True):
+    """Enable or disable checks made while PsyNeuLink is used that only validate arguments and values.
+
+    These checks are made, for example, on the variable of a `Component` each time it is executed, and on the values
+    assigned to `Parameters <Parameter>`.  Disabling them reduces the overhead of construction and execution, but
+    errors in the specification of a model may then not be reported, or be reported in less informative ways;  they
+    should therefore only be disabled for models that are known to work with them enabled.
+
+    The argument types of PsyNeuLink methods are checked by typecheck decorators, which are applied when PsyNeuLink
+    is imported;  to disable those checks as well, the PNL_RUNTIME_CHECKS environment variable must be set to 0
+    before PsyNeuLink is imported (which also disables the other runtime checks).
+
+    Arguments
+    ---------
+
+    enabled : bool : default True
+        specifies whether runtime checks are made.
+    """
+    psyneulink._runtime_checks = bool(enabled)
+    if enabled:
+        tc.enable()
+    else:
+        tc.disable()
+
+
+def runtime_checks_enabled():
+    """Return True if runtime checks are enabled (see `set_runtime_checks`)"""
+    return psyneulink._runtime_checks
+
+
 def safe_len(arr, fallback=1):
     """
     Returns
@@ -1962,3 +2209,113 @@ def get_function_sig_default_value(
         return sig.parameters[parameter].default
     except KeyError:
         return inspect._empty
+
+
+_PREFETCH_ITEM = 'item'
+_PREFETCH_ERROR = 'error'
+_PREFETCH_END = 'end'
+_PREFETCH_POLL_INTERVAL = 0.1
+
+
+def _put_until_stopped(item_queue, entry, stop):
+    while not stop.is_set():
+        try:
+            item_queue.put(entry, timeout=_PREFETCH_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _prefetch_items(iterator, transform, item_queue, stop):
+    # runs on the background thread of a PrefetchIterator; it does not reference the PrefetchIterator itself,
+    # so that one that is no longer used can be garbage collected (which stops the thread)
+    try:
+        for item in iterator:
+            if transform is not None:
+                item = transform(item)
+            if not _put_until_stopped(item_queue, (_PREFETCH_ITEM, item), stop):
+                return
+    except Exception as e:
+        _put_until_stopped(item_queue, (_PREFETCH_ERROR, e), stop)
+    else:
+        _put_until_stopped(item_queue, (_PREFETCH_END, None), stop)
+
+
+class PrefetchIterator:
+    """
+    PrefetchIterator(  \
+        iterator,      \
+        prefetch,      \
+        transform=None)
+
+    Iterator over the items of **iterator**, which are retrieved on a background thread and held in a queue of at
+    most **prefetch** items until they are requested, so that producing them overlaps with their use.  If
+    **transform** is specified, it is applied to each item on the background thread.  An exception raised by
+    **iterator** or **transform** is raised (after any items that preceded it) when the next item is requested.
+
+    Arguments
+    ---------
+
+    iterator : iterable
+        the source of the items;  it is only advanced by the background thread once the PrefetchIterator is created.
+
+    prefetch : int
+        maximum number of items retrieved ahead of the one most recently requested.
+
+    transform : callable : default None
+        function applied to each item before it is put in the queue.
+    """
+
+    def __init__(self, iterator, prefetch, transform=None):
+        if not isinstance(prefetch, numbers.Integral) or isinstance(prefetch, bool) or prefetch < 1:
+            raise UtilitiesError(f"prefetch for {type(self).__name__} must be a positive int (got {prefetch!r}).")
+
+        self._queue = queue.Queue(maxsize=prefetch)
+        self._stop = threading.Event()
+        self._done = False
+        self._thread = threading.Thread(
+            target=_prefetch_items,
+            args=(iter(iterator), transform, self._queue, self._stop),
+            name=type(self).__name__,
+            daemon=True
+        )
+        self._thread.start()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._done:
+            raise StopIteration
+
+        kind, item = self._queue.get()
+        if kind == _PREFETCH_ITEM:
+            return item
+
+        self._done = True
+        if kind == _PREFETCH_ERROR:
+            raise item
+        raise StopIteration
+
+    def close(self):
+        """Stop retrieving items and discard any that have not been requested."""
+        self._done = True
+        self._stop.set()
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        try:
+            self._stop.set()
+        except AttributeError:
+            pass
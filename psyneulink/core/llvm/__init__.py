@@ -13,6 +13,7 @@ import enum
 import functools
 import numpy as np
 import time
+import weakref
 from math import ceil, log2
 from typing import Set
 
@@ -169,10 +170,13 @@ class LLVMBinaryFunction:
         self.cuda_call(*wrap_args, **kwargs)
 
     @staticmethod
-    @functools.lru_cache(maxsize=32)
     def from_obj(obj, *, tags:frozenset=frozenset()):
-        name = LLVMBuilderContext.get_current().gen_llvm_function(obj, tags=tags).name
-        return LLVMBinaryFunction.get(name)
+        # cached by weak reference, so that the cache does not keep obj alive
+        obj_functions = _obj_binary_functions.setdefault(obj, {})
+        if tags not in obj_functions:
+            name = LLVMBuilderContext.get_current().gen_llvm_function(obj, tags=tags).name
+            obj_functions[tags] = LLVMBinaryFunction.get(name)
+        return obj_functions[tags]
 
     @staticmethod
     @functools.lru_cache(maxsize=32)
@@ -193,6 +197,9 @@ class LLVMBinaryFunction:
 _cpu_engine = None
 _ptx_engine = None
 
+# LLVMBinaryFunctions returned by LLVMBinaryFunction.from_obj, by object and tags
+_obj_binary_functions = weakref.WeakKeyDictionary()
+
 def _get_engines():
     global _cpu_engine
     if _cpu_engine is None:
@@ -218,6 +225,6 @@ def cleanup():
     _all_modules.clear()
 
     LLVMBinaryFunction.get.cache_clear()
-    LLVMBinaryFunction.from_obj.cache_clear()
+    _obj_binary_functions.clear()
 
     LLVMBuilderContext.clear_global()
@@ -22,6 +22,7 @@ import time
 
 
 from psyneulink.core import llvm as pnlvm
+from psyneulink.core.globals.utilities import PrefetchIterator
 from . import helpers, jit_engine, builder_context
 from .debug import debug_env
 
@@ -96,7 +97,11 @@ class Execution:
                 initializer = init_f(self._execution_contexts[0])
 
             init_end = time.time()
-            struct = struct_ty(*initializer)
+            pickled_struct = getattr(self, '_pickled_structs', {}).pop(name, None)
+            if pickled_struct is not None:
+                struct = struct_ty.from_buffer_copy(pickled_struct)
+            else:
+                struct = struct_ty(*initializer)
             struct_end = time.time()
 
 
@@ -298,6 +303,43 @@ class CompExecution(CUDAExecution):
         if len(execution_ids) > 1:
             self._ct_len = ctypes.c_int(len(execution_ids))
 
+    def __getstate__(self):
+        # compiled binary functions and GPU buffers are not pickled, and are found or created again when needed;
+        #   the structures that hold the state, parameters, data and conditions of the Composition are pickled as
+        #   bytes, and are restored when they are first used, as their types are those of the compiled functions
+        state = {
+            k: v for k, v in self.__dict__.items()
+            if not k.startswith('_buffer_cuda_') and k not in {'_param', '_state', '_data', '_CompExecution__conds'}
+        }
+        for attr in ['__bin_exec_func', '__bin_exec_multi_func', '__bin_func', '__bin_run_func',
+                     '__bin_run_multi_func', '__frozen_vals', '__conds']:
+            state[f'_CompExecution{attr}'] = None
+        state['_pickled_structs'] = {
+            name: bytes(getattr(self, name))
+            for name in ['_param', '_state', '_data', '_CompExecution__conds']
+            if getattr(self, name, None) is not None
+        }
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for b in ['state_struct', 'param_struct', 'data_struct', 'conditions']:
+            setattr(self, "_buffer_cuda_" + b, None)
+
+    def _copy(self, execution_id):
+        """Return a CompExecution of the same Composition in the context with **execution_id**, that starts from
+        (a copy of) the state and data of this CompExecution.  The parameters are not copied, so that they are
+        initialized from the values of the Composition's Parameters in that context.
+        """
+        assert len(self._execution_contexts) == 1
+        execution = CompExecution(self._composition, [execution_id], additional_tags=self.__tags)
+        execution._pickled_structs = {
+            name: bytes(getattr(self, name))
+            for name in ['_state', '_data']
+            if getattr(self, name, None) is not None
+        }
+        return execution
+
     @staticmethod
     def get(composition, context, additional_tags=frozenset()):
         executions = composition._compilation_data.execution._get(context)
@@ -355,7 +397,11 @@ class CompExecution(CUDAExecution):
                 cond_type = self._bin_func.byref_arg_types[4]
                 cond_initializer = gen.get_condition_initializer()
 
-            self.__conds = cond_type(*cond_initializer)
+            pickled_conds = getattr(self, '_pickled_structs', {}).pop('_CompExecution__conds', None)
+            if pickled_conds is not None:
+                self.__conds = cond_type.from_buffer_copy(pickled_conds)
+            else:
+                self.__conds = cond_type(*cond_initializer)
             if "stat" in self._debug_env:
                 print("Instantiated condition struct ( size:" ,
                       _pretty_size(ctypes.sizeof(cond_type)), ")",
@@ -577,11 +623,18 @@ class CompExecution(CUDAExecution):
         run_inputs = ((([x] for x in self._composition._build_variable_for_input_CIM({k:v[i] for k,v in inp.items()})) for i in range(num_input_sets)) for inp in inputs)
         return c_input(*_tupleize(run_inputs))
 
-    def _get_generator_run_input_struct(self, inputs, runs):
+    def _get_generator_trial_input(self, inp):
+        return _tupleize(np.atleast_2d(x) for x in self._composition._build_variable_for_input_CIM({k:np.atleast_1d(v) for k,v in inp.items()}))
+
+    def _get_generator_run_input_struct(self, inputs, runs, prefetch=None):
         assert len(self._execution_contexts) == 1
         # Extract input for each trial
-        run_inputs = ((np.atleast_2d(x) for x in self._composition._build_variable_for_input_CIM({k:np.atleast_1d(v) for k,v in inp.items()})) for inp in inputs)
-        run_inputs = _tupleize(run_inputs)
+        if prefetch:
+            # retrieve and convert trial inputs on a background thread
+            with PrefetchIterator(inputs, prefetch, transform=self._get_generator_trial_input) as run_inputs:
+                run_inputs = tuple(run_inputs)
+        else:
+            run_inputs = tuple(self._get_generator_trial_input(inp) for inp in inputs)
         num_input_sets = len(run_inputs)
         runs = num_input_sets if runs == 0 or runs == sys.maxsize else runs
         c_input = self._bin_run_func.byref_arg_types[3] * num_input_sets
@@ -602,9 +655,9 @@ class CompExecution(CUDAExecution):
 
         return self.__bin_run_multi_func
 
-    def run(self, inputs, runs=0, num_input_sets=0):
+    def run(self, inputs, runs=0, num_input_sets=0, prefetch=None):
         if isgenerator(inputs):
-            inputs, runs = self._get_generator_run_input_struct(inputs, runs)
+            inputs, runs = self._get_generator_run_input_struct(inputs, runs, prefetch)
             assert num_input_sets == 0 or num_input_sets == sys.maxsize
             num_input_sets = len(inputs)
         else:
@@ -637,10 +690,10 @@ class CompExecution(CUDAExecution):
             assert runs_count.value <= runs, "Composition ran more times than allowed!"
             return _convert_ctype_to_python(outputs)[0:runs_count.value]
 
-    def cuda_run(self, inputs, runs, num_input_sets):
+    def cuda_run(self, inputs, runs, num_input_sets, prefetch=None):
         # Create input buffer
         if isgenerator(inputs):
-            inputs, runs = self._get_generator_run_input_struct(inputs, runs)
+            inputs, runs = self._get_generator_run_input_struct(inputs, runs, prefetch)
             assert num_input_sets == 0 or num_input_sets == sys.maxsize
             num_input_sets = len(inputs)
         else:
@@ -1,3 +1,25 @@
-from .graph_pb2_grpc import ServeGraph
+import importlib
 
-__all__ = ['ServeGraph']
+from . import delivery
+
+from .delivery import *
+
+__all__ = list(delivery.__all__)
+
+# attributes imported from their modules when first accessed, as the modules depend on packages that are slow to
+#   import (grpc);  they are not included in __all__, so that they are not imported by starred imports
+_lazy_attributes = {
+    'ServeGraph': 'graph_pb2_grpc',
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _lazy_attributes[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return getattr(importlib.import_module(f'.{module_name}', __name__), name)
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_lazy_attributes))
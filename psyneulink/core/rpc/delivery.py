@@ -0,0 +1,170 @@
+# Princeton University licenses this file to You under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.  You may obtain a copy of the License at:
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and limitations under the License.
+
+
+# ********************************************* Delivery ***********************************************************
+"""
+A `BatchedDeliveryPipeline` can be assigned as the **rpc_pipeline** of a `Context` in place of a ``queue.Queue``.
+Rather than putting a separate ``Entry`` message on the queue for each value delivered (see `set_delivery_conditions
+<Component.set_delivery_conditions>`), it accumulates the values delivered within a `TIME_STEP <TimeScale.TIME_STEP>`
+(or `TRIAL <TimeScale.TRIAL>`) and puts them on the queue as a single ``EntryBatch`` message, in which the values are
+stored as raw little-endian float64 bytes.  The queue is bounded by **maxsize**;  when it is full, a batch is either
+dropped or the execution of the Composition blocks until the consumer has removed a batch, as specified by **policy**.
+The numbers of values that have been delivered and dropped are recorded in the `delivered
+<BatchedDeliveryPipeline.delivered>` and `dropped <BatchedDeliveryPipeline.dropped>` attributes;  the values in a
+batch can be retrieved using `decode_entry_batch`.
+"""
+
+import queue
+
+import numpy as np
+from graph_scheduler import TimeScale
+
+from psyneulink.core.rpc.graph_pb2 import BatchedValue, EntryBatch
+
+__all__ = [
+    'BLOCK', 'BatchedDeliveryPipeline', 'decode_entry_batch', 'DeliveryError', 'DROP'
+]
+
+BLOCK = 'block'
+DROP = 'drop'
+
+_value_dtype = np.dtype('<f8')
+
+
+class DeliveryError(Exception):
+    pass
+
+
+class BatchedDeliveryPipeline(queue.Queue):
+    """
+    BatchedDeliveryPipeline(  \
+        maxsize=0,            \
+        policy=BLOCK,         \
+        batch_by=TimeScale.TIME_STEP, \
+        timeout=None)
+
+    Bounded queue of ``EntryBatch`` messages, each of which holds the values delivered within a single time step or
+    trial.
+
+    Arguments
+    ---------
+
+    maxsize : int : default 0
+        maximum number of batches held in the queue;  if 0, the queue is unbounded.
+
+    policy : BLOCK or DROP : default BLOCK
+        specifies what is done with a batch when the queue is full:  *BLOCK* waits for space (for at most **timeout**
+        seconds, after which the batch is dropped);  *DROP* discards it immediately.
+
+    batch_by : TimeScale : default TimeScale.TIME_STEP
+        the `TimeScale` over which delivered values are coalesced into a batch;  must be `TIME_STEP
+        <TimeScale.TIME_STEP>` or `TRIAL <TimeScale.TRIAL>`.
+
+    timeout : float : default None
+        maximum time (in seconds) to wait for space in the queue when **policy** is *BLOCK*.
+
+    Attributes
+    ----------
+
+    delivered : int
+        number of values in batches that have been put on the queue.
+
+    dropped : int
+        number of values in batches that have been discarded because the queue was full.
+    """
+
+    def __init__(self, maxsize=0, policy=BLOCK, batch_by=None, timeout=None):
+        # TimeScale aliases are assigned when psyneulink.core.scheduling is imported, after this module
+        if batch_by is None:
+            batch_by = TimeScale.TIME_STEP
+        if policy not in {BLOCK, DROP}:
+            raise DeliveryError(f"policy for {type(self).__name__} must be '{BLOCK}' or '{DROP}' (got {policy!r})")
+        if batch_by not in {TimeScale.TIME_STEP, TimeScale.TRIAL}:
+            raise DeliveryError(f"batch_by for {type(self).__name__} must be {TimeScale.TIME_STEP} or "
+                                f"{TimeScale.TRIAL} (got {batch_by})")
+
+        super().__init__(maxsize)
+        self.policy = policy
+        self.batch_by = batch_by
+        self.timeout = timeout
+        self.delivered = 0
+        self.dropped = 0
+
+        self._batch_key = None
+        self._batch_context = None
+        self._batch_values = []
+        self._batch_data = []
+        self._batch_nbytes = 0
+
+    def add_value(self, component_name, parameter_name, time, execution_id, value):
+        """Add **value** to the current batch, first putting that batch on the queue if **time** or
+        **execution_id** begins a new one.
+        """
+        if self.batch_by is TimeScale.TRIAL:
+            key = (execution_id, time.run, time.trial)
+        else:
+            key = (execution_id, time.run, time.trial, time.pass_, time.time_step)
+
+        if key != self._batch_key:
+            self.flush()
+            self._batch_key = key
+            self._batch_context = execution_id
+
+        data = np.ascontiguousarray(value, dtype=_value_dtype)
+        self._batch_values.append(
+            BatchedValue(
+                componentName=component_name,
+                parameterName=parameter_name,
+                time=f'{time.run}:{time.trial}:{time.pass_}:{time.time_step}',
+                shape=data.shape,
+                offset=self._batch_nbytes,
+            )
+        )
+        self._batch_data.append(data.tobytes())
+        self._batch_nbytes += data.nbytes
+
+    def flush(self):
+        """Put the current batch on the queue (or drop it, if the queue is full;  see **policy**)."""
+        if not self._batch_values:
+            return
+
+        batch = EntryBatch(
+            context=str(self._batch_context),
+            values=self._batch_values,
+            data=b''.join(self._batch_data),
+        )
+        num_values = len(self._batch_values)
+        self._batch_key = None
+        self._batch_context = None
+        self._batch_values = []
+        self._batch_data = []
+        self._batch_nbytes = 0
+
+        try:
+            self.put(batch, block=self.policy == BLOCK, timeout=self.timeout)
+        except queue.Full:
+            self.dropped += num_values
+        else:
+            self.delivered += num_values
+
+
+def decode_entry_batch(batch):
+    """Return a list of (componentName, parameterName, time, context, value) tuples for the values in an
+    ``EntryBatch``, in which each value is a read-only view of the batch's data as an np.ndarray.
+    """
+    entries = []
+    for item in batch.values:
+        shape = tuple(item.shape)
+        value = np.frombuffer(
+            batch.data,
+            dtype=_value_dtype,
+            count=int(np.prod(shape, dtype=int)),
+            offset=item.offset
+        ).reshape(shape)
+        entries.append((item.componentName, item.parameterName, item.time, batch.context, value))
+    return entries
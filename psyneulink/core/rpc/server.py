@@ -0,0 +1,302 @@
+# Princeton University licenses this file to You under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.  You may obtain a copy of the License at:
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and limitations under the License.
+
+
+# ********************************************* Server *************************************************************
+"""
+Reference implementation of the ``ServeGraph`` service defined in ``graph.proto``.
+
+`serve` starts a gRPC server with a `GraphServicer`, which loads PsyNeuLink scripts (``LoadScript``), reports the
+Compositions and Components they define (``GetCompositions``, ``GetComponents``, ``GetLoggableParameters``,
+``GetJSON``), and runs them (``RunComposition``), streaming the values specified in the request's ``servePrefs`` back
+to the client as they are delivered (see `set_delivery_conditions <Component.set_delivery_conditions>`)::
+
+    server = serve('localhost:50051', max_workers=8)
+    server.wait_for_termination()
+
+Each ``RunComposition`` request is executed by a worker pool in its own `execution context <Composition_Execution_Context>`,
+so several requests can be run concurrently on the same Composition;  the context is deleted when its stream
+ends.  The Composition run is the one in the most recently loaded script with `INPUT <NodeRole.INPUT>` Nodes named by
+the keys of the request's ``inputs``.  If the server uses a compiled `ExecutionMode`, each Composition is compiled
+when its script is loaded, and the compiled binaries are held for as long as the script is loaded;  values are not
+delivered during compiled execution, so the `results <Composition.results>` of each trial are streamed instead.
+
+The server can also be started from the command line::
+
+    python -m psyneulink.core.rpc.server --address localhost:50051
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import os
+import queue
+import runpy
+import threading
+import uuid
+
+import grpc
+import numpy as np
+
+from psyneulink.core import llvm as pnlvm
+from psyneulink.core.compositions.composition import Composition, NodeRole
+from psyneulink.core.globals.context import Context
+from psyneulink.core.globals.log import LogCondition
+from psyneulink.core.rpc import graph_pb2
+from psyneulink.core.rpc.graph_pb2_grpc import ServeGraphServicer, add_ServeGraphServicer_to_server
+
+__all__ = [
+    'GraphServicer', 'serve'
+]
+
+_END_OF_RUN = object()
+
+LoadedScript = collections.namedtuple('LoadedScript', 'path, compositions, binaries')
+
+
+class _RequestPipeline(queue.Queue):
+    """Unbounded queue that keeps only the Entries requested by the servePrefs of a single RunComposition request."""
+
+    def __init__(self, requested):
+        super().__init__()
+        self.requested = requested
+
+    def put(self, entry, block=True, timeout=None):
+        if (entry.componentName, entry.parameterName) in self.requested:
+            super().put(entry, block, timeout)
+
+    def close(self):
+        super().put(_END_OF_RUN)
+
+
+class GraphServicer(ServeGraphServicer):
+    """
+    GraphServicer(                         \
+        max_workers=None,                  \
+        execution_mode=ExecutionMode.Python)
+
+    Implements the ``ServeGraph`` service for the PsyNeuLink scripts it loads.
+
+    Arguments
+    ---------
+
+    max_workers : int : default None
+        maximum number of ``RunComposition`` requests executed at the same time;  if None, the default of
+        ``concurrent.futures.ThreadPoolExecutor`` is used.
+
+    execution_mode : ExecutionMode : default ExecutionMode.Python
+        the `ExecutionMode` used to run Compositions.
+    """
+
+    def __init__(self, max_workers=None, execution_mode=pnlvm.ExecutionMode.Python):
+        self.execution_mode = execution_mode
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='GraphServicer'
+        )
+        self._lock = threading.RLock()
+        self._script = None
+        self._stylesheets = {}
+
+    def shutdown(self, wait=True):
+        """Stop the worker pool used to execute ``RunComposition`` requests."""
+        self._executor.shutdown(wait=wait)
+
+    # Script and Composition lookup ------------------------------------------------------------------------------
+
+    def _get_script(self, context):
+        script = self._script
+        if script is None:
+            context.abort(grpc.StatusCode.FAILED_PRECONDITION, 'No script has been loaded')
+        return script
+
+    def _get_composition(self, name, context):
+        for comp in self._get_script(context).compositions:
+            if comp.name == name:
+                return comp
+        context.abort(grpc.StatusCode.NOT_FOUND, f"No Composition named '{name}' in the loaded script")
+
+    def _get_component(self, name, context):
+        for comp in self._get_script(context).compositions:
+            if comp.name == name:
+                return comp
+            for component in list(comp.nodes) + list(comp.projections):
+                if component.name == name:
+                    return component
+        context.abort(grpc.StatusCode.NOT_FOUND, f"No Component named '{name}' in the loaded script")
+
+    def _get_composition_for_inputs(self, input_names, context):
+        # the outermost Composition is usually defined last in a script
+        for comp in reversed(self._get_script(context).compositions):
+            if input_names <= {node.name for node in comp.get_nodes_by_role(NodeRole.INPUT)}:
+                return comp
+        context.abort(
+            grpc.StatusCode.NOT_FOUND,
+            f'No Composition in the loaded script has INPUT Nodes named {sorted(input_names)}'
+        )
+
+    def _compile(self, composition):
+        # executions (one for each request context) look binaries up by Composition, so holding them here keeps
+        # them compiled for as long as the script is loaded
+        tags = frozenset({'run'}) if self.execution_mode & pnlvm.ExecutionMode._Run else frozenset()
+        return pnlvm.LLVMBinaryFunction.from_obj(composition, tags=tags)
+
+    # ServeGraph methods -----------------------------------------------------------------------------------------
+
+    def LoadCustomPnl(self, request, context):
+        import psyneulink
+
+        package_dir = os.path.dirname(os.path.dirname(os.path.abspath(psyneulink.__file__)))
+        if os.path.abspath(request.path) not in {package_dir, os.path.dirname(os.path.abspath(psyneulink.__file__))}:
+            context.abort(
+                grpc.StatusCode.FAILED_PRECONDITION,
+                f"The server is running the PsyNeuLink installed in '{package_dir}'"
+            )
+        return graph_pb2.NullArgument()
+
+    def LoadScript(self, request, context):
+        path = os.path.abspath(request.path)
+        try:
+            namespace = runpy.run_path(path, run_name='__psyneulink_script__')
+        except Exception as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, f"Error loading '{path}': {e}")
+
+        compositions = [v for v in namespace.values() if isinstance(v, Composition)]
+        for comp in compositions:
+            comp._analyze_graph()
+
+        binaries = {}
+        if self.execution_mode is not pnlvm.ExecutionMode.Python:
+            binaries = {comp: self._compile(comp) for comp in compositions}
+
+        with self._lock:
+            self._script = LoadedScript(path, compositions, binaries)
+
+        return graph_pb2.ScriptCompositions(compositions=[comp.name for comp in compositions])
+
+    def LoadGraphics(self, request, context):
+        path = os.path.abspath(request.path)
+        return graph_pb2.StyleJSON(styleJSON=self._stylesheets.get(path, '{}'))
+
+    def GetLoggableParameters(self, request, context):
+        component = self._get_component(request.name, context)
+        return graph_pb2.ParameterList(parameters=list(component.loggable_items))
+
+    def GetCompositions(self, request, context):
+        return graph_pb2.ScriptCompositions(compositions=[comp.name for comp in self._get_script(context).compositions])
+
+    def GetComponents(self, request, context):
+        comp = self._get_composition(request.name, context)
+        return graph_pb2.ScriptComponents(components=[node.name for node in comp.nodes])
+
+    def GetJSON(self, request, context):
+        comp = self._get_composition(request.name, context)
+        try:
+            objects_json = comp.json_summary
+        except ImportError as e:
+            context.abort(grpc.StatusCode.FAILED_PRECONDITION, f'JSON export is unavailable: {e}')
+
+        return graph_pb2.GraphJSON(
+            objectsJSON=objects_json,
+            styleJSON=self._stylesheets.get(self._get_script(context).path, '{}')
+        )
+
+    def HealthCheck(self, request, context):
+        return graph_pb2.HealthStatus(status='Okay')
+
+    def UpdateStylesheet(self, request_iterator, context):
+        path = self._get_script(context).path
+        for style in request_iterator:
+            self._stylesheets[path] = style.styleJSON
+        return graph_pb2.NullArgument()
+
+    def RunComposition(self, request, context):
+        comp = self._get_composition_for_inputs(set(request.inputs), context)
+        nodes = {node.name: node for node in comp.get_nodes_by_role(NodeRole.INPUT)}
+        inputs = {
+            nodes[name]: np.asarray(matrix.data, dtype=float).reshape(matrix.rows, matrix.cols)
+            for name, matrix in request.inputs.items()
+        }
+
+        requested = set()
+        with self._lock:
+            for pref in request.servePrefs.servePrefSet:
+                component = self._get_component(pref.componentName, context)
+                param = component.log._get_parameter_from_item_string(pref.parameterName)
+                if param is None:
+                    context.abort(
+                        grpc.StatusCode.NOT_FOUND,
+                        f"'{pref.parameterName}' is not a loggable parameter of {pref.componentName}"
+                    )
+                # delivery conditions are shared by all requests, so are only ever added to
+                condition = LogCondition[graph_pb2.serveCondition.Name(pref.condition)]
+                param.delivery_condition = (param.delivery_condition or LogCondition.OFF) | condition
+                requested.add((pref.componentName, pref.parameterName))
+
+        pipeline = _RequestPipeline(requested)
+        run_context = Context(execution_id=f'{comp.name}-{uuid.uuid4()}', rpc_pipeline=pipeline)
+        future = self._executor.submit(self._run_composition, comp, inputs, run_context)
+
+        while True:
+            entry = pipeline.get()
+            if entry is _END_OF_RUN:
+                break
+            yield entry
+
+        try:
+            future.result()
+        except Exception as e:
+            context.abort(grpc.StatusCode.INTERNAL, f'Error running {comp.name}: {e}')
+
+    def _run_composition(self, composition, inputs, context):
+        pipeline = context.rpc_pipeline
+        try:
+            composition.run(inputs=inputs, context=context, execution_mode=self.execution_mode)
+
+            if self.execution_mode is not pnlvm.ExecutionMode.Python:
+                run = composition.scheduler.get_clock(context).time.run - 1
+                for trial, result in enumerate(composition.parameters.results.get(context)):
+                    value = np.asarray([np.asarray(r, dtype=float).ravel() for r in result], dtype=float)
+                    queue.Queue.put(
+                        pipeline,
+                        graph_pb2.Entry(
+                            componentName=composition.name,
+                            parameterName='results',
+                            time=f'{run}:{trial}:0:0',
+                            context=context.execution_id,
+                            value=graph_pb2.ndArray(shape=list(value.shape), data=list(value.flatten()))
+                        )
+                    )
+        finally:
+            composition._delete_contexts(context)
+            pipeline.close()
+
+
+def serve(address='[::]:50051', max_workers=None, execution_mode=pnlvm.ExecutionMode.Python):
+    """Start a gRPC server for a new `GraphServicer` on **address**, and return the (started) ``grpc.Server``.
+
+    **max_workers** limits both the number of requests handled and the number of Compositions run at the same time.
+    If the port of **address** is 0, an unused port is chosen;  it is assigned to the ``port`` attribute of the
+    server returned.
+    """
+    servicer = GraphServicer(max_workers=max_workers, execution_mode=execution_mode)
+    server = grpc.server(concurrent.futures.ThreadPoolExecutor(max_workers=max_workers))
+    add_ServeGraphServicer_to_server(servicer, server)
+    server.port = server.add_insecure_port(address)
+    server.servicer = servicer
+    server.start()
+    return server
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Serve PsyNeuLink scripts using the ServeGraph gRPC service')
+    parser.add_argument('--address', default='[::]:50051')
+    parser.add_argument('--max-workers', type=int, default=None)
+    parser.add_argument('--execution-mode', default='Python', choices=list(pnlvm.ExecutionMode.__members__))
+    args = parser.parse_args()
+
+    serve(args.address, args.max_workers, pnlvm.ExecutionMode[args.execution_mode]).wait_for_termination()
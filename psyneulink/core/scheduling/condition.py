@@ -23,7 +23,7 @@ from psyneulink.core.globals.context import handle_external_context
 from psyneulink.core.globals.mdf import MDFSerializable
 from psyneulink.core.globals.keywords import MODEL_SPEC_ID_TYPE, comparison_operators
 from psyneulink.core.globals.parameters import parse_context
-from psyneulink.core.globals.utilities import parse_valid_identifier
+from psyneulink.core.globals.utilities import _picklable_function, _unpickled_function, parse_valid_identifier
 
 __all__ = copy.copy(graph_scheduler.condition.__all__)
 __all__.extend(['Threshold'])
@@ -59,6 +59,16 @@ def _create_as_pnl_condition(condition):
 
 
 class Condition(graph_scheduler.Condition, MDFSerializable):
+    def __getstate__(self):
+        # the functions of most Conditions are defined within their constructors
+        state = self.__dict__.copy()
+        state['func'] = _picklable_function(self.func)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.func = _unpickled_function(self.func)
+
     @handle_external_context()
     def is_satisfied(self, *args, context=None, execution_id=None, **kwargs):
         if execution_id is None:
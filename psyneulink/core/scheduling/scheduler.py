@@ -19,6 +19,7 @@ from psyneulink.core.globals.context import Context, handle_external_context
 from psyneulink.core.globals.mdf import MDFSerializable
 from psyneulink.core.globals.utilities import parse_valid_identifier
 from psyneulink.core.scheduling.condition import _create_as_pnl_condition
+from psyneulink.core.scheduling.time import Clock
 
 __all__ = [
     'Scheduler', 'SchedulingMode'
@@ -72,6 +73,14 @@ class Scheduler(graph_scheduler.Scheduler, MDFSerializable):
         self.default_termination_conds = replace_term_conds(self.default_termination_conds)
         self.termination_conds = replace_term_conds(self.termination_conds)
 
+        self.clocks[self.default_execution_id] = Clock()
+
+    def _init_clock(self, execution_id, base_execution_id=NotImplemented):
+        # use psyneulink Clock, which holds the time stamp used for logging
+        if execution_id not in self.clocks and base_execution_id is NotImplemented:
+            self.clocks[execution_id] = Clock()
+        super()._init_clock(execution_id, base_execution_id)
+
     def _validate_conditions(self):
         unspecified_nodes = []
         for node in self.nodes:
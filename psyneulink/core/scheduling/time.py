@@ -10,13 +10,29 @@
 import graph_scheduler
 
 __all__ = [
-    'TimeScale', 'Time', 'TimeHistoryTree'
+    'Clock', 'TimeScale', 'Time', 'TimeHistoryTree'
 ]
 
 TimeScale = graph_scheduler.TimeScale
 Time = graph_scheduler.Time
 TimeHistoryTree = graph_scheduler.TimeHistoryTree
 
+
+class Clock(graph_scheduler.Clock):
+    """
+    A `graph_scheduler.Clock` that also holds the time stamp used to `log <Log>` values at its current time. The time
+    stamp is created the first time it is needed, and discarded whenever the Clock's time is incremented, so that all
+    values logged within the same `TIME_STEP <TimeScale.TIME_STEP>` share it.
+    """
+    def __init__(self):
+        super().__init__()
+        self._time_stamp = None
+
+    def _increment_time(self, time_scale):
+        super()._increment_time(time_scale)
+        self._time_stamp = None
+
+
 _doc_subs = {
     'TimeScale': [
         (
@@ -431,6 +431,16 @@ def decision_variable_to_array(x):
         return [0,x]
 
 
+def _decision_variable_array(v):
+    # v[0]=decision variable, v[1]=threshold
+    return [float(v[0]), 0] if (v[1] - v[0]) < (v[1] + v[0]) else [0, float(v[0])]
+
+
+def _selected_input_array(v):
+    # v[0]=decision variable, v[1]=threshold, v[2]=variable of the DDM's InputPort
+    return [float(v[2][0][0]), 0] if (v[1] - v[0]) < (v[1] + v[0]) else [0, float(v[2][0][1])]
+
+
 class DDMError(Exception):
     def __init__(self, error_value):
         self.error_value = error_value
@@ -800,21 +810,19 @@ class DDM(ProcessingMechanism):
                 #    decision variable in position corresponding to threshold crossed, and 0 in the other position
                 {NAME: DECISION_VARIABLE_ARRAY, # 1d len 2, DECISION_VARIABLE as element 0 or 1
                  VARIABLE:[(OWNER_VALUE, self.DECISION_VARIABLE_INDEX), THRESHOLD],
-                           # per VARIABLE assignment above, items of v of lambda function below are:
+                           # per VARIABLE assignment above, items of v of function below are:
                            #    v[0]=self.value[self.DECISION_VARIABLE_INDEX]
                            #    v[1]=self.parameter_ports[THRESHOLD]
-                 FUNCTION: lambda v: [float(v[0]), 0] if (v[1] - v[0]) < (v[1] + v[0]) else [0, float(v[0])]},
+                 FUNCTION: _decision_variable_array},
                 # Provides a 1d 2-item array with:
                 #    input value in position corresponding to threshold crossed by decision variable, and 0 in the other
                 {NAME: SELECTED_INPUT_ARRAY, # 1d len 2, DECISION_VARIABLE as element 0 or 1
                  VARIABLE:[(OWNER_VALUE, self.DECISION_VARIABLE_INDEX), THRESHOLD, (INPUT_PORT_VARIABLES, 0)],
-                 # per VARIABLE assignment above, items of v of lambda function below are:
+                 # per VARIABLE assignment above, items of v of function below are:
                  #    v[0]=self.value[self.DECISION_VARIABLE_INDEX]
                  #    v[1]=self.parameter_ports[THRESHOLD]
                  #    v[2]=self.input_ports[0].variable
-                 FUNCTION: lambda v: [float(v[2][0][0]), 0] \
-                                      if (v[1] - v[0]) < (v[1] + v[0]) \
-                                      else [0, float(v[2][0][1])]
+                 FUNCTION: _selected_input_array
                  }
             ])
 
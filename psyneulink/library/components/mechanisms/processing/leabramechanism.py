@@ -98,7 +98,6 @@ Class Reference
 
 """
 
-import leabra
 import numbers
 
 import numpy as np
@@ -256,6 +255,8 @@ class LeabraFunction(Function_Base):
         return variable
 
     def _validate_params(self, request_set, target_set=None, context=None):
+        import leabra
+
         if not isinstance(request_set[NETWORK], leabra.Network):
             raise LeabraError("Error: the network given ({}) was of type {}, but instead must be a leabra Network.".
                               format(request_set[NETWORK], type(request_set[NETWORK])))
@@ -566,6 +567,8 @@ def convert_to_2d_input(array_like):
 
 
 def build_leabra_network(n_input, n_output, n_hidden, hidden_sizes=None, training_flag=None, quarter_size=50):
+    # imported here rather than with the module, as importing leabra is slow
+    import leabra
 
     # specifications
     learning_rule = 'leabra' if training_flag is True else None
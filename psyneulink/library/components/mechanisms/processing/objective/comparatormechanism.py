@@ -165,6 +165,15 @@ __all__ = [
 ]
 
 
+# functions of standard_output_ports (defined at module level, rather than as lambdas, so that they can be pickled)
+def _sse(x):
+    return np.sum(x * x)
+
+
+def _mse(x):
+    return np.sum(x * x) / safe_len(x)
+
+
 class ComparatorMechanismError(Exception):
     def __init__(self, error_value):
         self.error_value = error_value
@@ -317,9 +326,9 @@ class ComparatorMechanism(ObjectiveMechanism):
 
     standard_output_ports = ObjectiveMechanism.standard_output_ports.copy()
     standard_output_ports.extend([{NAME: SSE,
-                                   FUNCTION: lambda x: np.sum(x * x)},
+                                   FUNCTION: _sse},
                                   {NAME: MSE,
-                                   FUNCTION: lambda x: np.sum(x * x) / safe_len(x)}])
+                                   FUNCTION: _mse}])
     standard_output_port_names = ObjectiveMechanism.standard_output_port_names.copy()
     standard_output_port_names.extend([SSE, MSE])
 
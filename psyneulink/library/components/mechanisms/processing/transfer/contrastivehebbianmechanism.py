@@ -427,6 +427,10 @@ def _CHM_target_activity_getter(owning_component=None, context=None):
         return current_activity[owning_component.target_start:owning_component.target_end]
 
 
+def _activity_difference(v):
+    return v[0] - v[1]
+
+
 class ContrastiveHebbianMechanism(RecurrentTransferMechanism):
     """
     ContrastiveHebbianMechanism(                                          \
@@ -968,7 +972,7 @@ class ContrastiveHebbianMechanism(RecurrentTransferMechanism):
                                     VARIABLE:CURRENT_ACTIVITY_ATTR},
                                    {NAME:ACTIVITY_DIFFERENCE,
                                     VARIABLE:[PLUS_PHASE_ACTIVITY_ATTR, MINUS_PHASE_ACTIVITY_ATTR],
-                                    FUNCTION: lambda v: v[0] - v[1]},
+                                    FUNCTION: _activity_difference},
                                    {NAME:MINUS_PHASE_ACTIVITY,
                                     VARIABLE:MINUS_PHASE_ACTIVITY_ATTR},
                                    {NAME:PLUS_PHASE_ACTIVITY,
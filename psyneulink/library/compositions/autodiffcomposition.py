@@ -127,19 +127,14 @@ Class Reference
 ---------------
 
 """
+import importlib.util
 import logging
 
 import numpy as np
 
-try:
-    import torch
-    from torch import nn
-    import torch.optim as optim
-    torch_available = True
-except ImportError:
-    torch_available = False
-else:
-    from psyneulink.library.compositions.pytorchmodelcreator import PytorchModelCreator
+# torch (and PytorchModelCreator, which depends on it) is imported where it is used, so that it is only loaded
+#   (which is slow) once an AutodiffComposition is used
+torch_available = importlib.util.find_spec('torch') is not None
 
 from psyneulink.library.components.mechanisms.processing.objective.comparatormechanism import ComparatorMechanism
 from psyneulink.core.compositions.composition import Composition, NodeRole
@@ -240,6 +235,8 @@ class AutodiffComposition(Composition):
             raise AutodiffCompositionError('Pytorch python module (torch) is not installed. Please install it with '
                                            '`pip install torch` or `pip3 install torch`')
 
+        import torch
+
         super(AutodiffComposition, self).__init__(name = name,
                                                   learning_rate = learning_rate,
                                                   optimizer_type = optimizer_type,
@@ -276,6 +273,7 @@ class AutodiffComposition(Composition):
         if self.scheduler is None:
             self.scheduler = Scheduler(graph=self.graph_processing)
         if self.parameters.pytorch_representation._get(context=context) is None:
+            from psyneulink.library.compositions.pytorchmodelcreator import PytorchModelCreator
             model = PytorchModelCreator(composition=self,
                                         device=self.device,
                                         context=context)
@@ -306,6 +304,8 @@ class AutodiffComposition(Composition):
             raise AutodiffCompositionError("Invalid optimizer specified. Optimizer argument must be a string. "
                                            "Currently, Stochastic Gradient Descent and Adam are the only available "
                                            "optimizers (specified as 'sgd' or 'adam').")
+        import torch.optim as optim
+
         params = self.parameters.pytorch_representation._get(context).parameters()
         if optimizer_type == 'sgd':
             return optim.SGD(params, lr=learning_rate, weight_decay=weight_decay)
@@ -313,6 +313,9 @@ class AutodiffComposition(Composition):
             return optim.Adam(params, lr=learning_rate, weight_decay=weight_decay)
 
     def _get_loss(self, loss_spec):
+        import torch
+        from torch import nn
+
         if not isinstance(self.loss_spec, str):
             return self.loss_spec
         elif loss_spec == 'mse':
@@ -347,6 +350,7 @@ class AutodiffComposition(Composition):
 
     # performs learning/training on all input-target pairs it recieves for given number of epochs
     def autodiff_training(self, inputs, targets, context=None, scheduler=None):
+        import torch
 
         # compute total loss across output neurons for current trial
         tracked_loss = self.parameters.tracked_loss._get(context)
@@ -392,6 +396,8 @@ class AutodiffComposition(Composition):
         """
         Updates parameters based on trials ran since last update.
         """
+        import torch
+
         optimizer = self.parameters.optimizer._get(context=context)
         optimizer.zero_grad()
 
@@ -1,6 +1,9 @@
 import collections
 import functools
 import logging
+import pickle
+import re
+import threading
 from timeit import timeit
 
 import numpy as np
@@ -1806,6 +1809,111 @@ class TestAnalyzeGraph:
         assert comp.controller.objective_mechanism not in comp.get_nodes_by_role(NodeRole.OUTPUT)
         assert B in comp.get_nodes_by_role(NodeRole.OUTPUT)
 
+    @staticmethod
+    def _build_pathways(comp, num_pathways, batch):
+        mechs = [[ProcessingMechanism(name=f'{i}-{j}', function=Linear(slope=i + 1)) for j in range(2)]
+                 for i in range(num_pathways)]
+        if batch:
+            with comp.batch_construction():
+                for pathway in mechs:
+                    comp.add_linear_processing_pathway(pathway)
+        else:
+            for pathway in mechs:
+                comp.add_linear_processing_pathway(pathway)
+        return mechs
+
+    def test_batch_construction(self):
+        comp = Composition(name='comp')
+        with comp.batch_construction():
+            A = ProcessingMechanism(name='A')
+            B = ProcessingMechanism(name='B')
+            C = ProcessingMechanism(name='C', function=Linear(slope=2.0))
+            comp.add_linear_processing_pathway([A, B])
+            comp.add_linear_processing_pathway([B, C])
+            # analysis of the graph is deferred
+            assert comp.needs_update_graph
+            assert len(comp.input_CIM_ports) == 0
+            assert comp.get_nodes_by_role(NodeRole.OUTPUT) == []
+
+        assert not comp.needs_update_graph
+        assert comp.get_nodes_by_role(NodeRole.INPUT) == [A]
+        assert comp.get_nodes_by_role(NodeRole.OUTPUT) == [C]
+        assert list(comp.input_CIM_ports) == [A.input_port]
+        assert list(comp.output_CIM_ports) == [C.output_port]
+        np.testing.assert_allclose(comp.run(inputs={A: [[3.0]]}), [[6.0]])
+
+    def test_batch_construction_same_as_unbatched(self):
+        comps = {}
+        for batch in [False, True]:
+            comp = Composition(name=f'comp-{batch}')
+            mechs = self._build_pathways(comp, 5, batch)
+            comp.run(inputs={pathway[0]: [[1.0], [2.0]] for pathway in mechs})
+            comps[batch] = comp, mechs
+
+        (comp, mechs), (batch_comp, batch_mechs) = comps[False], comps[True]
+        for role in [NodeRole.INPUT, NodeRole.OUTPUT, NodeRole.ORIGIN, NodeRole.TERMINAL]:
+            assert ([batch_mechs.index(p) for p in batch_mechs if p[0] in batch_comp.get_nodes_by_role(role)] ==
+                    [mechs.index(p) for p in mechs if p[0] in comp.get_nodes_by_role(role)])
+        for attr in ['input_CIM_ports', 'output_CIM_ports']:
+            assert ([batch_mechs.index(p) for port in getattr(batch_comp, attr) for p in batch_mechs if port.owner in p]
+                    == [mechs.index(p) for port in getattr(comp, attr) for p in mechs if port.owner in p])
+        np.testing.assert_allclose(batch_comp.results, comp.results)
+
+    def test_batch_construction_nested_blocks(self):
+        comp = Composition(name='comp')
+        A = ProcessingMechanism(name='A')
+        B = ProcessingMechanism(name='B')
+        with comp.batch_construction():
+            with comp.batch_construction():
+                comp.add_linear_processing_pathway([A, B])
+            # not analyzed until the outermost block is left
+            assert comp.needs_update_graph
+            comp.remove_node(B)
+            assert comp.get_nodes_by_role(NodeRole.OUTPUT) == []
+        assert not comp.needs_update_graph
+        assert comp.get_nodes_by_role(NodeRole.OUTPUT) == [A]
+        assert list(comp.output_CIM_ports) == [A.output_port]
+
+    def test_batch_construction_error(self):
+        comp = Composition(name='comp')
+        A = ProcessingMechanism(name='A')
+        with pytest.raises(ValueError, match='stop'):
+            with comp.batch_construction():
+                comp.add_linear_processing_pathway([A])
+                raise ValueError('stop')
+        assert comp.needs_update_graph
+        assert comp._batch_construction_depth == 0
+        comp._analyze_graph()
+        assert comp.get_nodes_by_role(NodeRole.INPUT) == [A]
+
+    def test_batch_construction_learning_pathway(self):
+        A = ProcessingMechanism(name='A')
+        B = ProcessingMechanism(name='B')
+        C = ProcessingMechanism(name='C')
+        comp = Composition(name='comp')
+        with comp.batch_construction():
+            comp.add_linear_processing_pathway([A, B])
+            # NodeRoles are brought up to date for the learning pathway
+            learning_pathway = comp.add_backpropagation_learning_pathway([B, C])
+        target = learning_pathway.target
+        # as when constructed without batch_construction(), B remains an OUTPUT Node
+        assert comp.get_nodes_by_role(NodeRole.OUTPUT) == [B, C]
+        assert target in comp.get_nodes_by_role(NodeRole.TARGET)
+        comp.learn(inputs={A: [[1.0]], target: [[2.0]]})
+
+    @pytest.mark.composition
+    @pytest.mark.benchmark(group="Construction")
+    @pytest.mark.parametrize("batch", [False, True], ids=["unbatched", "batch_construction"])
+    def test_construction(self, benchmark, batch):
+        def build():
+            comp = Composition()
+            self._build_pathways(comp, 20, batch)
+            return comp
+
+        comp = benchmark(build)
+        assert len(comp.nodes) == 40
+        assert len(comp.input_CIM.input_ports) == len(comp.output_CIM.output_ports) == 20
+
 
 class TestGraph:
 
@@ -2536,6 +2644,27 @@ class TestExecutionOrder:
         if benchmark.enabled:
             benchmark(comp.run, inputs=inputs_dict, scheduler=sched, execution_mode=comp_mode)
 
+    @pytest.mark.composition
+    def test_frozen_values_only_for_dependent_execution_sets(self):
+        comp = Composition()
+        A = TransferMechanism(name="A", function=Linear(slope=5.0))
+        B = TransferMechanism(name="B", function=Linear(slope=4.0))
+        C = TransferMechanism(name="C", function=Linear(slope=3.0))
+        D = TransferMechanism(name="D", function=Linear(slope=2.0))
+        R = RecurrentTransferMechanism(name="R")
+        comp.add_linear_processing_pathway([A, B, D])
+        comp.add_linear_processing_pathway([A, C, D])
+        comp.add_node(R)
+
+        output = comp.run(inputs={A: [4.0], R: [1.0]})
+        assert np.allclose(output[0], 280)
+
+        plan = comp._get_execution_plan()
+        assert not plan.uses_frozen_values({B, C})
+        assert not plan.uses_frozen_values({A})
+        assert plan.uses_frozen_values({A, B})
+        assert plan.uses_frozen_values({R})
+
     @pytest.mark.control
     @pytest.mark.composition
     @pytest.mark.benchmark(group="Control composition scalar")
@@ -3266,6 +3395,130 @@ class TestRunInputSpecifications:
         except Exception as e:
             assert isinstance(e, pnl.CompositionError)
 
+    @pytest.mark.parametrize("mode", [pnl.ExecutionMode.Python,
+                                      pytest.param(pnl.ExecutionMode.LLVMRun, marks=pytest.mark.llvm),
+                                      pytest.param(pnl.ExecutionMode.PTXRun, marks=[pytest.mark.llvm, pytest.mark.cuda]),
+                                     ])
+    @pytest.mark.parametrize("input_type", ["generator", "generator_function"])
+    @pytest.mark.parametrize("num_trials", [None, 3])
+    def test_prefetch_generator_inputs(self, mode, input_type, num_trials):
+        c = pnl.Composition()
+
+        m1 = pnl.TransferMechanism()
+        m2 = pnl.TransferMechanism()
+
+        c.add_linear_processing_pathway([m1, m2])
+
+        def test_generator():
+            for i in range(10):
+                yield {
+                    m1: i
+                }
+
+        inputs = test_generator() if input_type == "generator" else test_generator
+        c.run(inputs=inputs, num_trials=num_trials, prefetch_inputs=2, execution_mode=mode)
+        assert c.parameters.results.get(c) == [[np.array([float(i)])] for i in range(num_trials or 10)]
+
+    def test_prefetch_generator_inputs_error(self):
+        c = pnl.Composition()
+
+        m1 = pnl.TransferMechanism()
+        m2 = pnl.TransferMechanism()
+
+        c.add_linear_processing_pathway([m1, m2])
+
+        def test_generator():
+            yield {m1: 0}
+            yield {m1: 1}
+            raise ValueError('stimulus file not found')
+
+        with pytest.raises(ValueError, match='stimulus file not found'):
+            c.run(inputs=test_generator(), prefetch_inputs=4)
+        assert c.parameters.results.get(c) == [[np.array([0.])], [np.array([1.])]]
+
+    def test_array_inputs(self):
+        A = TransferMechanism(name='A', size=3, function=Linear(slope=2.0))
+        B = TransferMechanism(name='B', input_ports=['X', 'Y'], default_variable=[[0, 0], [0, 0]])
+        comp = Composition(nodes=[A, B])
+        A_inputs = np.arange(15, dtype=float).reshape(5, 1, 3)
+        B_inputs = np.array([[[1.0, 2.0], [3.0, 4.0]]])
+
+        inputs, num_inputs_sets = comp._parse_run_inputs({A: A_inputs, B: B_inputs})
+        assert num_inputs_sets == 5
+        assert inputs[A] is A_inputs
+        assert np.shares_memory(inputs[B], B_inputs)
+
+        comp.run(inputs={A: A_inputs, B: B_inputs})
+        array_results = comp.results.copy()
+        comp.results.clear()
+        comp.run(inputs={A: A_inputs.tolist(), B: B_inputs.tolist()})
+        for array_result, list_result in zip(array_results, comp.results):
+            for array_value, list_value in zip(array_result, list_result):
+                np.testing.assert_allclose(array_value, list_value)
+
+        with pytest.raises(CompositionError, match='different lengths'):
+            comp.run(inputs={A: A_inputs, B: np.ones((3, 2, 2))})
+        # arrays that do not match the shape of the input are parsed (and rejected) as other inputs
+        with pytest.raises(RunError, match='is incompatible with the shape of its external input'):
+            comp.run(inputs={A: np.ones((5, 1, 4)), B: B_inputs})
+
+    def test_dataset_inputs(self, tmp_path):
+        class Dataset:
+            def __init__(self, data):
+                self.data = data
+                self.retrieved = []
+
+            def __len__(self):
+                return len(self.data)
+
+            def __getitem__(self, index):
+                self.retrieved.append(index)
+                return self.data[index]
+
+        A = TransferMechanism(name='A', size=3, function=Linear(slope=2.0))
+        B = TransferMechanism(name='B', input_ports=['X', 'Y'], default_variable=[[0, 0], [0, 0]])
+        C = TransferMechanism(name='C')
+        comp = Composition(nodes=[A, B, C])
+        A_inputs = np.arange(15, dtype=np.float32).reshape(5, 1, 3)
+        B_inputs = [[[i, i], [-i, -i]] for i in range(5)]
+        np.save(tmp_path / 'A.npy', A_inputs)
+
+        comp.run(inputs={A: A_inputs.tolist(), B: B_inputs, C: 3.0})
+        expected = comp.results.copy()
+        comp.results.clear()
+
+        B_dataset = Dataset(B_inputs)
+        comp.run(inputs={A: np.load(tmp_path / 'A.npy', mmap_mode='r'), B: B_dataset, C: 3.0})
+        assert B_dataset.retrieved == [0, 1, 2, 3, 4]
+        for dataset_result, list_result in zip(comp.results, expected):
+            for dataset_value, list_value in zip(dataset_result, list_result):
+                np.testing.assert_allclose(dataset_value, list_value)
+
+        # only the inputs for trials that are executed are retrieved
+        B_dataset.retrieved.clear()
+        comp.run(inputs={A: np.load(tmp_path / 'A.npy', mmap_mode='r'), B: B_dataset}, num_trials=2)
+        assert B_dataset.retrieved == [0, 1]
+
+        with pytest.raises(CompositionError, match='different lengths'):
+            comp.run(inputs={A: np.load(tmp_path / 'A.npy', mmap_mode='r'), B: Dataset(B_inputs[:3])})
+        with pytest.raises(RunError, match='is incompatible with the shape of its external input'):
+            comp.run(inputs={A: A_inputs.tolist(), B: Dataset([[[0, 0, 0], [0, 0, 0]]] * 5)})
+
+    @pytest.mark.composition
+    @pytest.mark.benchmark(group="Input parsing")
+    @pytest.mark.parametrize("input_type", ["list", "array"])
+    def test_parse_run_inputs(self, benchmark, input_type):
+        A = TransferMechanism(name='A', size=10)
+        B = TransferMechanism(name='B', input_ports=['X', 'Y'], default_variable=[[0, 0], [0, 0]])
+        comp = Composition(nodes=[A, B])
+        stimuli = {A: np.random.rand(10000, 1, 10), B: np.random.rand(10000, 2, 2)}
+        if input_type == "list":
+            stimuli = {node: stimulus.tolist() for node, stimulus in stimuli.items()}
+
+        inputs, num_inputs_sets = benchmark(comp._parse_run_inputs, stimuli)
+        assert num_inputs_sets == 10000
+        np.testing.assert_allclose(comp._parse_trial_inputs(inputs, 9999)[B], stimuli[B][9999])
+
 
 class TestRun:
 
@@ -3699,6 +3952,31 @@ class TestRun:
         output = benchmark(comp.run, inputs={A: [var]}, scheduler=sched, execution_mode=comp_mode)
         assert np.allclose([25.0 for x in range(vector_length)], output[0])
 
+    @pytest.mark.composition
+    @pytest.mark.benchmark(group="Execution plan")
+    def test_run_500_node_feedforward(self, benchmark):
+        nodes = [TransferMechanism(name=f'T{i}', function=Linear(slope=1.01)) for i in range(500)]
+        comp = Composition(nodes)
+        inputs = {nodes[0]: [[1.0]] * 3}
+        comp.run(inputs=inputs)
+        benchmark(comp.run, inputs=inputs, skip_analyze_graph=True)
+        assert np.allclose(comp.results[-1], 1.01 ** 500)
+
+    @pytest.mark.composition
+    def test_execution_plan_updated_on_structural_change(self):
+        A = TransferMechanism(name='A', function=Linear(slope=2.0))
+        B = TransferMechanism(name='B', function=Linear(slope=3.0))
+        comp = Composition([A, B])
+        assert np.allclose(comp.run(inputs={A: [[1.0]]}), 6.0)
+        plan = comp._get_execution_plan()
+        assert comp._get_execution_plan() is plan
+
+        C = TransferMechanism(name='C', function=Linear(slope=4.0))
+        comp.add_linear_processing_pathway([B, C])
+        assert np.allclose(comp.run(inputs={A: [[1.0]]}), 24.0)
+        assert comp._get_execution_plan() is not plan
+        assert not comp._get_execution_plan()[C].is_input
+
     @pytest.mark.composition
     @pytest.mark.benchmark(group="Merge composition scalar")
     def test_3_mechanisms_2_origins_1_terminal(self, benchmark, comp_mode):
@@ -6797,6 +7075,466 @@ class TestResetValues:
                            [np.array([0.5904]), np.array([0.16384]), np.array([0.16384])])
 
 
+class TestSaveLoadState:
+
+    def _make_comp(self):
+        A = TransferMechanism(name='A', integrator_mode=True, integration_rate=0.5)
+        B = TransferMechanism(name='B', noise=pnl.NormalDist(), integrator_mode=True)
+        C = RecurrentTransferMechanism(name='C', auto=0.5)
+        comp = Composition(pathways=[[A, B, C]], name='comp')
+        comp.scheduler.add_condition(C, EveryNCalls(B, 2))
+        return comp, A
+
+    @pytest.mark.parametrize('filename', ['state.npz', 'state'])
+    def test_save_load_resumes_run(self, tmp_path, filename):
+        path = tmp_path / filename
+
+        comp, A = self._make_comp()
+        comp.run(inputs={A: [[1.0], [2.0], [3.0]]})
+        comp.save_state(path)
+        comp.run(inputs={A: [[1.0], [2.0], [3.0]]})
+        expected = comp.results[3:]
+
+        comp.run(inputs={A: [[4.0], [5.0]]})
+        comp.load_state(path)
+        comp.run(inputs={A: [[1.0], [2.0], [3.0]]})
+
+        np.testing.assert_allclose(comp.results[-3:], expected)
+
+    @pytest.mark.parametrize('filename', ['state.npz', 'state'])
+    def test_load_state_into_new_context(self, tmp_path, filename):
+        path = tmp_path / filename
+
+        comp, A = self._make_comp()
+        comp.run(inputs={A: [[1.0], [2.0], [3.0]]})
+        saved_value = A.parameters.value.get(comp)
+        saved_previous_value = A.parameters.value.get_previous(comp)
+        comp.save_state(path)
+        comp.run(inputs={A: [[1.0], [2.0]]})
+        expected = comp.results[3:]
+
+        context = Context(execution_id='restored')
+        comp.load_state(path, context=context)
+        assert comp.scheduler.get_clock(context).time.run == 1
+        np.testing.assert_allclose(A.parameters.value.get(context), saved_value)
+        np.testing.assert_allclose(A.parameters.value.get_previous(context), saved_previous_value)
+
+        comp.run(inputs={A: [[1.0], [2.0]]}, context=context)
+        # results are part of the saved state
+        np.testing.assert_allclose(comp.parameters.results.get(context), comp.results[:3] + expected)
+
+    def test_load_state_mismatched_composition(self, tmp_path):
+        path = tmp_path / 'state.npz'
+
+        comp, A = self._make_comp()
+        comp.run(inputs={A: [[1.0]]})
+        comp.save_state(path)
+
+        other = Composition(pathways=[TransferMechanism(name='D')], name='comp')
+        with pytest.raises(CompositionError, match='does not match'):
+            other.load_state(path)
+
+    def test_save_load_results_limit(self, tmp_path):
+        path = tmp_path / 'state.npz'
+
+        comp, A = self._make_comp()
+        comp.results_limit = 2
+        comp.run(inputs={A: [[1.0], [2.0], [3.0]]})
+        expected = comp.results.as_array().copy()
+        comp.save_state(path)
+        comp.run(inputs={A: [[4.0]]})
+
+        comp.load_state(path)
+        assert comp.results.limit == 2
+        np.testing.assert_allclose(comp.results.as_array(), expected)
+
+
+class TestResults:
+
+    def test_results_stored_in_array(self):
+        A = TransferMechanism(name='A', function=Linear(slope=2.0))
+        B = TransferMechanism(name='B', size=2)
+        comp = Composition(nodes=[A, B])
+        comp.run(inputs={A: [[1.0], [2.0], [3.0]], B: [[1.0, 2.0]]})
+        comp.run(inputs={A: [[4.0]], B: [[3.0, 4.0]]})
+
+        # OUTPUT Nodes have values of different lengths
+        assert not comp.results.is_array
+        assert len(comp.results) == 4
+        np.testing.assert_allclose(comp.results[-1][0], [8.0])
+        np.testing.assert_allclose(comp.results[-1][1], [3.0, 4.0])
+
+        C = TransferMechanism(name='C', function=Linear(slope=2.0))
+        comp = Composition(nodes=[C])
+        comp.run(inputs={C: [[1.0], [2.0], [3.0]]})
+        comp.run(inputs={C: [[4.0]] * 10})
+        assert comp.results.is_array
+        assert comp.results == [[[2.0]], [[4.0]], [[6.0]]] + [[[8.0]]] * 10
+        assert comp.results.as_array().shape == (13, 1, 1)
+        assert isinstance(comp.results[0], list)
+        assert comp.results[1:3] == [[[4.0]], [[6.0]]]
+
+    @pytest.mark.parametrize('limit', [1, 3, 20])
+    def test_results_limit(self, limit):
+        A = TransferMechanism(name='A', function=Linear(slope=2.0))
+        comp = Composition(nodes=[A], results_limit=limit)
+        comp.run(inputs={A: [[i] for i in range(5)]})
+        comp.run(inputs={A: [[i] for i in range(5, 12)]})
+
+        expected = [[[2.0 * i]] for i in range(12)][-limit:]
+        assert comp.results == expected
+        np.testing.assert_allclose(comp.results.as_array(), expected)
+        assert comp.get_results_by_nodes(use_names=True) == {'A': [22.0]}
+
+        comp.results_limit = None
+        comp.run(inputs={A: [[12]]})
+        assert comp.results == expected + [[[24.0]]]
+
+    def test_results_limit_ragged(self):
+        A = TransferMechanism(name='A')
+        B = TransferMechanism(name='B', size=2)
+        comp = Composition(nodes=[A, B], results_limit=2)
+        comp.run(inputs={A: [[1.0], [2.0], [3.0]], B: [[1.0, 2.0]]})
+        assert len(comp.results) == 2
+        np.testing.assert_allclose(comp.results[0][0], [2.0])
+
+    def test_invalid_results_limit(self):
+        A = TransferMechanism(name='A')
+        comp = Composition(nodes=[A], results_limit=0)
+        with pytest.raises(ValueError, match='must be a positive int or None'):
+            comp.run(inputs={A: [[1.0]]})
+
+    def test_get_results_by_nodes_without_results(self):
+        A = TransferMechanism(name='A', default_variable=[[2.0]])
+        comp = Composition(nodes=[A])
+        assert comp.get_results_by_nodes(use_names=True) == {'A': [2.0]}
+
+
+class TestParallelExecution:
+
+    @staticmethod
+    def _build_comp(max_node_workers, threads):
+        def record_thread(variable):
+            threads.append(threading.current_thread().name)
+            return variable * 2
+
+        A = TransferMechanism(name='A', size=2, function=Linear(slope=3.0))
+        B = ProcessingMechanism(name='B', size=2, function=record_thread)
+        C = IntegratorMechanism(name='C', default_variable=[[0.0, 0.0]], function=AdaptiveIntegrator(rate=0.5))
+        inner_1 = TransferMechanism(name='inner_1', size=2, function=Logistic())
+        inner_2 = TransferMechanism(name='inner_2', size=2)
+        nested = Composition(name='nested', pathways=[[inner_1, inner_2]])
+        D = TransferMechanism(name='D', size=2)
+        comp = Composition(name='comp', max_node_workers=max_node_workers)
+        for node in [A, B, C, nested]:
+            comp.add_linear_processing_pathway([node, D])
+        return comp, {A: [[1.0, 2.0], [3.0, 4.0]], B: [[0.5, 0.5]], C: [[1.0, -1.0], [2.0, -2.0]], nested: [[0.0, 1.0]]}
+
+    def test_parallel_execution(self):
+        serial_threads = []
+        comp, inputs = self._build_comp(None, serial_threads)
+        comp.run(inputs=inputs)
+        expected = comp.results.copy()
+
+        threads = []
+        comp, inputs = self._build_comp(3, threads)
+        threads.clear()
+        comp.run(inputs=inputs)
+        np.testing.assert_allclose(comp.results.as_array(), np.asarray(expected))
+        assert threading.current_thread().name in serial_threads
+        assert len(threads) == 2
+        assert all(name.startswith(f'{comp.name} Nodes') for name in threads)
+
+    def test_parallel_execution_nodes_that_project_to_one_another(self):
+        threads = []
+
+        def record_thread(variable):
+            threads.append(threading.current_thread().name)
+            return variable
+
+        A = ProcessingMechanism(name='A', function=record_thread)
+        B = ProcessingMechanism(name='B', function=record_thread)
+        comp = Composition(pathways=[[A, B, A]], max_node_workers=2)
+        threads.clear()
+        comp.run(inputs={A: [[1.0]]}, num_trials=2)
+        assert threads == [threading.current_thread().name] * 4
+
+    def test_parallel_execution_error(self):
+        def fail(variable):
+            # Mechanisms are executed with their default variable when they are constructed
+            if np.any(variable):
+                raise ValueError('failed in B')
+            return variable
+
+        A = TransferMechanism(name='A')
+        B = ProcessingMechanism(name='B', function=fail)
+        C = TransferMechanism(name='C')
+        comp = Composition(pathways=[[A, C], [B, C]], max_node_workers=2)
+        with pytest.raises(pnl.FunctionError, match='failed in B'):
+            comp.run(inputs={A: [[1.0]], B: [[1.0]]})
+
+    @pytest.mark.composition
+    @pytest.mark.benchmark(group="Parallel execution")
+    @pytest.mark.parametrize("max_node_workers", [None, 4])
+    def test_parallel_execution_large_projections(self, benchmark, max_node_workers):
+        size = 1000
+        output = TransferMechanism(name='output', size=size)
+        comp = Composition(max_node_workers=max_node_workers)
+        inputs = {}
+        for i in range(4):
+            node = TransferMechanism(name=f'input-{i}', size=size)
+            comp.add_linear_processing_pathway([node, np.random.rand(size, size), output])
+            inputs[node] = np.random.rand(1, 1, size)
+
+        benchmark(comp.run, inputs=inputs, num_trials=10)
+        assert len(comp.results) > 0
+
+
+class TestPickle:
+
+    @staticmethod
+    def _build_mixed():
+        P = ProcessingMechanism(name='P', size=2)
+        R = RecurrentTransferMechanism(name='R', size=2)
+        L = pnl.LCAMechanism(name='L', size=2)
+        T = TransferMechanism(name='T')
+        D = pnl.DDM(name='D')
+        comp = Composition(name='comp', pathways=[[P, R, L], [T, D]])
+        return comp, lambda c: c.run(inputs={c.nodes['P']: [[1.0, 2.0], [2.0, 1.0]], c.nodes['T']: [[0.5], [1.0]]})
+
+    @staticmethod
+    def _build_learning():
+        A = TransferMechanism(name='A', size=2)
+        B = TransferMechanism(name='B', size=2, function=Logistic)
+        comp = Composition(name='comp')
+        comp.add_backpropagation_learning_pathway([A, B])
+        return comp, lambda c: c.learn(inputs={
+            c.nodes['A']: [[1.0, 0.0], [0.0, 1.0]],
+            c.get_nodes_by_role(NodeRole.TARGET)[0]: [[0.0, 1.0], [1.0, 0.0]]
+        })
+
+    @staticmethod
+    def _build_control():
+        A = TransferMechanism(name='A')
+        B = TransferMechanism(name='B')
+        comp = Composition(name='comp', pathways=[A, B])
+        comp.add_controller(
+            OptimizationControlMechanism(
+                agent_rep=comp,
+                state_features=[A.input_port],
+                objective_mechanism=ObjectiveMechanism(monitor=[B]),
+                control_signals=[ControlSignal(modulates=(SLOPE, B), allocation_samples=[0.5, 1.0, 2.0])]
+            )
+        )
+        return comp, lambda c: c.run(inputs={c.nodes['A']: [[1.0], [2.0]]})
+
+    @staticmethod
+    def _build_nested():
+        A = TransferMechanism(name='A')
+        B = ProcessingMechanism(name='B', function=lambda x: x * 3 + 1)
+        inner = Composition(name='inner', pathways=[A, B])
+        inner.scheduler.add_condition(B, pnl.All(EveryNCalls(A, 1), pnl.Not(AtTrial(5))))
+        C = TransferMechanism(name='C', integrator_mode=True)
+        outer = Composition(name='outer', pathways=[inner, C])
+        outer.scheduler.add_condition(C, EveryNCalls(inner, 1))
+        return outer, lambda c: c.run(inputs={c.nodes['inner']: [[1.0], [2.0]]})
+
+    @pytest.mark.composition
+    @pytest.mark.parametrize('build', ['mixed', 'learning', 'control', 'nested'])
+    def test_pickle(self, build):
+        comp, run = getattr(self, f'_build_{build}')()
+        run(comp)
+        comp_copy = pickle.loads(pickle.dumps(comp))
+
+        assert comp_copy is not comp
+        assert [node.name for node in comp_copy.nodes] == [node.name for node in comp.nodes]
+
+        # both continue from the state in which comp was pickled
+        run(comp)
+        run(comp_copy)
+        assert len(comp_copy.results) == len(comp.results)
+        for result, copy_result in zip(comp.results, comp_copy.results):
+            for value, copy_value in zip(result, copy_result):
+                np.testing.assert_allclose(copy_value, value)
+
+    @pytest.mark.composition
+    def test_pickle_compiled(self, comp_mode):
+        A = TransferMechanism(name='A', size=2)
+        B = TransferMechanism(name='B', size=2, function=Logistic, integrator_mode=True)
+        comp = Composition(name='comp', pathways=[A, B])
+        comp.run(inputs={A: [[1.0, 2.0]]}, execution_mode=comp_mode)
+        comp_copy = pickle.loads(pickle.dumps(comp))
+
+        result = comp.run(inputs={A: [[1.0, 2.0], [2.0, 3.0]]}, execution_mode=comp_mode)
+        copy_result = comp_copy.run(inputs={comp_copy.nodes['A']: [[1.0, 2.0], [2.0, 3.0]]}, execution_mode=comp_mode)
+        np.testing.assert_allclose(copy_result, result)
+        np.testing.assert_allclose(comp_copy.results, comp.results)
+
+
+class TestRunParallel:
+
+    @staticmethod
+    def _build_comp():
+        A = TransferMechanism(name='A', size=2)
+        B = TransferMechanism(name='B', size=2, integrator_mode=True, integration_rate=0.5)
+        comp = Composition(name='comp', pathways=[A, B])
+        B.set_log_conditions(pnl.VALUE)
+        return comp, A, B
+
+    @pytest.mark.composition
+    @pytest.mark.parametrize("n_workers", [None, 2])
+    def test_run_parallel(self, comp_mode, n_workers):
+        inputs_by_context = {f'subject-{i}': [[i, -i], [i + 1, -i - 1], [i + 2, -i - 2]] for i in range(3)}
+
+        serial_comp, serial_A, serial_B = self._build_comp()
+        for execution_id, inputs in inputs_by_context.items():
+            serial_comp.run(inputs={serial_A: inputs}, context=execution_id, execution_mode=comp_mode)
+
+        comp, A, B = self._build_comp()
+        results = comp.run_parallel(
+            {Context(execution_id=k) if k.endswith('0') else k: {A: v} for k, v in inputs_by_context.items()},
+            n_workers=n_workers,
+            execution_mode=comp_mode
+        )
+
+        assert list(results) == list(inputs_by_context)
+        for execution_id in inputs_by_context:
+            np.testing.assert_allclose(results[execution_id], serial_comp.parameters.results.get(execution_id)[-1])
+            np.testing.assert_allclose(comp.parameters.results.get(execution_id),
+                                       serial_comp.parameters.results.get(execution_id))
+            np.testing.assert_allclose(B.parameters.value.get(execution_id),
+                                       serial_B.parameters.value.get(execution_id))
+            assert comp.scheduler.get_clock(execution_id).time == serial_comp.scheduler.get_clock(execution_id).time
+            if comp_mode is pnl.ExecutionMode.Python:
+                log = B.log.nparray_dictionary(contexts=execution_id)[execution_id]
+                serial_log = serial_B.log.nparray_dictionary(contexts=execution_id)[execution_id]
+                np.testing.assert_allclose(log['value'], serial_log['value'])
+
+        # runs continue from the state returned by the workers
+        comp.run(inputs={A: [[1, 1]]}, context='subject-1')
+        serial_comp.run(inputs={serial_A: [[1, 1]]}, context='subject-1')
+        np.testing.assert_allclose(comp.parameters.results.get('subject-1'),
+                                   serial_comp.parameters.results.get('subject-1'))
+
+    @pytest.mark.composition
+    def test_run_parallel_spawn(self):
+        # the Composition is pickled to start the worker
+        inputs_by_context = {f'subject-{i}': [[i, -i], [i + 1, -i - 1]] for i in range(2)}
+
+        serial_comp, A, B = self._build_comp()
+        for execution_id, inputs in inputs_by_context.items():
+            serial_comp.run(inputs={A: inputs}, context=execution_id)
+
+        comp, A, B = self._build_comp()
+        results = comp.run_parallel(
+            {k: {A: v} for k, v in inputs_by_context.items()},
+            n_workers=1,
+            start_method='spawn'
+        )
+
+        for execution_id in inputs_by_context:
+            np.testing.assert_allclose(results[execution_id], serial_comp.parameters.results.get(execution_id)[-1])
+            np.testing.assert_allclose(comp.parameters.results.get(execution_id),
+                                       serial_comp.parameters.results.get(execution_id))
+
+    @pytest.mark.parametrize(
+        'kwargs, error_msg',
+        [
+            ({'context': 'subject-0'}, 'are specified by the keys of its inputs_by_context argument'),
+            ({'n_workers': 0}, 'must be a positive int or None'),
+            ({'start_method': 'not-a-start-method'}, 'start_method for run_parallel'),
+        ]
+    )
+    def test_run_parallel_errors(self, kwargs, error_msg):
+        comp, A, B = self._build_comp()
+        with pytest.raises(CompositionError, match=error_msg):
+            comp.run_parallel({'subject-0': {A: [[1, 1]]}}, **kwargs)
+
+
+class TestClone:
+
+    @staticmethod
+    def _build_comp():
+        A = TransferMechanism(name='A', size=2)
+        B = TransferMechanism(name='B', size=2, integrator_mode=True, integration_rate=0.5)
+        comp = Composition(name='comp', pathways=[A, B])
+        return comp, A, B
+
+    @pytest.mark.composition
+    def test_clone_shares_structure(self, comp_mode):
+        comp, A, B = self._build_comp()
+        comp.run(inputs={A: [[1, 2]]}, execution_mode=comp_mode)
+
+        clone = comp.clone()
+        assert isinstance(clone, pnl.CompositionClone)
+        assert clone.composition is comp
+        assert clone.nodes is comp.nodes
+        assert clone.context.execution_id != comp.most_recent_context.execution_id
+
+        # the clone continues from the state of the Composition, independently of it
+        np.testing.assert_allclose(clone.run(inputs={A: [[1, 2]]}, execution_mode=comp_mode), [[0.75, 1.5]])
+        np.testing.assert_allclose(clone.run(inputs={A: [[1, 2]]}, execution_mode=comp_mode), [[0.875, 1.75]])
+        np.testing.assert_allclose(comp.run(inputs={A: [[1, 2]]}, execution_mode=comp_mode), [[0.75, 1.5]])
+        assert len(clone.results) == 3
+        assert len(comp.results) == 2
+
+        if comp_mode is pnl.ExecutionMode.Python:
+            clone.reset()
+            np.testing.assert_allclose(clone.run(inputs={A: [[1, 2]]}), [[0.5, 1]])
+
+    def test_clone_parameter_values(self):
+        comp, A, B = self._build_comp()
+        clones = [comp.clone(execution_id=f'rate-{rate}') for rate in (0.1, 0.9)]
+        for clone, rate in zip(clones, (0.1, 0.9)):
+            B.parameters.integration_rate.set(rate, clone.context)
+            assert clone.context.execution_id == f'rate-{rate}'
+
+        np.testing.assert_allclose(clones[0].run(inputs={A: [[1, 2]]}), [[0.1, 0.2]])
+        np.testing.assert_allclose(clones[1].run(inputs={A: [[1, 2]]}), [[0.9, 1.8]])
+        np.testing.assert_allclose(comp.run(inputs={A: [[1, 2]]}), [[0.5, 1]])
+
+        # clone of a clone copies its parameter values
+        np.testing.assert_allclose(clones[1].clone().run(inputs={A: [[1, 2]]}), [[0.99, 1.98]])
+
+    def test_clone_without_sharing_structure(self):
+        comp, A, B = self._build_comp()
+        comp.run(inputs={A: [[1, 2]]})
+
+        copied = comp.clone(share_structure=False)
+        assert isinstance(copied, Composition)
+        assert copied is not comp
+        assert copied.nodes['B'] is not B
+
+        np.testing.assert_allclose(copied.run(inputs={copied.nodes['A']: [[1, 2]]}), [[0.75, 1.5]])
+        np.testing.assert_allclose(comp.run(inputs={A: [[1, 2]]}), [[0.75, 1.5]])
+
+    @pytest.mark.parametrize(
+        'call, error_msg',
+        [
+            (lambda comp, clone: clone.run(inputs={comp.nodes['A']: [[1, 2]]}, context='other'),
+             "a 'context' argument cannot be specified for run()"),
+            (lambda comp, clone: clone.clone(share_structure=False), 'can only be cloned with share_structure=True'),
+            (lambda comp, clone: comp.clone(execution_id='subject-0', context='subject-0'),
+             'must be different from that of the context from which it is cloned'),
+        ]
+    )
+    def test_clone_errors(self, call, error_msg):
+        comp, A, B = self._build_comp()
+        clone = comp.clone()
+        with pytest.raises(CompositionError, match=re.escape(error_msg)):
+            call(comp, clone)
+
+    @pytest.mark.benchmark(group="Clone")
+    @pytest.mark.parametrize('share_structure', [True, False])
+    def test_clone_benchmark(self, benchmark, share_structure):
+        comp, A, B = self._build_comp()
+        comp.run(inputs={A: [[1, 2]]})
+
+        clone = benchmark(comp.clone, share_structure=share_structure)
+        inputs = {clone.nodes['A']: [[1, 2]]}
+        np.testing.assert_allclose(clone.run(inputs=inputs), [[0.75, 1.5]])
+
+
 class TestNodeRoles:
 
     def test_INPUT_and_OUTPUT_and_SINGLETON(self):
@@ -7376,6 +8114,65 @@ class TestNodeRoles:
             B: {NodeRole.TERMINAL, NodeRole.OUTPUT, NodeRole.FEEDBACK_SENDER},
         }
 
+    def test_get_nodes_by_role_after_structural_change(self):
+        A = ProcessingMechanism(name='A')
+        B = ProcessingMechanism(name='B')
+        C = ProcessingMechanism(name='C')
+        D = ProcessingMechanism(name='D')
+        comp = Composition(name='comp', pathways=[[C, D], [A, B]])
+        # Nodes are returned in the order in which they were added, whatever the order their roles were assigned
+        assert comp.get_nodes_by_role(NodeRole.INPUT) == [C, A]
+        assert comp.get_nodes_by_role(NodeRole.OUTPUT) == [D, B]
+
+        # the list returned is a copy
+        comp.get_nodes_by_role(NodeRole.INPUT).remove(C)
+        assert comp.get_nodes_by_role(NodeRole.INPUT) == [C, A]
+
+        comp.add_linear_processing_pathway([B, C])
+        assert comp.get_nodes_by_role(NodeRole.INPUT) == [A]
+        assert comp.get_nodes_by_role(NodeRole.INTERNAL) == [C, B]
+        assert comp.get_nodes_by_role(NodeRole.OUTPUT) == [D]
+
+        comp.remove_node(C)
+        assert comp.get_nodes_by_role(NodeRole.INPUT) == [D, A]
+        assert comp.get_nodes_by_role(NodeRole.OUTPUT) == [D, B]
+        for role in NodeRole:
+            assert comp.get_nodes_by_role(role) == [n for n in comp.nodes_to_roles if role in comp.nodes_to_roles[n]]
+
+    def test_nested_nodes_with_same_roles_after_structural_change(self):
+        A = ProcessingMechanism(name='A')
+        B = ProcessingMechanism(name='B')
+        C = ProcessingMechanism(name='C')
+        icomp = Composition(name='icomp', pathways=[[A], [B]])
+        ocomp = Composition(name='ocomp', pathways=[icomp])
+        assert ocomp._get_nested_nodes_with_same_roles_at_all_levels(ocomp, NodeRole.INPUT) == [A, B]
+        assert ocomp._get_nested_nodes_with_same_roles_at_all_levels(ocomp, NodeRole.OUTPUT) == [A, B]
+        assert icomp._get_nested_nodes_with_same_roles_at_all_levels(icomp, NodeRole.INPUT, NodeRole.OUTPUT) is None
+
+        # change to the roles of the nested Composition
+        icomp.add_linear_processing_pathway([A, C])
+        assert ocomp._get_nested_nodes_with_same_roles_at_all_levels(ocomp, NodeRole.INPUT) == [A, B]
+        assert ocomp._get_nested_nodes_with_same_roles_at_all_levels(ocomp, NodeRole.OUTPUT) == [B, C]
+        assert icomp._get_nested_nodes_with_same_roles_at_all_levels(icomp, NodeRole.INPUT, NodeRole.OUTPUT) == [A]
+
+        icomp.remove_node(B)
+        assert ocomp._get_nested_nodes_with_same_roles_at_all_levels(ocomp, NodeRole.INPUT) == [A]
+        assert ocomp._get_nested_nodes_with_same_roles_at_all_levels(ocomp, NodeRole.OUTPUT) == [C]
+
+    @pytest.mark.composition
+    @pytest.mark.benchmark(group="Node roles")
+    def test_get_nodes_by_role(self, benchmark):
+        nodes = [ProcessingMechanism(name=f'{i}') for i in range(200)]
+        comp = Composition(name='comp', pathways=[nodes[i:i + 2] for i in range(0, len(nodes), 2)])
+
+        def get_nodes_by_roles():
+            return [comp.get_nodes_by_role(role) for role in [NodeRole.INPUT, NodeRole.INTERNAL, NodeRole.OUTPUT]]
+
+        input_nodes, internal_nodes, output_nodes = benchmark(get_nodes_by_roles)
+        assert input_nodes == nodes[::2]
+        assert internal_nodes == []
+        assert output_nodes == nodes[1::2]
+
 
 class TestMisc:
 
@@ -105,6 +105,39 @@ class TestTargetSpecs:
                             [[1.41003122, 1.54413183]], [[3.64504691, 4.13165454]], [[8.1607109 , 9.54419477]],
                             [[1.40021212, 1.56636511]], [[3.61629564, 4.17586792]], [[8.11241026, 9.57222535]]])
 
+    def test_dataset_inputs_and_targets(self, tmp_path):
+        class Dataset:
+            def __init__(self, data):
+                self.data = data
+                self.retrieved = []
+
+            def __len__(self):
+                return len(self.data)
+
+            def __getitem__(self, index):
+                self.retrieved.append(index)
+                return self.data[index]
+
+        def learn(inputs, targets):
+            A = TransferMechanism(name="learning-process-mech-A")
+            B = TransferMechanism(name="learning-process-mech-B")
+            C = TransferMechanism(name="learning-process-mech-C",
+                                  default_variable=[[0.0, 0.0]])
+            comp = Composition()
+            p = comp.add_backpropagation_learning_pathway(pathway=[A,B,C])
+            comp.learn(inputs={A: inputs, p.target: targets}, epochs=2)
+            return comp.results
+
+        A_inputs = [[[1.0]], [[2.0]], [[3.0]]]
+        B_targets = [[[3.0, 4.0]], [[5.0, 6.0]], [[7.0, 8.0]]]
+        expected = learn(A_inputs, B_targets)
+
+        np.save(tmp_path / 'inputs.npy', np.array(A_inputs, dtype=np.float32))
+        targets = Dataset(B_targets)
+        results = learn(np.load(tmp_path / 'inputs.npy', mmap_mode='r'), targets)
+        assert targets.retrieved == [0, 1, 2, 0, 1, 2]
+        assert np.allclose(results, expected)
+
     # DS: The following test fails the assert. The same value is returned whether a dict or function is used as input,
     # which is not the same as the expected values. Are the expected values incorrect? If not, there is a problem
     # at a deeper level than just the input handling. 5/18/2020
@@ -1,3 +1,5 @@
+import os
+
 import numpy as np
 import psyneulink as pnl
 import pytest
@@ -991,6 +993,192 @@ class TestLog:
         t.log.nparray_dictionary()
 
 
+class TestLogOverhead:
+
+    @pytest.mark.benchmark(group="Log entry")
+    @pytest.mark.parametrize('log_condition', [pnl.LogCondition.OFF, pnl.LogCondition.EXECUTION])
+    def test_log_value_per_entry(self, benchmark, log_condition):
+        T = pnl.TransferMechanism(size=2)
+        comp = pnl.Composition(pathways=[T])
+        comp.run(inputs={T: [[1.0, 2.0]]})
+
+        T.parameters.value.log_condition = log_condition
+        context = pnl.Context(
+            composition=comp,
+            execution_id=comp.default_execution_id,
+            execution_phase=pnl.ContextFlags.PROCESSING,
+            source=pnl.ContextFlags.COMPOSITION,
+        )
+        value = np.array([[1.0, 2.0]])
+
+        def log_entries(n):
+            for _ in range(n):
+                T.parameters.value._log_value(value, context)
+
+        benchmark(log_entries, 100)
+
+        if log_condition is pnl.LogCondition.EXECUTION:
+            entries = T.log.logged_items
+            assert len(T.parameters.value.log[comp.default_execution_id]) >= 100
+            assert 'value' in entries
+            # all entries in the same time step share a time stamp
+            logged = list(T.parameters.value.log[comp.default_execution_id])
+            assert all(entry.time is logged[-1].time for entry in logged[-100:])
+        else:
+            assert comp.default_execution_id not in T.parameters.value.log
+
+    @pytest.mark.benchmark(group="Log run")
+    def test_log_many_items_per_time_step(self, benchmark):
+        mechs = [pnl.TransferMechanism(size=2, name=f'T{i}') for i in range(10)]
+        comp = pnl.Composition(pathways=[mechs])
+        for m in mechs:
+            m.set_log_conditions([pnl.VALUE, 'variable', 'func_value', 'func_variable', 'InputPort-0', 'RESULT'])
+
+        benchmark(comp.run, inputs={mechs[0]: [[1.0, 2.0]] * 5})
+
+        log_dict = mechs[-1].log.nparray_dictionary()[comp.default_execution_id]
+        assert log_dict['Time_step'][:5] == [[9]] * 5
+
+
+class TestColumnarLog:
+
+    @pytest.fixture
+    def columnar_backend(self):
+        pnl.set_log_backend(pnl.LogBackend.COLUMNAR)
+        yield
+        pnl.set_log_backend(pnl.LogBackend.DEQUE)
+
+    def _run_logged_comp(self):
+        T1 = pnl.TransferMechanism(name='log_test_T1', size=2)
+        T2 = pnl.TransferMechanism(name='log_test_T2', size=2)
+        COMP = pnl.Composition(name='COMP', pathways=[T1, T2])
+        T1.set_log_conditions([pnl.VALUE, 'mod_slope', pnl.RESULT])
+        T2.set_log_conditions([pnl.VALUE, 'mod_slope', pnl.RESULT])
+        COMP.run(inputs={T1: [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]})
+        COMP.run(inputs={T1: [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]})
+        return COMP, T1, T2
+
+    def test_matches_deque_backend(self, columnar_backend):
+        columnar_comp, *columnar_mechs = self._run_logged_comp()
+        pnl.set_log_backend(pnl.LogBackend.DEQUE)
+        deque_comp, *deque_mechs = self._run_logged_comp()
+
+        for columnar_mech, deque_mech in zip(columnar_mechs, deque_mechs):
+            assert isinstance(
+                columnar_mech.parameters.value.log[columnar_comp.default_execution_id],
+                pnl.ColumnarLogEntries
+            )
+
+            columnar_dict = columnar_mech.log.nparray_dictionary(entries=['value', 'mod_slope', 'RESULT'])
+            deque_dict = deque_mech.log.nparray_dictionary(entries=['value', 'mod_slope', 'RESULT'])
+            columnar_dict = columnar_dict[columnar_comp.default_execution_id]
+            deque_dict = deque_dict[deque_comp.default_execution_id]
+
+            assert list(columnar_dict.keys()) == list(deque_dict.keys())
+            for key in deque_dict:
+                np.testing.assert_array_equal(columnar_dict[key], deque_dict[key])
+
+            columnar_csv = columnar_mech.log.csv().replace(f"'{columnar_comp.name}'", f"'{deque_comp.name}'")
+            assert columnar_csv == deque_mech.log.csv()
+
+    def test_nparray_dictionary_returns_views(self, columnar_backend):
+        comp, T1, _ = self._run_logged_comp()
+
+        log = T1.parameters.value.log[comp.default_execution_id]
+        log_dict = T1.log.nparray_dictionary(entries=['value', 'RESULT'])[comp.default_execution_id]
+
+        assert np.shares_memory(log_dict['value'], log.values)
+        assert np.shares_memory(log_dict['Trial'], log.times)
+        assert log_dict['value'].shape == (6, 1, 2)
+        np.testing.assert_array_equal(log_dict['Run'].ravel(), [0, 0, 0, 1, 1, 1])
+
+    def test_entries_growth_and_object_fallback(self):
+        entries = pnl.ColumnarLogEntries()
+        for i in range(40):
+            entries.append(pnl.LogEntry((0, i, 0, 0), 'EXECUTING', np.array([i, i])))
+
+        assert len(entries) == 40
+        assert entries.is_dense
+        assert entries.has_times
+        assert entries[-1].time == (0, 39, 0, 0)
+        np.testing.assert_array_equal(entries.values[:, 0], np.arange(40))
+
+        entries.append(pnl.LogEntry((None, None, None, None), 'COMMAND_LINE', np.array([1.0, 2.0, 3.0])))
+
+        assert len(entries) == 41
+        assert not entries.is_dense
+        assert not entries.has_times
+        assert entries[-1].time == (None, None, None, None)
+        np.testing.assert_array_equal(entries[-1].value, [1.0, 2.0, 3.0])
+        np.testing.assert_array_equal(entries[5].value, [5, 5])
+
+        entries.clear()
+        assert len(entries) == 0
+        assert list(entries) == []
+
+    def test_invalid_backend(self):
+        with pytest.raises(pnl.LogError, match='is not a valid LogBackend'):
+            pnl.set_log_backend('not_a_backend')
+
+    def test_spill_to_disk(self, tmp_path):
+        def run_logged_comp():
+            T = pnl.TransferMechanism(name='spilled_T', size=2, integrator_mode=True)
+            comp = pnl.Composition(pathways=[T])
+            T.set_log_conditions([pnl.VALUE, pnl.RESULT])
+            comp.run(inputs={T: [[1.0, 2.0]] * 10})
+            return comp, T
+
+        deque_comp, deque_T = run_logged_comp()
+        pnl.set_log_backend(pnl.LogBackend.COLUMNAR, spill_directory=tmp_path, chunk_size=4)
+        try:
+            comp, T = run_logged_comp()
+        finally:
+            pnl.set_log_backend(pnl.LogBackend.DEQUE)
+
+        log = T.parameters.value.log[comp.default_execution_id]
+        assert len(log) == 10
+        assert log._length == 2
+        assert sorted(os.listdir(log.spilled_path)) == sorted(
+            f'{i}_{field}.npy' for i in range(2) for field in ['times', 'contexts', 'values']
+        )
+        np.testing.assert_array_equal(log[5].value, deque_T.parameters.value.log[deque_comp.default_execution_id][5].value)
+
+        log_dict = T.log.nparray_dictionary()[comp.default_execution_id]
+        deque_log_dict = deque_T.log.nparray_dictionary()[deque_comp.default_execution_id]
+        assert list(log_dict.keys()) == list(deque_log_dict.keys())
+        for key in deque_log_dict:
+            np.testing.assert_array_equal(log_dict[key], deque_log_dict[key])
+
+        assert (
+            T.log.csv().replace(f"'{comp.name}'", f"'{deque_comp.name}'")
+            == deque_T.log.csv()
+        )
+
+        spilled_path = log.spilled_path
+        del log
+        T.log.clear_entries()
+        assert not os.path.exists(spilled_path)
+
+    def test_spill_requires_columnar_backend(self, tmp_path):
+        with pytest.raises(pnl.LogError, match='can only be used with'):
+            pnl.set_log_backend(pnl.LogBackend.DEQUE, spill_directory=tmp_path)
+
+    @pytest.mark.benchmark(group="Log export")
+    @pytest.mark.parametrize('backend', [pnl.LogBackend.DEQUE, pnl.LogBackend.COLUMNAR])
+    def test_nparray_dictionary(self, benchmark, backend):
+        pnl.set_log_backend(backend)
+        try:
+            T = pnl.TransferMechanism(size=2, integrator_mode=True)
+            comp = pnl.Composition(pathways=[T])
+            T.set_log_conditions([pnl.VALUE, pnl.RESULT])
+            comp.run(inputs={T: [[1.0, 2.0]] * 200})
+        finally:
+            pnl.set_log_backend(pnl.LogBackend.DEQUE)
+
+        log_dict = benchmark(T.log.nparray_dictionary, entries=['value', 'RESULT'])
+        assert len(log_dict[comp.default_execution_id]['value']) == 200
+
+
 class TestClearLog:
 
     def test_clear_log(self):
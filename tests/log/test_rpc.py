@@ -654,3 +654,161 @@ class TestFullModels:
             expected_log_val[1][0][4],
             log_val
         )
+
+
+class TestBatchedDelivery:
+
+    def _run_delivered_comp(self, pipeline, num_trials=3):
+        T_1 = pnl.TransferMechanism(name='log_test_T_1', size=2)
+        T_2 = pnl.TransferMechanism(name='log_test_T_2', size=2, function=pnl.Linear(slope=2))
+        comp = pnl.Composition(name='log_test_comp', pathways=[T_1, T_2])
+        T_1.set_delivery_conditions(pnl.RESULT)
+        T_2.set_delivery_conditions(pnl.RESULT)
+
+        context = pnl.Context(rpc_pipeline=pipeline, execution_id=comp)
+        comp.run(inputs={T_1: [[i, i + 1] for i in range(num_trials)]}, context=context)
+        return comp
+
+    def _get_batches(self, pipeline):
+        batches = []
+        while not pipeline.empty():
+            batches.append(pipeline.get())
+        return batches
+
+    def test_batch_by_time_step(self):
+        pipeline = pnl.BatchedDeliveryPipeline()
+        comp = self._run_delivered_comp(pipeline)
+
+        batches = self._get_batches(pipeline)
+        assert len(batches) == 6
+        assert pipeline.delivered == 6
+        assert pipeline.dropped == 0
+
+        entries = [entry for batch in batches for entry in pnl.decode_entry_batch(batch)]
+        assert [(e[0], e[1], e[2]) for e in entries] == [
+            (name, 'RESULT', f'0:{trial}:0:{time_step}')
+            for trial in range(3)
+            for time_step, name in enumerate(['log_test_T_1', 'log_test_T_2'])
+        ]
+        assert all(e[3] == comp.default_execution_id for e in entries)
+        for trial in range(3):
+            np.testing.assert_array_equal(entries[2 * trial][4], [trial, trial + 1])
+            np.testing.assert_array_equal(entries[2 * trial + 1][4], [2 * trial, 2 * trial + 2])
+
+    def test_batch_by_trial(self):
+        pipeline = pnl.BatchedDeliveryPipeline(batch_by=pnl.TimeScale.TRIAL)
+        self._run_delivered_comp(pipeline)
+
+        batches = self._get_batches(pipeline)
+        assert [len(batch.values) for batch in batches] == [2, 2, 2]
+        assert [v.offset for v in batches[0].values] == [0, 16]
+        assert len(batches[0].data) == 32
+        np.testing.assert_array_equal(
+            np.frombuffer(batches[2].data, dtype='<f8'),
+            [2, 3, 4, 6]
+        )
+
+    @pytest.mark.parametrize('policy, timeout', [(pnl.DROP, None), (pnl.BLOCK, 0.01)])
+    def test_full_queue(self, policy, timeout):
+        pipeline = pnl.BatchedDeliveryPipeline(maxsize=2, policy=policy, timeout=timeout)
+        self._run_delivered_comp(pipeline)
+
+        assert pipeline.qsize() == 2
+        assert pipeline.delivered == 2
+        assert pipeline.dropped == 4
+
+    def test_invalid_policy(self):
+        with pytest.raises(pnl.DeliveryError, match='policy'):
+            pnl.BatchedDeliveryPipeline(policy='wait')
+
+    @pytest.mark.benchmark(group="RPC delivery")
+    @pytest.mark.parametrize('pipeline_type', [Queue, pnl.BatchedDeliveryPipeline])
+    def test_delivery(self, benchmark, pipeline_type):
+        T = pnl.TransferMechanism(size=100)
+        comp = pnl.Composition(pathways=[T])
+        T.set_delivery_conditions([pnl.VALUE, pnl.RESULT])
+
+        def run():
+            pipeline = pipeline_type()
+            comp.run(inputs={T: [np.arange(100)] * 20}, context=pnl.Context(rpc_pipeline=pipeline, execution_id=comp))
+            return pipeline
+
+        pipeline = benchmark(run)
+        assert not pipeline.empty()
+
+
+class TestServeGraph:
+
+    script = """
+import psyneulink as pnl
+
+A = pnl.TransferMechanism(name='A', size=2)
+B = pnl.TransferMechanism(name='B', size=2, function=pnl.Linear(slope=2))
+comp = pnl.Composition(name='served_comp', pathways=[A, B])
+"""
+
+    @pytest.fixture
+    def stub(self, tmp_path):
+        grpc = pytest.importorskip('grpc')
+        from psyneulink.core.rpc.graph_pb2_grpc import ServeGraphStub
+        from psyneulink.core.rpc.server import serve
+
+        script_path = tmp_path / 'served_script.py'
+        script_path.write_text(self.script)
+
+        server = serve('localhost:0', max_workers=4)
+        channel = grpc.insecure_channel(f'localhost:{server.port}')
+        stub = ServeGraphStub(channel)
+        stub.script_path = str(script_path)
+        yield stub
+        channel.close()
+        server.stop(None)
+        server.servicer.shutdown()
+
+    def _run_request(self, data):
+        from psyneulink.core.rpc import graph_pb2
+
+        return graph_pb2.RunTimeParams(
+            inputs={'A': graph_pb2.Matrix(rows=len(data), cols=2, data=np.ravel(data))},
+            servePrefs=graph_pb2.ServePrefs(servePrefSet=[
+                graph_pb2.ServePref(componentName='B', parameterName='RESULT', condition=graph_pb2.EXECUTION)
+            ])
+        )
+
+    def test_load_script(self, stub):
+        from psyneulink.core.rpc import graph_pb2
+
+        assert stub.HealthCheck(graph_pb2.NullArgument()).status == 'Okay'
+        loaded = stub.LoadScript(graph_pb2.ScriptPath(path=stub.script_path))
+        assert list(loaded.compositions) == ['served_comp']
+        assert list(stub.GetCompositions(graph_pb2.NullArgument()).compositions) == ['served_comp']
+        assert list(stub.GetComponents(graph_pb2.GraphName(name='served_comp')).components) == ['A', 'B']
+        assert 'RESULT' in stub.GetLoggableParameters(graph_pb2.ComponentName(name='B')).parameters
+
+    def test_unknown_composition(self, stub):
+        import grpc
+        from psyneulink.core.rpc import graph_pb2
+
+        stub.LoadScript(graph_pb2.ScriptPath(path=stub.script_path))
+        with pytest.raises(grpc.RpcError) as error:
+            stub.GetComponents(graph_pb2.GraphName(name='not_a_comp'))
+        assert error.value.code() == grpc.StatusCode.NOT_FOUND
+
+    def test_concurrent_run_composition(self, stub):
+        from concurrent.futures import ThreadPoolExecutor
+        from psyneulink.core.rpc import graph_pb2
+
+        stub.LoadScript(graph_pb2.ScriptPath(path=stub.script_path))
+        inputs = [[[i, i + 1]] * 3 for i in range(4)]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            streams = list(pool.map(lambda data: list(stub.RunComposition(self._run_request(data))), inputs))
+
+        for data, entries in zip(inputs, streams):
+            assert [e.time for e in entries] == ['0:0:0:1', '0:1:0:1', '0:2:0:1']
+            assert all((e.componentName, e.parameterName) == ('B', 'RESULT') for e in entries)
+            assert all(list(e.value.data) == [2 * x for x in data[0]] for e in entries)
+            # each request is executed in its own context
+            assert len({e.context for e in entries}) == 1
+
+        assert len({stream[0].context for stream in streams}) == len(inputs)
@@ -0,0 +1,45 @@
+import subprocess
+import sys
+
+import pytest
+
+# optional dependencies that are only imported once the features that use them are used
+DEFERRED_MODULES = ['fastkde', 'grpc', 'leabra', 'torch']
+
+# maximum cumulative time (in seconds) to import psyneulink, as reported by python -X importtime
+IMPORT_TIME_BUDGET = 10
+
+
+def _import_psyneulink():
+    """Import psyneulink in a new interpreter, and return the modules it imported and the time it took (in seconds)"""
+    result = subprocess.run(
+        (sys.executable, '-X', 'importtime', '-c', 'import psyneulink, sys; print(" ".join(sys.modules))'),
+        capture_output=True, text=True, check=True
+    )
+    modules = set(result.stdout.split())
+
+    # lines of importtime output are "import time: self [us] | cumulative | imported package"
+    import_time = None
+    for line in result.stderr.splitlines():
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2].strip() == 'psyneulink':
+            import_time = int(fields[1]) / 1e6
+
+    return modules, import_time
+
+
+@pytest.fixture(scope='module')
+def psyneulink_import():
+    return _import_psyneulink()
+
+
+@pytest.mark.parametrize('module', DEFERRED_MODULES)
+def test_optional_dependency_not_imported(psyneulink_import, module):
+    modules, _ = psyneulink_import
+    assert module not in modules
+
+
+def test_import_time(psyneulink_import):
+    _, import_time = psyneulink_import
+    assert import_time is not None
+    assert import_time < IMPORT_TIME_BUDGET
@@ -1,5 +1,6 @@
 import copy
 import numpy as np
+import pickle
 import psyneulink as pnl
 import pytest
 import re
@@ -258,6 +259,19 @@ def test_copy():
     assert g.parameters.additive_param.source is g.parameters.intercept
 
 
+def test_pickle():
+    f = pnl.Linear(slope=2)
+    f.parameters.slope.set(3, 'some context')
+    g = pickle.loads(pickle.dumps(f))
+
+    assert isinstance(g.parameters.additive_param, pnl.ParameterAlias)
+    assert g.parameters.additive_param.source is g.parameters.intercept
+    assert g.parameters.slope._owner is g.parameters
+    assert g.parameters._parent is pnl.Linear.parameters
+    assert g.parameters.slope.get() == 2
+    assert g.parameters.slope.get('some context') == 3
+
+
 @pytest.mark.parametrize(
     'cls_, kwargs, parameter, is_user_specified',
     [
@@ -1,8 +1,15 @@
 from collections.abc import Iterable
+import os
+import subprocess
+import sys
+
 import numpy as np
 import pytest
 
-from psyneulink.core.globals.utilities import convert_all_elements_to_np_array, prune_unused_args
+import psyneulink as pnl
+from psyneulink.core.globals.utilities import \
+    convert_all_elements_to_np_array, prune_unused_args, ContentAddressableList, PrefetchIterator, UtilitiesError, \
+    runtime_checks_enabled, set_runtime_checks
 
 
 @pytest.mark.parametrize(
@@ -67,3 +74,190 @@ def test_prune_unused_args(func, args, kwargs, expected_pruned_args, expected_pr
 
     assert pruned_args == expected_pruned_args
     assert pruned_kwargs == expected_pruned_kwargs
+
+
+@pytest.mark.parametrize('prefetch', [1, 3, 20])
+def test_prefetch_iterator(prefetch):
+    assert list(PrefetchIterator(range(10), prefetch, transform=lambda x: x * 2)) == list(range(0, 20, 2))
+
+
+def test_prefetch_iterator_error():
+    def items():
+        yield 0
+        yield 1
+        raise ValueError('bad item')
+
+    it = PrefetchIterator(items(), 2)
+    assert next(it) == 0
+    assert next(it) == 1
+    with pytest.raises(ValueError, match='bad item'):
+        next(it)
+    with pytest.raises(StopIteration):
+        next(it)
+
+
+def test_prefetch_iterator_close():
+    retrieved = []
+
+    def items():
+        for i in range(100):
+            retrieved.append(i)
+            yield i
+
+    with PrefetchIterator(items(), 2) as it:
+        assert next(it) == 0
+    it._thread.join()
+    assert list(it) == []
+    # at most the items in the queue and one waiting to be put in it
+    assert len(retrieved) <= 4
+
+
+@pytest.mark.parametrize('prefetch', [0, -1, 1.5, True])
+def test_prefetch_iterator_invalid(prefetch):
+    with pytest.raises(UtilitiesError, match='must be a positive int'):
+        PrefetchIterator(range(3), prefetch)
+
+
+class _Item:
+    name = None
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return f'_Item({self.name!r})'
+
+
+def _item_list(names):
+    return ContentAddressableList(_Item, list=[_Item(name) for name in names])
+
+
+def test_content_addressable_list_lookup_by_name():
+    items = _item_list(['A', 'B', 'C'])
+    A, B, C = items
+    assert items['B'] is B
+    assert 'C' in items
+    assert 'D' not in items
+    with pytest.raises(TypeError, match="'D' is not a key"):
+        items['D']
+
+    # rename
+    B.name = 'D'
+    assert items['D'] is B
+    assert 'B' not in items
+
+    # insert, append and delete
+    E = _Item('E')
+    items.insert(0, E)
+    assert items['A'] is A
+    assert items['E'] is E
+    F = _Item('F')
+    items.append(F)
+    assert items['F'] is F
+    del items['A']
+    assert items['D'] is B
+    assert 'A' not in items
+    del items[0]
+    assert items.names == ['D', 'C', 'F']
+    assert items['C'] is C
+
+    # assignment by index and by name
+    G = _Item('G')
+    items[0] = G
+    assert items['G'] is G
+    assert 'D' not in items
+    G_replacement = _Item('G')
+    items['G'] = G_replacement
+    assert items['G'] is G_replacement
+    assert items.names == ['G', 'C', 'F']
+
+    # reordering
+    items.reverse()
+    assert items.index(items['G']) == 2
+    assert items.pop(0) is F
+    assert 'F' not in items
+    assert items['C'] is C
+
+
+def test_content_addressable_list_lookup_first_of_duplicate_names():
+    items = _item_list(['A', 'B'])
+    A, B = items
+    B.name = 'C'
+    duplicate = _Item('C')
+    items.append(duplicate)
+    assert items['C'] is B
+    items[1] = _Item('D')
+    assert items['C'] is duplicate
+    items.insert(0, B)
+    assert items['C'] is B
+
+
+@pytest.mark.benchmark(group="ContentAddressableList")
+def test_content_addressable_list_lookup_benchmark(benchmark):
+    items = _item_list([f'M{i}' for i in range(500)])
+
+    def lookup():
+        return [items[f'M{i}'] for i in range(0, 500, 50)]
+
+    assert benchmark(lookup) == items[0:500:50]
+
+
+@pytest.fixture
+def runtime_checks_disabled():
+    set_runtime_checks(False)
+    try:
+        yield
+    finally:
+        set_runtime_checks(True)
+
+
+def test_runtime_checks_enabled_by_default():
+    assert runtime_checks_enabled()
+
+
+def test_set_runtime_checks(runtime_checks_disabled):
+    assert not runtime_checks_enabled()
+
+    # with runtime checks disabled, an invalid Parameter value is not detected
+    T = pnl.TransferMechanism(integrator_mode=3)
+    assert T.integrator_mode == 3
+
+    set_runtime_checks(True)
+    with pytest.raises(pnl.ParameterError, match='may only be True or False'):
+        pnl.TransferMechanism(integrator_mode=3)
+
+
+@pytest.mark.parametrize('env_value, decorated', [(None, True), ('1', True), ('0', False), ('off', False)])
+def test_runtime_checks_environment_variable(env_value, decorated):
+    env = dict(os.environ)
+    env.pop('PNL_RUNTIME_CHECKS', None)
+    if env_value is not None:
+        env['PNL_RUNTIME_CHECKS'] = env_value
+
+    result = subprocess.run(
+        (
+            sys.executable, '-c',
+            'from psyneulink.core.globals.utilities import runtime_checks_enabled; '
+            'from psyneulink.core.components.projections.projection import _is_projection_spec; '
+            'print(runtime_checks_enabled(), hasattr(_is_projection_spec, "__wrapped__"))'
+        ),
+        capture_output=True, text=True, check=True, env=env
+    )
+    assert result.stdout.split() == [str(decorated), str(decorated)]
+
+
+@pytest.mark.benchmark(group="Runtime checks")
+@pytest.mark.parametrize('checks', [True, False], ids=['enabled', 'disabled'])
+def test_runtime_checks_benchmark(benchmark, checks):
+    def build_and_run():
+        A = pnl.TransferMechanism(size=3)
+        B = pnl.TransferMechanism(size=3, function=pnl.Logistic)
+        comp = pnl.Composition(pathways=[A, B])
+        return comp.run(inputs={A: [[1, 2, 3]] * 5})
+
+    set_runtime_checks(checks)
+    try:
+        result = benchmark(build_and_run)
+    finally:
+        set_runtime_checks(True)
+    np.testing.assert_allclose(result, [[0.73105858, 0.88079708, 0.95257413]])
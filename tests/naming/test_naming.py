@@ -1,3 +1,6 @@
+import gc
+import weakref
+
 import pytest
 
 import psyneulink as pnl
@@ -224,3 +227,68 @@ class TestNaming:
         assert C1.name == 'Composition-0'
         assert C2.name == 'Composition-1'
         assert C3.name == 'Composition-2'
+
+
+class TestWeakRegistries:
+
+    @pytest.fixture
+    def weak_registries(self):
+        pnl.set_weak_registries(True)
+        yield
+        pnl.set_weak_registries(False)
+
+    @pytest.mark.parametrize(
+        'name, expected_list',
+        [
+            (None, ['TransferMechanism-0', 'TransferMechanism-1', 'TransferMechanism-2']),
+            ('A-1', ['A-1', 'A-1-1', 'A-1-2']),
+            ('A', ['A', 'A-1', 'A-2']),
+        ]
+    )
+    def test_names_of_collected_components(self, weak_registries, name, expected_list):
+        for expected_name in expected_list:
+            t = pnl.TransferMechanism(name=name)
+            assert t.name == expected_name
+            t_ref = weakref.ref(t)
+            del t
+            gc.collect()
+            assert t_ref() is None
+            assert expected_name not in pnl.MechanismRegistry['TransferMechanism'].instanceDict
+
+    @pytest.mark.composition
+    def test_discarded_composition_is_collected(self, weak_registries, comp_mode):
+        def build_and_run():
+            A = pnl.TransferMechanism(name='A')
+            B = pnl.TransferMechanism(name='B')
+            comp = pnl.Composition(name='comp', pathways=[A, B])
+            comp.run(inputs={A: [[1]]}, execution_mode=comp_mode)
+            return comp
+
+        comp = build_and_run()
+        refs = [weakref.ref(c) for c in [comp, *comp.nodes, *comp.projections]]
+        del comp
+        gc.collect()
+        assert all(r() is None for r in refs)
+
+        comp = build_and_run()
+        assert comp.name == 'comp-1'
+        assert [node.name for node in comp.nodes] == ['A-1', 'B-1']
+
+    def test_set_weak_registries(self):
+        t_ref = weakref.ref(pnl.TransferMechanism(name='T'))
+        gc.collect()
+        assert t_ref() is not None
+
+        try:
+            pnl.set_weak_registries(True)
+            assert isinstance(pnl.MechanismRegistry['TransferMechanism'].instanceDict, weakref.WeakValueDictionary)
+            gc.collect()
+            assert t_ref() is None
+            assert pnl.TransferMechanism(name='T').name == 'T-1'
+        finally:
+            pnl.set_weak_registries(False)
+
+        assert type(pnl.MechanismRegistry['TransferMechanism'].instanceDict) is dict
+        t_ref = weakref.ref(pnl.TransferMechanism(name='T'))
+        gc.collect()
+        assert t_ref() is not None
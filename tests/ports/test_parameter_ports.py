@@ -92,6 +92,45 @@ class TestParameterPorts:
         assert '"ParameterPorts are not allowed to have \'efferents\' ' \
                '(assignment attempted for TransferMechanism-0[slope])."' in str(error.value)
 
+    def test_unmodulated_update_skipped(self):
+        A = TransferMechanism()
+        comp = pnl.Composition(pathways=[A])
+        slope_port = A.parameter_ports['slope']
+
+        comp.run(inputs={A: [1.0]})
+        port_value = slope_port.parameters.value.get(comp)
+        comp.run(inputs={A: [1.0]})
+        assert slope_port.parameters.value.get(comp) is port_value
+
+        A.function.parameters.slope.set(2.0, comp)
+        comp.run(inputs={A: [1.0]})
+        assert slope_port.parameters.value.get(comp) == 2.0
+        assert comp.results[-1] == [[2.0]]
+
+    def test_unmodulated_update_after_set_in_place(self):
+        A = TransferMechanism(function=Linear(slope=[1.0, 1.0]), default_variable=[0, 0])
+        comp = pnl.Composition(pathways=[A])
+
+        comp.run(inputs={A: [1.0, 1.0]})
+        slope = A.function.parameters.slope.get(comp)
+        slope[0] = 3.0
+        A.function.parameters.slope.set(slope, comp)
+        comp.run(inputs={A: [1.0, 1.0]})
+        np.testing.assert_array_equal(comp.results[-1], [[3.0, 1.0]])
+
+    def test_modulated_update_not_skipped(self):
+        A = TransferMechanism()
+        B = TransferMechanism()
+        C = pnl.ControlMechanism(monitor_for_control=B, control_signals=[(pnl.SLOPE, A)])
+        comp = pnl.Composition()
+        comp.add_nodes([A, B, C])
+
+        comp.run(inputs={B: [2.0]})
+        assert A.parameter_ports['slope'].parameters.value.get(comp) == 2.0
+        comp.run(inputs={B: [3.0]})
+        assert A.parameter_ports['slope'].parameters.value.get(comp) == 3.0
+
+
 class TestConfigurableParameters:
     def test_configurable_params(self):
         old_value = 0.2